@@ -0,0 +1,101 @@
+"""
+assessment_data and profile JSON stored as plain text versus packed with
+src.utils.blob_codec once above the compression threshold.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_blob_compression
+"""
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from src.utils.blob_codec import pack_json_text, unpack_json_text
+
+SCHEMA = """
+CREATE TABLE assessment (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    phase_id VARCHAR(50) NOT NULL,
+    assessment_data TEXT
+);
+CREATE INDEX ix_assessment_user ON assessment (user_id);
+CREATE TABLE entrepreneur_profile (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL UNIQUE,
+    market_analysis TEXT,
+    financial_projections TEXT,
+    business_model TEXT
+);
+"""
+
+PHASES = ["self_discovery", "idea_discovery", "market_research", "business_pillars", "product_concept"]
+WORDS = (
+    "customer market value risk revenue growth team product pricing channel segment "
+    "problem solution launch cost margin partner feedback prototype competitor"
+).split()
+
+
+def phase_state(rng, questions):
+    """A client's saved phase state: answers, notes and UI bookkeeping"""
+    return {
+        "currentSection": rng.randint(0, 9),
+        "answers": {
+            f"question_{index}": " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 40)))
+            for index in range(questions)
+        },
+        "scores": {f"section_{index}": round(rng.random() * 10, 2) for index in range(10)},
+        "visited": [f"section_{index}" for index in range(rng.randint(1, 10))],
+    }
+
+
+def build(path, users, questions, pack):
+    rng = random.Random(0)
+    encode = pack_json_text if pack else (lambda text: text)
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    for user in range(1, users + 1):
+        connection.executemany(
+            "INSERT INTO assessment (user_id, phase_id, assessment_data) VALUES (?, ?, ?)",
+            [(user, phase, encode(json.dumps(phase_state(rng, questions)))) for phase in PHASES],
+        )
+        connection.execute(
+            "INSERT INTO entrepreneur_profile (user_id, market_analysis, financial_projections, business_model) "
+            "VALUES (?, ?, ?, ?)",
+            (user, *[encode(json.dumps(phase_state(rng, questions // 4))) for _ in range(3)]),
+        )
+    connection.commit()
+    connection.execute("VACUUM")
+    connection.close()
+
+
+def load_users(path, users):
+    # Everything the dashboard reads for a user, decoded like the model getters
+    connection = sqlite3.connect(path)
+    start = time.perf_counter()
+    for user in range(1, users + 1):
+        for (data,) in connection.execute("SELECT assessment_data FROM assessment WHERE user_id = ?", (user,)):
+            json.loads(unpack_json_text(data))
+    elapsed = time.perf_counter() - start
+    pages = connection.execute("PRAGMA page_count").fetchone()[0]
+    connection.close()
+    return elapsed / users, pages
+
+
+def main(users=1000, questions=120):
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for label, pack in (("plain text", False), ("compressed", True)):
+            path = os.path.join(directory, f"{label.replace(' ', '_')}.db")
+            build(path, users, questions, pack)
+            results[label] = (os.path.getsize(path), *load_users(path, users))
+
+    print(f"users:               {users} ({len(PHASES)} assessments + profile each)")
+    for label, (size, per_user, pages) in results.items():
+        print(f"{label + ':':<21}{size / 1024 / 1024:7.1f} MiB, {pages} pages, load {per_user * 1000:5.2f} ms/user")
+
+
+if __name__ == '__main__':
+    main()
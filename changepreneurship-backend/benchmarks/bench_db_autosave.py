@@ -0,0 +1,173 @@
+"""
+Concurrent autosave against one SQLite file: driver defaults, the tuned
+connection settings from src.config, and those plus the group-commit writer.
+
+Each worker process plays a threaded gunicorn worker; every thread is a
+user hammering POST /api/assessment/<id>/response. The second table takes
+HTTP handling out of the picture and times the autosave upsert alone, one
+transaction per save versus through the group-commit writer.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_db_autosave
+"""
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import event
+
+from src.config import configure_database
+from src.models.assessment import db, Assessment, User, UserSession
+from src.routes.assessment import _upsert_response, assessment_bp
+from src.services.group_commit import GroupCommitWriter
+
+
+MODES = ("default", "tuned", "group commit")
+
+
+def create_app(db_file, mode):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_file}"
+    if mode == "default":
+        # What src/main.py did before: driver defaults, no pragmas
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"connect_args": {"timeout": 5.0}}
+    app.config["GROUP_COMMIT_ENABLED"] = mode == "group commit"
+    configure_database(app, db, environ={}, apply_pragmas=mode != "default")
+    app.logger.disabled = True
+    app.register_blueprint(assessment_bp, url_prefix="/api/assessment")
+    return app
+
+
+def seed(db_file, mode, users):
+    app = create_app(db_file, mode)
+    with app.app_context():
+        db.create_all()
+        for index in range(users):
+            user = User(username=f"user{index}", email=f"user{index}@example.com", password_hash="x")
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(UserSession(
+                user_id=user.id, session_token=f"token{index}",
+                expires_at=datetime.utcnow() + timedelta(days=1),
+            ))
+            db.session.add(Assessment(id=index + 1, user_id=user.id, phase_id="self_discovery", phase_name="Self"))
+        db.session.commit()
+
+
+def autosave(app, index, saves, outcomes):
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer token{index}"}
+    errors = 0
+    latencies = []
+    for save in range(saves):
+        start = time.perf_counter()
+        response = client.post(
+            f"/api/assessment/{index + 1}/response",
+            json={
+                "section_id": "intro",
+                "question_id": f"q{save % 20}",
+                "question_text": "Question",
+                "response_type": "text",
+                "response_value": f"draft {save}",
+            },
+            headers=headers,
+        )
+        latencies.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            errors += 1
+    outcomes.append((errors, latencies))
+
+
+def worker(db_file, mode, first_user, threads, saves, results):
+    app = create_app(db_file, mode)
+    outcomes = []
+    pool = [
+        threading.Thread(target=autosave, args=(app, first_user + offset, saves, outcomes))
+        for offset in range(threads)
+    ]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    results.put(outcomes)
+
+
+def run(mode, workers, threads, saves):
+    with tempfile.TemporaryDirectory() as directory:
+        db_file = os.path.join(directory, "bench.db")
+        seed(db_file, mode, workers * threads)
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=worker, args=(db_file, mode, index * threads, threads, saves, results))
+            for index in range(workers)
+        ]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        outcomes = [outcome for _ in processes for outcome in results.get()]
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+    errors = sum(errors for errors, _ in outcomes)
+    latencies = sorted(latency for _, worker_latencies in outcomes for latency in worker_latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    total = workers * threads * saves
+    print(f"{mode:>12}: {total / elapsed:7.0f} saves/s, p99 {p99 * 1000:6.1f} ms, {errors} failed")
+
+
+def write_path(grouped, threads, saves):
+    with tempfile.TemporaryDirectory() as directory:
+        db_file = os.path.join(directory, "bench.db")
+        seed(db_file, "tuned", threads)
+        app = create_app(db_file, "tuned")
+        with app.app_context():
+            engine = db.engine
+        # Same durability on both sides: the writer commits with synchronous=FULL
+        event.listen(engine, "connect", lambda connection, _: connection.execute("PRAGMA synchronous=FULL"))
+        writer = GroupCommitWriter(engine) if grouped else None
+
+        def save(index, save_number):
+            operation = _upsert_response(
+                index + 1, "self_discovery", "intro", f"q{save_number % 20}", "Question", "text", f"draft {save_number}"
+            )
+            if writer is not None:
+                writer.execute(operation)
+            else:
+                with engine.begin() as connection:
+                    operation(connection)
+
+        def user(index):
+            for save_number in range(saves):
+                save(index, save_number)
+
+        pool = [threading.Thread(target=user, args=(index,)) for index in range(threads)]
+        start = time.perf_counter()
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        label = "grouped" if grouped else "per save"
+        extra = f", {writer.stats()['mean_group_size']} saves per commit" if writer else ""
+        if writer is not None:
+            writer.close()
+        engine.dispose()
+    print(f"{label:>12}: {threads * saves / elapsed:7.0f} saves/s{extra}")
+
+
+def main(workers=4, threads=16, saves=50):
+    print(f"HTTP: {workers} workers x {threads} threads x {saves} autosaves")
+    for mode in MODES:
+        run(mode, workers, threads, saves)
+    print(f"Write path: {threads * 4} threads x {saves} autosaves")
+    write_path(False, threads * 4, saves)
+    write_path(True, threads * 4, saves)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Per-request engine cost for the enhanced assessment blueprints.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_engines
+"""
+import gc
+import time
+import tracemalloc
+
+from src.routes import enhanced_assessment, purpose_discovery, value_zone_validator
+
+
+def _engine():
+    # Mirrors what each /api/enhanced-assessment/* request does
+    if hasattr(enhanced_assessment, 'enhanced_assessment_engine'):
+        return enhanced_assessment.enhanced_assessment_engine
+    return enhanced_assessment.EnhancedAssessmentEngine()
+
+
+def _purpose_module():
+    if hasattr(purpose_discovery, 'purpose_discovery_module'):
+        return purpose_discovery.purpose_discovery_module
+    return purpose_discovery.PurposeDiscoveryModule()
+
+
+def _validator():
+    if hasattr(value_zone_validator, 'value_zone_validator'):
+        return value_zone_validator.value_zone_validator
+    return value_zone_validator.ValueZoneValidator()
+
+
+def request_cycle():
+    engine = _engine()
+    engine.complete_phase("bench", 1, {"five_whys_result": {"purpose_clarity_score": 7}})
+    _purpose_module().process_five_whys(["I want to help people learn"] * 5)
+    _validator().analyze_passions({"q1": "I love technology and health", "q2": 8})
+
+
+def main(iterations=20000):
+    request_cycle()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        request_cycle()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    request_cycle()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"request cycles:      {iterations}")
+    print(f"mean per cycle:      {elapsed / iterations * 1e6:.1f} us")
+    print(f"peak alloc / cycle:  {peak / 1024:.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+How much of a large response's latency is JSON encoding: the stdlib-based
+provider versus the orjson-backed FastJSONProvider, on GET /responses and
+the analytics dashboard.
+
+"request" is the whole round trip through the Flask test client;
+"encode" is the provider alone on the same payload.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_json_provider
+"""
+import random
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+from src.models.assessment import Assessment, AssessmentResponse, EntrepreneurProfile, Question, QuestionVersion, User, UserSession, db
+from src.routes.analytics import analytics_bp
+from src.routes.assessment import PROFILE_JSON_FIELDS, assessment_bp
+from src.utils.json_provider import FastJSONProvider, SplicingJSONProvider, orjson
+
+WORDS = "customer market value risk revenue growth team product pricing channel segment".split()
+HEADERS = {"Authorization": "Bearer bench"}
+
+
+def create_app(provider_class):
+    app = Flask(__name__)
+    app.json = provider_class(app)
+    app.config.update(SQLALCHEMY_DATABASE_URI="sqlite:///:memory:", SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    app.logger.disabled = True
+    db.init_app(app)
+    app.register_blueprint(assessment_bp, url_prefix="/api/assessment")
+    app.register_blueprint(analytics_bp, url_prefix="/api/analytics")
+    return app
+
+
+def seed(questions):
+    rng = random.Random(0)
+    user = User(username="bench", email="bench@example.com", password_hash="x")
+    db.session.add(user)
+    db.session.flush()
+    db.session.add(UserSession(user_id=user.id, session_token="bench", expires_at=datetime.utcnow() + timedelta(days=1)))
+    assessment = Assessment(user_id=user.id, phase_id="self_discovery", phase_name="Self Discovery", progress_percentage=60)
+    db.session.add(assessment)
+    db.session.flush()
+    for index in range(questions):
+        question = Question(phase_id="self_discovery", section_id=f"section_{index // 10}", question_id=f"q{index}")
+        wording = QuestionVersion(
+            question=question, question_text=" ".join(rng.choice(WORDS) for _ in range(15)) + "?", response_type="matrix",
+        )
+        response = AssessmentResponse(assessment_id=assessment.id, question=question, wording=wording)
+        response.set_response_value({word: rng.randint(1, 5) for word in rng.sample(WORDS, 6)})
+        db.session.add(response)
+    profile = EntrepreneurProfile(user_id=user.id, entrepreneur_archetype="Visionary Builder", risk_tolerance=0.5)
+    for field in PROFILE_JSON_FIELDS:
+        profile.set_json_field(field, {f"item_{i}": " ".join(rng.sample(WORDS, 5)) for i in range(40)})
+    db.session.add(profile)
+    db.session.commit()
+    return assessment.id
+
+
+def measure(app, client, path, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        response = client.get(path, headers=HEADERS)
+    request_time = (time.perf_counter() - start) / repeat
+
+    payload = response.get_json()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        with app.app_context():
+            app.json.response(payload)
+    return request_time, (time.perf_counter() - start) / repeat, len(response.get_data())
+
+
+def main(questions=500, repeat=50):
+    if orjson is None:
+        print("orjson is not installed; FastJSONProvider falls back to the stdlib encoder")
+    paths = {
+        "/responses": None,
+        "/dashboard/overview": "/api/analytics/dashboard/overview",
+        "/dashboard/entrepreneur-profile": "/api/analytics/dashboard/entrepreneur-profile",
+    }
+    results = {}
+    for label, provider_class in (("stdlib", SplicingJSONProvider), ("orjson", FastJSONProvider)):
+        app = create_app(provider_class)
+        with app.app_context():
+            db.create_all()
+            assessment_id = seed(questions)
+            client = app.test_client()
+            for name, path in paths.items():
+                path = path or f"/api/assessment/{assessment_id}/responses"
+                results[(name, label)] = measure(app, client, path, repeat)
+            db.drop_all()
+
+    print(f"{'endpoint':<34}{'provider':<9}{'request':>10}{'encode':>10}{'share':>8}{'size':>10}")
+    for (name, label), (request_time, encode_time, size) in results.items():
+        print(
+            f"{name:<34}{label:<9}{request_time * 1000:8.2f}ms{encode_time * 1000:8.2f}ms"
+            f"{encode_time / request_time:8.0%}{size / 1024:8.1f}KiB"
+        )
+
+
+if __name__ == '__main__':
+    main()
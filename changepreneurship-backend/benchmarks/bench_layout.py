@@ -0,0 +1,34 @@
+"""
+Force-directed layout time for mind maps of increasing size.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_layout
+"""
+import time
+
+import numpy as np
+
+from src.services.graph_layout import force_directed_layout
+
+
+def mind_map_edges(node_count, fanout=10, cross_links=0.1, seed=0):
+    # Categories with `fanout - 1` elements each, plus random cross links
+    edges = [(i, i // fanout * fanout) for i in range(node_count) if i % fanout]
+    rng = np.random.default_rng(seed)
+    edges.extend(map(tuple, rng.integers(0, node_count, (int(node_count * cross_links), 2))))
+    return edges
+
+
+def main(sizes=(24, 500, 2000, 5000), repeats=3):
+    for node_count in sizes:
+        edges = mind_map_edges(node_count)
+        best = float("inf")
+        for seed in range(repeats):
+            start = time.perf_counter()
+            force_directed_layout(node_count, edges, seed=seed)
+            best = min(best, time.perf_counter() - start)
+        print(f"{node_count:>5} nodes, {len(edges):>5} edges:  {best * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Market analysis time against a synthetic dataset of thousands of markets.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_market_data
+"""
+import csv
+import os
+import random
+import tempfile
+import time
+
+from src.routes.value_zone_validator import ValueZoneValidator
+from src.services.market_data import MarketDataStore
+
+WORDS = [f"term{i}" for i in range(20000)]
+
+
+def write_markets(path, market_count, seed=0):
+    rng = random.Random(seed)
+    with open(path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["name", "keywords", "market_size", "growth_rate", "competition_level", "trends"])
+        for index in range(market_count):
+            writer.writerow([
+                f"Market {index}",
+                ";".join(rng.sample(WORDS, 8)),
+                rng.randint(10 ** 7, 10 ** 10),
+                round(rng.uniform(0.0, 0.25), 3),
+                rng.choice(["Low", "Medium", "High"]),
+                "Trend A;Trend B",
+            ])
+
+
+def main(market_counts=(1000, 5000, 20000), idea_count=50, repeats=5):
+    rng = random.Random(1)
+    ideas = [" ".join(rng.sample(WORDS, 6)) for _ in range(idea_count)]
+    with tempfile.TemporaryDirectory() as directory:
+        for market_count in market_counts:
+            csv_path = os.path.join(directory, f"markets_{market_count}.csv")
+            write_markets(csv_path, market_count)
+            store = MarketDataStore(csv_path=csv_path, db_path=os.path.join(directory, f"markets_{market_count}.db"))
+
+            start = time.perf_counter()
+            store.count()
+            build = time.perf_counter() - start
+
+            validator = ValueZoneValidator()
+            validator.market_data = store
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                validator.analyze_market_demand(ideas, [])
+                best = min(best, time.perf_counter() - start)
+            print(f"{market_count:>6} markets: import {build * 1000:7.1f} ms, "
+                  f"{idea_count} ideas analyzed in {best * 1000:6.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
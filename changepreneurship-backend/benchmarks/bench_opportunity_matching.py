@@ -0,0 +1,41 @@
+"""
+Passion x skill opportunity matching time for catalogs of increasing size.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_opportunity_matching
+"""
+import random
+import time
+
+from src.routes.value_zone_validator import PASSION_CATEGORIES, SKILL_CATEGORIES
+from src.services.opportunity_matching import OpportunityMatcher
+
+WORDS = [f"word{i}" for i in range(5000)]
+
+
+def catalog(size, seed=0):
+    rng = random.Random(seed)
+    return [
+        (rng.choice(PASSION_CATEGORIES), rng.choice(SKILL_CATEGORIES), " ".join(rng.sample(WORDS, 3)))
+        for _ in range(size)
+    ]
+
+
+def main(sizes=(100, 10000, 50000), repeats=5):
+    pairs = [(passion, skill) for passion in PASSION_CATEGORIES[:3] for skill in SKILL_CATEGORIES[:3]]
+    for size in sizes:
+        start = time.perf_counter()
+        matcher = OpportunityMatcher(catalog(size))
+        build = time.perf_counter() - start
+
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            matcher.match(pairs)
+            best = min(best, time.perf_counter() - start)
+        print(f"{size:>6} opportunities: build {build * 1000:7.1f} ms, "
+              f"{len(pairs)} pairs matched in {best * 1000:6.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Serializing a heavy EntrepreneurProfile: decode and re-encode every JSON
+column, splice the stored JSON as RawJSON, or project a few scalar fields.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_profile_payload
+"""
+import random
+import time
+
+from flask import Flask
+
+from src.models.assessment import EntrepreneurProfile, User, db
+from src.routes.assessment import PROFILE_JSON_FIELDS
+from src.utils.json_provider import SplicingJSONProvider
+
+WORDS = "customer market value risk revenue growth team product pricing channel segment".split()
+
+
+def heavy_document(rng, entries):
+    return {
+        f"item_{index}": {
+            "notes": " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 30))),
+            "score": round(rng.random() * 10, 2),
+            "tags": rng.sample(WORDS, 3),
+        }
+        for index in range(entries)
+    }
+
+
+def timed(label, serialize, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        size = len(serialize())
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<24}{elapsed * 1000:8.3f} ms, {size / 1024:7.1f} KiB")
+
+
+def main(entries=150, repeat=50):
+    app = Flask(__name__)
+    app.json = SplicingJSONProvider(app)
+    app.config.update(SQLALCHEMY_DATABASE_URI="sqlite:///:memory:", SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+    rng = random.Random(0)
+
+    with app.app_context():
+        db.create_all()
+        user = User(username="bench", email="bench@example.com", password_hash="x")
+        db.session.add(user)
+        db.session.flush()
+        profile = EntrepreneurProfile(user_id=user.id, risk_tolerance=0.4, confidence_level=0.7)
+        for field in PROFILE_JSON_FIELDS:
+            profile.set_json_field(field, heavy_document(rng, entries))
+        db.session.add(profile)
+        db.session.commit()
+
+        scalars = {"entrepreneur_archetype", "risk_tolerance", "confidence_level", "success_probability"}
+        print(f"profile JSON fields:    {len(PROFILE_JSON_FIELDS)} x {entries} entries")
+        timed("decode + re-encode", lambda: app.json.dumps({"profile": profile.to_dict()}), repeat)
+        timed("raw splice", lambda: app.json.dumps({"profile": profile.to_dict(raw_json=True)}), repeat)
+        timed("?fields= scalars", lambda: app.json.dumps({"profile": profile.to_dict(scalars, raw_json=True)}), repeat)
+
+
+if __name__ == '__main__':
+    main()
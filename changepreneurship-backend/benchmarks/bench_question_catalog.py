@@ -0,0 +1,128 @@
+"""
+assessment_response storage: question text and type repeated on every row
+versus responses pointing at the shared question catalog.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_question_catalog
+"""
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+INLINE_SCHEMA = """
+CREATE TABLE assessment_response (
+    id INTEGER PRIMARY KEY,
+    assessment_id INTEGER NOT NULL,
+    section_id VARCHAR(100) NOT NULL,
+    question_id VARCHAR(100) NOT NULL,
+    question_text TEXT NOT NULL,
+    response_type VARCHAR(50) NOT NULL,
+    response_value TEXT,
+    response_value_hash VARCHAR(64),
+    created_at DATETIME,
+    updated_at DATETIME
+);
+"""
+
+CATALOG_SCHEMA = """
+CREATE TABLE question (
+    id INTEGER PRIMARY KEY,
+    phase_id VARCHAR(50) NOT NULL,
+    section_id VARCHAR(100) NOT NULL,
+    question_id VARCHAR(100) NOT NULL,
+    question_text TEXT NOT NULL,
+    response_type VARCHAR(50) NOT NULL,
+    UNIQUE (phase_id, section_id, question_id)
+);
+CREATE TABLE assessment_response (
+    id INTEGER PRIMARY KEY,
+    assessment_id INTEGER NOT NULL,
+    question_ref_id INTEGER NOT NULL REFERENCES question (id),
+    response_value TEXT,
+    response_value_hash VARCHAR(64),
+    created_at DATETIME,
+    updated_at DATETIME
+);
+CREATE INDEX ix_assessment_response_assessment_question ON assessment_response (assessment_id, question_ref_id);
+"""
+
+
+def questions(count, seed=0):
+    rng = random.Random(seed)
+    words = "how would you describe your motivation risk market customer value skills plan".split()
+    return [
+        (
+            "self_discovery",
+            f"section_{index // 10}",
+            f"question_{index}",
+            " ".join(rng.choice(words) for _ in range(rng.randint(12, 30))) + "?",
+            rng.choice(["multiple_choice", "text", "scale", "matrix"]),
+        )
+        for index in range(count)
+    ]
+
+
+def build(path, schema, catalog, users):
+    connection = sqlite3.connect(path)
+    connection.executescript(schema)
+    timestamp = "2026-10-19 12:00:00.000000"
+    if schema is CATALOG_SCHEMA:
+        connection.executemany(
+            "INSERT INTO question (id, phase_id, section_id, question_id, question_text, response_type) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(index + 1, *question) for index, question in enumerate(catalog)],
+        )
+        rows = [
+            (user + 1, index + 1, f'"answer {user % 5}"', "0" * 64, timestamp, timestamp)
+            for user in range(users) for index in range(len(catalog))
+        ]
+        connection.executemany(
+            "INSERT INTO assessment_response (assessment_id, question_ref_id, response_value, "
+            "response_value_hash, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    else:
+        rows = [
+            (user + 1, section, question_id, text, kind, f'"answer {user % 5}"', "0" * 64, timestamp, timestamp)
+            for user in range(users) for _, section, question_id, text, kind in catalog
+        ]
+        connection.executemany(
+            "INSERT INTO assessment_response (assessment_id, section_id, question_id, question_text, "
+            "response_type, response_value, response_value_hash, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    connection.commit()
+    connection.execute("VACUUM")
+    connection.close()
+
+
+def scan(path):
+    # Cold-ish full scan, like the analytics activity queries
+    connection = sqlite3.connect(path)
+    start = time.perf_counter()
+    connection.execute("SELECT COUNT(*), MAX(updated_at) FROM assessment_response").fetchone()
+    elapsed = time.perf_counter() - start
+    pages = connection.execute("PRAGMA page_count").fetchone()[0]
+    connection.close()
+    return elapsed, pages
+
+
+def main(users=2000, question_count=120):
+    catalog = questions(question_count)
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for label, schema in (("inline text", INLINE_SCHEMA), ("catalog", CATALOG_SCHEMA)):
+            path = os.path.join(directory, f"{label.replace(' ', '_')}.db")
+            build(path, schema, catalog, users)
+            results[label] = (os.path.getsize(path), *scan(path))
+
+    print(f"responses:           {users * question_count}")
+    for label, (size, elapsed, pages) in results.items():
+        print(f"{label + ':':<21}{size / 1024 / 1024:7.1f} MiB, {pages} pages, full scan {elapsed * 1000:6.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Cohort re-scoring: per-assessment scoring calls versus the batch scorer.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_rescore
+"""
+import random
+import time
+
+from src.routes.enhanced_assessment import enhanced_assessment_engine as engine
+
+
+def cohort(size, seed=0):
+    rng = random.Random(seed)
+    phases = {
+        1: lambda: {"five_whys_result": {"purpose_clarity_score": rng.uniform(0, 10)},
+                    "legacy_statement": {"statement": "word " * rng.randint(5, 60)}},
+        2: lambda: {"passion_analysis": {"passion_intensity": rng.uniform(0, 10)},
+                    "market_analysis": {"idea": {"opportunity_score": rng.randint(3, 9)}}},
+        3: lambda: {"mind_map": {"nodes": {str(i): {"completed": i % 2 == 0} for i in range(24)}}},
+        4: lambda: {"market_size": rng.choice([5e7, 5e8])},
+        5: lambda: {"leadership_assessment": {"overall_score": rng.uniform(0, 10)}},
+        6: lambda: {"ai_opportunities": [1] * rng.randint(0, 10)},
+        7: lambda: {"business_plan": {str(i): "" for i in range(rng.randint(0, 9))}},
+    }
+    return [{phase: make() for phase, make in phases.items()} for _ in range(size)]
+
+
+def score_one_by_one(assessments):
+    for phases in assessments:
+        results = {phase: {"score": engine._calculate_phase_score(phase, data)} for phase, data in phases.items()}
+        engine.calculate_overall_assessment(results)
+
+
+def main(size=100000):
+    assessments = cohort(size)
+
+    start = time.perf_counter()
+    score_one_by_one(assessments)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine.score_batch(assessments)
+    batch = time.perf_counter() - start
+
+    print(f"assessments:         {size}")
+    print(f"one by one:          {sequential:.2f} s")
+    print(f"batch:               {batch:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Per-assessment response reads: rowid table in arrival order versus the
+WITHOUT ROWID table clustered on (assessment_id, question_ref_id).
+
+Autosaves arrive interleaved across many assessments, so in the rowid
+layout one assessment's answers are spread over as many pages as it has
+answers. Page reads are counted as read syscalls (/proc/self/io, Linux)
+with SQLite's page cache shrunk and mmap off, i.e. one pread per page
+that misses the cache.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_response_clustering [rows]
+"""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+QUESTIONS_PER_ASSESSMENT = 50
+SAMPLE = 2000
+INSERT_BATCH = 50000
+
+ROWID_SCHEMA = """
+CREATE TABLE assessment_response (
+    id INTEGER PRIMARY KEY,
+    assessment_id INTEGER NOT NULL,
+    question_ref_id INTEGER NOT NULL,
+    response_value TEXT,
+    response_value_hash VARCHAR(64),
+    created_at DATETIME,
+    updated_at DATETIME
+);
+CREATE INDEX ix_assessment_response_assessment_question ON assessment_response (assessment_id, question_ref_id);
+"""
+
+CLUSTERED_SCHEMA = """
+CREATE TABLE assessment_response (
+    assessment_id INTEGER NOT NULL,
+    question_ref_id INTEGER NOT NULL,
+    response_value TEXT,
+    response_value_hash VARCHAR(64),
+    created_at DATETIME,
+    updated_at DATETIME,
+    PRIMARY KEY (assessment_id, question_ref_id)
+) WITHOUT ROWID;
+"""
+
+
+def arrivals(assessments, seed=0):
+    """Responses in the order autosave would write them: every assessment
+    answers question 1, then 2, and so on, users interleaved"""
+    rng = random.Random(seed)
+    order = list(range(1, assessments + 1))
+    timestamp = "2026-10-19 12:00:00.000000"
+    for question in range(1, QUESTIONS_PER_ASSESSMENT + 1):
+        rng.shuffle(order)
+        for assessment_id in order:
+            yield (assessment_id, question, f'"answer {assessment_id % 97} to {question}"', "0" * 64, timestamp, timestamp)
+
+
+def build(path, schema, assessments):
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=OFF")
+    connection.execute("PRAGMA synchronous=OFF")
+    connection.execute("PRAGMA cache_size=-262144")
+    connection.executescript(schema)
+    batch = []
+    statement = (
+        "INSERT INTO assessment_response (assessment_id, question_ref_id, response_value, "
+        "response_value_hash, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    for row in arrivals(assessments):
+        batch.append(row)
+        if len(batch) == INSERT_BATCH:
+            connection.executemany(statement, batch)
+            batch.clear()
+    connection.executemany(statement, batch)
+    connection.commit()
+    connection.close()
+
+
+def read_syscalls():
+    with open("/proc/self/io") as handle:
+        return int(next(line for line in handle if line.startswith("syscr")).split()[1])
+
+
+def measure(path, sample):
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA mmap_size=0")
+    connection.execute("PRAGMA cache_size=-64")
+    query = "SELECT question_ref_id, response_value, updated_at FROM assessment_response WHERE assessment_id = ?"
+    before = read_syscalls()
+    start = time.perf_counter()
+    rows = 0
+    for assessment_id in sample:
+        rows += len(connection.execute(query, (assessment_id,)).fetchall())
+    elapsed = time.perf_counter() - start
+    reads = read_syscalls() - before
+    connection.close()
+    return rows, reads, elapsed
+
+
+def main(rows=10_000_000):
+    assessments = rows // QUESTIONS_PER_ASSESSMENT
+    sample = random.Random(1).sample(range(1, assessments + 1), min(SAMPLE, assessments))
+    with tempfile.TemporaryDirectory(dir=os.environ.get("BENCH_TMPDIR")) as directory:
+        print(f"responses:           {assessments * QUESTIONS_PER_ASSESSMENT} ({assessments} assessments)")
+        for label, schema in (("rowid", ROWID_SCHEMA), ("clustered", CLUSTERED_SCHEMA)):
+            path = os.path.join(directory, f"{label}.db")
+            start = time.perf_counter()
+            build(path, schema, assessments)
+            built = time.perf_counter() - start
+            fetched, reads, elapsed = measure(path, sample)
+            print(
+                f"{label + ':':<21}{os.path.getsize(path) / 2 ** 20:7.0f} MiB (built in {built:.0f} s), "
+                f"{reads / len(sample):6.1f} page reads and {elapsed / len(sample) * 1000:5.2f} ms per assessment "
+                f"({fetched // len(sample)} rows)"
+            )
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
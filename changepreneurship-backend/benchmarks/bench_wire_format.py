@@ -0,0 +1,75 @@
+"""
+JSON versus MessagePack on the wire for the larger responses:
+GET /responses, the principles list and a loaded mind map.
+
+Sizes are shown raw and gzipped (what a compressing proxy would send);
+"encode" is the server-side provider, "decode" what a client spends
+parsing the body.
+
+Run from changepreneurship-backend/:
+    python -m benchmarks.bench_wire_format
+"""
+import gzip
+import json
+import time
+
+import msgpack
+
+from benchmarks.bench_json_provider import HEADERS, create_app, seed
+from src.models.assessment import db
+from src.routes.mind_mapping import mind_mapping_bp
+from src.routes.principles import principles_bp
+from src.utils.wire_format import MSGPACK_MIMETYPE, WireFormatProvider, WireFormatRequest
+
+FORMATS = {"json": "application/json", "msgpack": MSGPACK_MIMETYPE}
+DECODERS = {"json": json.loads, "msgpack": msgpack.unpackb}
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def measure(app, client, path, accept, decode, repeat):
+    response = client.get(path, headers={**HEADERS, "Accept": accept})
+    assert response.mimetype == accept, response.mimetype
+    body = response.get_data()
+    payload = decode(body)
+    with app.test_request_context(headers={"Accept": accept}):
+        encode = timed(lambda: app.json.response(payload), repeat)
+    return len(body), len(gzip.compress(body)), encode, timed(lambda: decode(body), repeat)
+
+
+def main(questions=500, repeat=50):
+    app = create_app(WireFormatProvider)
+    app.request_class = WireFormatRequest
+    app.config["SECRET_KEY"] = "bench"  # mind maps keep state in the session
+    app.register_blueprint(principles_bp, url_prefix="/api")
+    app.register_blueprint(mind_mapping_bp, url_prefix="/api/mind-mapping")
+
+    with app.app_context():
+        db.create_all()
+        assessment_id = seed(questions)
+        client = app.test_client()
+        mind_map = client.post("/api/mind-mapping/create", json={"user_id": 1, "business_idea": "Meal kits"})
+        paths = {
+            "/responses": f"/api/assessment/{assessment_id}/responses",
+            "/principles?limit=50": "/api/principles?limit=50",
+            "/mind-mapping/<id>": f"/api/mind-mapping/{mind_map.get_json()['data']['id']}?limit=500",
+        }
+
+        print(f"{'endpoint':<24}{'format':<9}{'size':>10}{'gzipped':>10}{'encode':>10}{'decode':>10}")
+        for name, path in paths.items():
+            for label, accept in FORMATS.items():
+                size, zipped, encode, decode = measure(app, client, path, accept, DECODERS[label], repeat)
+                print(
+                    f"{name:<24}{label:<9}{size / 1024:7.1f}KiB{zipped / 1024:7.1f}KiB"
+                    f"{encode * 1000:8.3f}ms{decode * 1000:8.3f}ms"
+                )
+        db.drop_all()
+
+
+if __name__ == '__main__':
+    main()
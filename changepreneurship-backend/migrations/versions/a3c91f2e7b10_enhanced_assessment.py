@@ -0,0 +1,46 @@
+"""persist enhanced assessments
+
+Revision ID: a3c91f2e7b10
+Revises: 479a67b65e65
+Create Date: 2026-10-19 09:12:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c91f2e7b10'
+down_revision = '479a67b65e65'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('enhanced_assessment',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('assessment_type', sa.String(length=50), nullable=True),
+    sa.Column('current_phase', sa.Integer(), nullable=True),
+    sa.Column('completion_status', sa.String(length=20), nullable=True),
+    sa.Column('phase_results', sa.Text(), nullable=True),
+    sa.Column('phase_scores', sa.Text(), nullable=True),
+    sa.Column('weighted_score_sum', sa.Float(), nullable=True),
+    sa.Column('weight_total', sa.Float(), nullable=True),
+    sa.Column('score_sum', sa.Float(), nullable=True),
+    sa.Column('overall_score', sa.Float(), nullable=True),
+    sa.Column('final_results', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('enhanced_assessment', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_enhanced_assessment_user_id'), ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('enhanced_assessment', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_enhanced_assessment_user_id'))
+
+    op.drop_table('enhanced_assessment')
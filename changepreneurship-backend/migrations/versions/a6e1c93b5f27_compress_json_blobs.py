@@ -0,0 +1,131 @@
+"""compress large assessment and profile JSON columns
+
+Revision ID: a6e1c93b5f27
+Revises: f2a9c4d8b316
+Create Date: 2026-10-19 21:14:37.402916
+
+"""
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6e1c93b5f27'
+down_revision = 'f2a9c4d8b316'
+branch_labels = None
+depends_on = None
+
+# Mirrors src.utils.blob_codec at the time of this revision
+MARKER = b"\x00CJ"
+THRESHOLD = 1024
+ZLIB_LEVEL = 6
+
+# Rows rewritten per round trip
+BACKFILL_CHUNK = 1000
+
+JSON_COLUMNS = {
+    'assessment': ['assessment_data'],
+    'entrepreneur_profile': [
+        'primary_opportunity', 'skills_assessment', 'market_analysis', 'competitive_analysis',
+        'target_customers', 'business_model', 'financial_projections', 'go_to_market_strategy',
+        'product_concept_results', 'business_development_plan', 'prototype_testing_results',
+        'ai_recommendations',
+    ],
+}
+
+
+def _pack(value):
+    if not isinstance(value, str) or len(value.encode()) < THRESHOLD:
+        return value
+    raw = value.encode()
+    packed = MARKER + b"z" + zlib.compress(raw, ZLIB_LEVEL)
+    return packed if len(packed) < len(raw) else value
+
+
+def _unpack(value):
+    if value is None or isinstance(value, str):
+        return value
+    value = bytes(value)
+    if not value.startswith(MARKER):
+        return value.decode()
+    codec, payload = value[len(MARKER):len(MARKER) + 1], value[len(MARKER) + 1:]
+    if codec == b"s" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(payload).decode()
+    if codec != b"z":
+        raise RuntimeError(f"Cannot decompress {codec!r} blob without its codec installed")
+    return zlib.decompress(payload).decode()
+
+
+def _stored(bind, value):
+    """``value`` as the column takes it: bytea on Postgres needs UTF-8 bytes, never text"""
+    if isinstance(value, str) and bind.dialect.name == 'postgresql':
+        return value.encode()
+    return value
+
+
+def _rewrite(bind, table_name, columns, convert):
+    """Apply ``convert`` to every JSON column of ``table_name``, walking by id"""
+    # Typed as bytea on Postgres so a str slipping through fails instead of
+    # being parsed as bytea escape input
+    column_type = sa.LargeBinary if bind.dialect.name == 'postgresql' else None
+    table = sa.table(table_name, sa.column('id', sa.Integer), *[sa.column(c, column_type) for c in columns])
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(table).where(table.c.id > last_id).order_by(table.c.id).limit(BACKFILL_CHUNK)
+        ).fetchall()
+        if not rows:
+            break
+        for row in rows:
+            values = {}
+            for column in columns:
+                current = row._mapping[column]
+                if isinstance(current, memoryview):
+                    current = bytes(current)
+                # Plain text comes back as str on SQLite, bytes on Postgres bytea
+                if isinstance(current, bytes) and not current.startswith(MARKER):
+                    current = current.decode()
+                converted = convert(current)
+                if converted is not current:
+                    values[column] = _stored(bind, converted)
+            if values:
+                bind.execute(table.update().where(table.c.id == row.id).values(**values))
+        last_id = rows[-1].id
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # SQLite keeps text and BLOBs in the same column; Postgres needs bytea
+        for table_name, columns in JSON_COLUMNS.items():
+            for column in columns:
+                op.execute(
+                    f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE bytea "
+                    f"USING convert_to({column}, 'UTF8')"
+                )
+
+    for table_name, columns in JSON_COLUMNS.items():
+        _rewrite(bind, table_name, columns, _pack)
+
+
+def downgrade():
+    bind = op.get_bind()
+    # Columns are still bytea on Postgres here; _rewrite stores the
+    # decompressed text UTF-8 encoded so convert_from() below reads it back
+    for table_name, columns in JSON_COLUMNS.items():
+        _rewrite(bind, table_name, columns, _unpack)
+
+    if bind.dialect.name == 'postgresql':
+        for table_name, columns in JSON_COLUMNS.items():
+            for column in columns:
+                op.execute(
+                    f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE text "
+                    f"USING convert_from({column}, 'UTF8')"
+                )
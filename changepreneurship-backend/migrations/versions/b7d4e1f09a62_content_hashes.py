@@ -0,0 +1,33 @@
+"""store content hashes beside autosaved JSON
+
+Revision ID: b7d4e1f09a62
+Revises: e8f3a6c2d715
+Create Date: 2026-10-19 19:20:41.802215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d4e1f09a62'
+down_revision = 'e8f3a6c2d715'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Left NULL for existing rows; the models hash the stored text on demand
+    with op.batch_alter_table('assessment', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('assessment_data_hash', sa.String(length=64), nullable=True))
+
+    with op.batch_alter_table('assessment_response', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('response_value_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('assessment_response', schema=None) as batch_op:
+        batch_op.drop_column('response_value_hash')
+
+    with op.batch_alter_table('assessment', schema=None) as batch_op:
+        batch_op.drop_column('assessment_data_hash')
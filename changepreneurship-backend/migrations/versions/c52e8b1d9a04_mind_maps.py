@@ -0,0 +1,101 @@
+"""persist mind maps as node, connection and scenario rows
+
+Revision ID: c52e8b1d9a04
+Revises: a3c91f2e7b10
+Create Date: 2026-10-19 11:40:03.527716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52e8b1d9a04'
+down_revision = 'a3c91f2e7b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('mind_map',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('business_idea', sa.Text(), nullable=True),
+    sa.Column('revision', sa.Integer(), nullable=False),
+    sa.Column('element_counts', sa.Text(), nullable=True),
+    sa.Column('completed_counts', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('mind_map', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_mind_map_user_id'), ['user_id'], unique=False)
+
+    op.create_table('mind_map_node',
+    sa.Column('mind_map_id', sa.String(length=36), nullable=False),
+    sa.Column('node_id', sa.String(length=64), nullable=False),
+    sa.Column('sort_order', sa.Integer(), nullable=False),
+    sa.Column('node_type', sa.String(length=20), nullable=False),
+    sa.Column('label', sa.String(length=200), nullable=True),
+    sa.Column('category', sa.String(length=50), nullable=True),
+    sa.Column('question', sa.Text(), nullable=True),
+    sa.Column('answer', sa.Text(), nullable=True),
+    sa.Column('x', sa.Float(), nullable=True),
+    sa.Column('y', sa.Float(), nullable=True),
+    sa.Column('completed', sa.Boolean(), nullable=True),
+    sa.Column('parent_id', sa.String(length=64), nullable=True),
+    sa.Column('children', sa.Text(), nullable=True),
+    sa.Column('revision', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['mind_map_id'], ['mind_map.id'], ),
+    sa.PrimaryKeyConstraint('mind_map_id', 'node_id')
+    )
+    with op.batch_alter_table('mind_map_node', schema=None) as batch_op:
+        batch_op.create_index('ix_mind_map_node_order', ['mind_map_id', 'sort_order'], unique=False)
+
+    op.create_table('mind_map_connection',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('mind_map_id', sa.String(length=36), nullable=False),
+    sa.Column('source_node', sa.String(length=64), nullable=False),
+    sa.Column('target_node', sa.String(length=64), nullable=False),
+    sa.Column('connection_type', sa.String(length=50), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('strength', sa.Float(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['mind_map_id'], ['mind_map.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('mind_map_connection', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_mind_map_connection_mind_map_id'), ['mind_map_id'], unique=False)
+
+    op.create_table('mind_map_scenario',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('mind_map_id', sa.String(length=36), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=True),
+    sa.Column('scenario_type', sa.String(length=50), nullable=True),
+    sa.Column('scenario_data', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['mind_map_id'], ['mind_map.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('mind_map_scenario', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_mind_map_scenario_mind_map_id'), ['mind_map_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('mind_map_scenario', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_mind_map_scenario_mind_map_id'))
+
+    op.drop_table('mind_map_scenario')
+    with op.batch_alter_table('mind_map_connection', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_mind_map_connection_mind_map_id'))
+
+    op.drop_table('mind_map_connection')
+    with op.batch_alter_table('mind_map_node', schema=None) as batch_op:
+        batch_op.drop_index('ix_mind_map_node_order')
+
+    op.drop_table('mind_map_node')
+    with op.batch_alter_table('mind_map', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_mind_map_user_id'))
+
+    op.drop_table('mind_map')
@@ -0,0 +1,81 @@
+"""keep question wordings as immutable versions of a catalog question
+
+Revision ID: c8d2f5a17e40
+Revises: a6e1c93b5f27
+Create Date: 2026-10-19 22:06:51.330284
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8d2f5a17e40'
+down_revision = 'a6e1c93b5f27'
+branch_labels = None
+depends_on = None
+
+# Batch mode rebuilds the table on SQLite; keep it clustered on its key
+RESPONSE_TABLE_KWARGS = {'sqlite_with_rowid': False}
+
+
+def upgrade():
+    op.create_table('question_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('question_ref_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('question_text', sa.Text(), nullable=False),
+    sa.Column('response_type', sa.String(length=50), nullable=False),
+    sa.ForeignKeyConstraint(['question_ref_id'], ['question.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('question_ref_id', 'version', name='uq_question_version')
+    )
+
+    # Each question's current wording becomes its first version, under the same id
+    op.execute(
+        "INSERT INTO question_version (id, question_ref_id, version, question_text, response_type) "
+        "SELECT id, id, 1, question_text, response_type FROM question"
+    )
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "SELECT setval(pg_get_serial_sequence('question_version', 'id'), "
+            "COALESCE((SELECT MAX(id) FROM question_version), 0) + 1, false)"
+        )
+
+    with op.batch_alter_table('assessment_response', schema=None, table_kwargs=RESPONSE_TABLE_KWARGS) as batch_op:
+        batch_op.add_column(sa.Column('question_version_id', sa.Integer(), nullable=True))
+
+    op.execute("UPDATE assessment_response SET question_version_id = question_ref_id")
+
+    with op.batch_alter_table('assessment_response', schema=None, table_kwargs=RESPONSE_TABLE_KWARGS) as batch_op:
+        batch_op.alter_column('question_version_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key(
+            'fk_assessment_response_question_version', 'question_version', ['question_version_id'], ['id']
+        )
+
+    with op.batch_alter_table('question', schema=None) as batch_op:
+        batch_op.drop_column('response_type')
+        batch_op.drop_column('question_text')
+
+
+def downgrade():
+    with op.batch_alter_table('question', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('question_text', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('response_type', sa.String(length=50), nullable=True))
+
+    # The catalog held one wording per question; the latest version wins
+    for column in ('question_text', 'response_type'):
+        op.execute(
+            f"UPDATE question SET {column} = (SELECT v.{column} FROM question_version v "
+            "WHERE v.question_ref_id = question.id ORDER BY v.version DESC LIMIT 1)"
+        )
+
+    with op.batch_alter_table('question', schema=None) as batch_op:
+        batch_op.alter_column('question_text', existing_type=sa.Text(), nullable=False)
+        batch_op.alter_column('response_type', existing_type=sa.String(length=50), nullable=False)
+
+    with op.batch_alter_table('assessment_response', schema=None, table_kwargs=RESPONSE_TABLE_KWARGS) as batch_op:
+        batch_op.drop_constraint('fk_assessment_response_question_version', type_='foreignkey')
+        batch_op.drop_column('question_version_id')
+
+    op.drop_table('question_version')
@@ -0,0 +1,142 @@
+"""move question text and type into a shared question catalog
+
+Revision ID: d41f7c2a8e53
+Revises: b7d4e1f09a62
+Create Date: 2026-10-19 19:48:12.604318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41f7c2a8e53'
+down_revision = 'b7d4e1f09a62'
+branch_labels = None
+depends_on = None
+
+# Responses backfilled per round trip; keeps memory and lock time bounded
+BACKFILL_CHUNK = 5000
+
+# A full Table so inserts report the new primary key on every backend
+question = sa.Table(
+    'question',
+    sa.MetaData(),
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('phase_id', sa.String),
+    sa.Column('section_id', sa.String),
+    sa.Column('question_id', sa.String),
+    sa.Column('question_text', sa.Text),
+    sa.Column('response_type', sa.String),
+)
+
+assessment_response = sa.table(
+    'assessment_response',
+    sa.column('id', sa.Integer),
+    sa.column('question_ref_id', sa.Integer),
+)
+
+
+def _backfill_question_refs(bind):
+    """Catalog every distinct question and point its responses at it.
+
+    Walks assessment_response by id. Where the same question was stored
+    with different wording, the most recently inserted row's wins.
+    """
+    catalog = {}
+    last_id = 0
+    while True:
+        rows = bind.execute(sa.text(
+            "SELECT r.id, COALESCE(a.phase_id, ''), r.section_id, r.question_id, r.question_text, r.response_type "
+            "FROM assessment_response r LEFT JOIN assessment a ON a.id = r.assessment_id "
+            "WHERE r.id > :last_id ORDER BY r.id LIMIT :chunk"
+        ), {"last_id": last_id, "chunk": BACKFILL_CHUNK}).fetchall()
+        if not rows:
+            break
+
+        latest = {}
+        for response_id, phase_id, section_id, question_id, question_text, response_type in rows:
+            latest[(phase_id, section_id, question_id)] = (question_text, response_type)
+
+        for key, (question_text, response_type) in latest.items():
+            known = catalog.get(key)
+            if known is None:
+                phase_id, section_id, question_id = key
+                result = bind.execute(question.insert().values(
+                    phase_id=phase_id,
+                    section_id=section_id,
+                    question_id=question_id,
+                    question_text=question_text,
+                    response_type=response_type,
+                ))
+                catalog[key] = (result.inserted_primary_key[0], question_text, response_type)
+            elif known[1:] != (question_text, response_type):
+                bind.execute(
+                    question.update()
+                    .where(question.c.id == known[0])
+                    .values(question_text=question_text, response_type=response_type)
+                )
+                catalog[key] = (known[0], question_text, response_type)
+
+        bind.execute(
+            assessment_response.update()
+            .where(assessment_response.c.id == sa.bindparam('response_id'))
+            .values(question_ref_id=sa.bindparam('ref_id')),
+            [
+                {"response_id": row[0], "ref_id": catalog[(row[1], row[2], row[3])][0]}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    op.create_table('question',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('phase_id', sa.String(length=50), nullable=False),
+    sa.Column('section_id', sa.String(length=100), nullable=False),
+    sa.Column('question_id', sa.String(length=100), nullable=False),
+    sa.Column('question_text', sa.Text(), nullable=False),
+    sa.Column('response_type', sa.String(length=50), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('phase_id', 'section_id', 'question_id', name='uq_question_key')
+    )
+
+    with op.batch_alter_table('assessment_response', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('question_ref_id', sa.Integer(), nullable=True))
+
+    _backfill_question_refs(op.get_bind())
+
+    with op.batch_alter_table('assessment_response', schema=None) as batch_op:
+        batch_op.alter_column('question_ref_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_assessment_response_question', 'question', ['question_ref_id'], ['id'])
+        batch_op.create_index('ix_assessment_response_assessment_question', ['assessment_id', 'question_ref_id'])
+        batch_op.drop_column('response_type')
+        batch_op.drop_column('question_text')
+        batch_op.drop_column('question_id')
+        batch_op.drop_column('section_id')
+
+
+def downgrade():
+    with op.batch_alter_table('assessment_response', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('section_id', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('question_id', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('question_text', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('response_type', sa.String(length=50), nullable=True))
+
+    for column in ('section_id', 'question_id', 'question_text', 'response_type'):
+        op.execute(
+            f"UPDATE assessment_response SET {column} = "
+            f"(SELECT question.{column} FROM question WHERE question.id = assessment_response.question_ref_id)"
+        )
+
+    with op.batch_alter_table('assessment_response', schema=None) as batch_op:
+        batch_op.alter_column('section_id', existing_type=sa.String(length=100), nullable=False)
+        batch_op.alter_column('question_id', existing_type=sa.String(length=100), nullable=False)
+        batch_op.alter_column('question_text', existing_type=sa.Text(), nullable=False)
+        batch_op.alter_column('response_type', existing_type=sa.String(length=50), nullable=False)
+        batch_op.drop_index('ix_assessment_response_assessment_question')
+        batch_op.drop_constraint('fk_assessment_response_question', type_='foreignkey')
+        batch_op.drop_column('question_ref_id')
+
+    op.drop_table('question')
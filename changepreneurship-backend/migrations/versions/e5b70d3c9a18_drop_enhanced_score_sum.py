@@ -0,0 +1,45 @@
+"""drop the unused enhanced_assessment.score_sum total
+
+Revision ID: e5b70d3c9a18
+Revises: c8d2f5a17e40
+Create Date: 2026-10-19 22:41:09.572613
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b70d3c9a18'
+down_revision = 'c8d2f5a17e40'
+branch_labels = None
+depends_on = None
+
+enhanced_assessment = sa.table(
+    'enhanced_assessment',
+    sa.column('id', sa.String),
+    sa.column('phase_scores', sa.Text),
+    sa.column('score_sum', sa.Float),
+)
+
+
+def upgrade():
+    with op.batch_alter_table('enhanced_assessment', schema=None) as batch_op:
+        batch_op.drop_column('score_sum')
+
+
+def downgrade():
+    with op.batch_alter_table('enhanced_assessment', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('score_sum', sa.Float(), nullable=True))
+
+    # Rebuild the total from the stored per-phase scores
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(enhanced_assessment.c.id, enhanced_assessment.c.phase_scores)).fetchall()
+    for assessment_id, phase_scores in rows:
+        bind.execute(
+            enhanced_assessment.update()
+            .where(enhanced_assessment.c.id == assessment_id)
+            .values(score_sum=sum(json.loads(phase_scores or '{}').values()))
+        )
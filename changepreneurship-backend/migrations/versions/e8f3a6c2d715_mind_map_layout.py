@@ -0,0 +1,32 @@
+"""track mind map layout revisions
+
+Revision ID: e8f3a6c2d715
+Revises: c52e8b1d9a04
+Create Date: 2026-10-19 14:05:52.310448
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8f3a6c2d715'
+down_revision = 'c52e8b1d9a04'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('mind_map', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('layout_revision', sa.Integer(), nullable=True))
+
+    with op.batch_alter_table('mind_map_connection', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('revision', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('mind_map_connection', schema=None) as batch_op:
+        batch_op.drop_column('revision')
+
+    with op.batch_alter_table('mind_map', schema=None) as batch_op:
+        batch_op.drop_column('layout_revision')
@@ -0,0 +1,80 @@
+"""cluster assessment responses by assessment
+
+Revision ID: f2a9c4d8b316
+Revises: d41f7c2a8e53
+Create Date: 2026-10-19 20:31:05.118742
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a9c4d8b316'
+down_revision = 'd41f7c2a8e53'
+branch_labels = None
+depends_on = None
+
+COLUMNS = "assessment_id, question_ref_id, response_value, response_value_hash, created_at, updated_at"
+
+
+def upgrade():
+    op.rename_table('assessment_response', 'assessment_response_rowid')
+
+    # WITHOUT ROWID makes the primary key the table's own B-tree on SQLite
+    op.create_table('assessment_response',
+    sa.Column('assessment_id', sa.Integer(), nullable=False),
+    sa.Column('question_ref_id', sa.Integer(), nullable=False),
+    sa.Column('response_value', sa.Text(), nullable=True),
+    sa.Column('response_value_hash', sa.String(length=64), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['assessment_id'], ['assessment.id'], ),
+    sa.ForeignKeyConstraint(['question_ref_id'], ['question.id'], name='fk_assessment_response_question'),
+    sa.PrimaryKeyConstraint('assessment_id', 'question_ref_id', name='pk_assessment_response'),
+    sqlite_with_rowid=False
+    )
+
+    # Keep the most recently saved row where a question was answered twice
+    op.execute(
+        f"INSERT INTO assessment_response ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM assessment_response_rowid r "
+        "WHERE r.id = ("
+        "SELECT d.id FROM assessment_response_rowid d "
+        "WHERE d.assessment_id = r.assessment_id AND d.question_ref_id = r.question_ref_id "
+        "ORDER BY d.updated_at DESC, d.id DESC LIMIT 1"
+        ") ORDER BY assessment_id, question_ref_id"
+    )
+
+    op.drop_table('assessment_response_rowid')
+
+    if op.get_bind().dialect.name == 'postgresql':
+        # Postgres heaps have no clustered layout; rewrite once in key order
+        op.execute("CLUSTER assessment_response USING pk_assessment_response")
+        op.execute("ANALYZE assessment_response")
+
+
+def downgrade():
+    op.rename_table('assessment_response', 'assessment_response_clustered')
+
+    op.create_table('assessment_response',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('assessment_id', sa.Integer(), nullable=False),
+    sa.Column('question_ref_id', sa.Integer(), nullable=False),
+    sa.Column('response_value', sa.Text(), nullable=True),
+    sa.Column('response_value_hash', sa.String(length=64), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['assessment_id'], ['assessment.id'], ),
+    sa.ForeignKeyConstraint(['question_ref_id'], ['question.id'], name='fk_assessment_response_question'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    op.execute(
+        f"INSERT INTO assessment_response ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM assessment_response_clustered ORDER BY created_at, assessment_id, question_ref_id"
+    )
+
+    op.drop_table('assessment_response_clustered')
+
+    op.create_index('ix_assessment_response_assessment_question', 'assessment_response', ['assessment_id', 'question_ref_id'])
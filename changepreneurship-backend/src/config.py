@@ -0,0 +1,114 @@
+"""
+Database configuration - engine URL, pool settings and SQLite pragmas from the environment
+"""
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+DEFAULT_SQLITE_PATH = os.path.join(os.path.dirname(__file__), "database", "app.db")
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_RECYCLE = 1800
+DEFAULT_POOL_TIMEOUT = 30
+
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+
+# Negative cache_size is in KiB rather than pages
+DEFAULT_CACHE_SIZE = -20000
+
+DEFAULT_GROUP_COMMIT_WINDOW_MS = 5
+DEFAULT_GROUP_COMMIT_MAX_BATCH = 500
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+def database_url(environ=os.environ) -> str:
+    """DATABASE_URL, or the bundled SQLite file when it is not set.
+
+    Heroku/Render style ``postgres://`` URLs are rewritten to the
+    ``postgresql://`` scheme SQLAlchemy expects.
+    """
+    url = environ.get("DATABASE_URL", "").strip()
+    if not url:
+        return f"sqlite:///{DEFAULT_SQLITE_PATH}"
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+def sqlite_pragmas(environ=os.environ):
+    """PRAGMAs applied to every new SQLite connection, in order.
+
+    WAL lets readers proceed while a worker writes, NORMAL sync is safe
+    under WAL, and busy_timeout makes competing writers wait for the lock
+    instead of failing with "database is locked".
+    """
+    return (
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("busy_timeout", int(environ.get("SQLITE_BUSY_TIMEOUT_MS", DEFAULT_BUSY_TIMEOUT_MS))),
+        ("cache_size", int(environ.get("SQLITE_CACHE_SIZE", DEFAULT_CACHE_SIZE))),
+        ("mmap_size", int(environ.get("SQLITE_MMAP_SIZE", DEFAULT_MMAP_SIZE))),
+        ("temp_store", "MEMORY"),
+    )
+
+
+def engine_options(url: str, environ=os.environ) -> dict:
+    """SQLAlchemy engine options for the configured backend"""
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        busy_timeout = int(environ.get("SQLITE_BUSY_TIMEOUT_MS", DEFAULT_BUSY_TIMEOUT_MS))
+        # The driver's own lock timeout, in seconds, backs up busy_timeout
+        return {"connect_args": {"timeout": busy_timeout / 1000}}
+    return {
+        "pool_size": int(environ.get("DB_POOL_SIZE", DEFAULT_POOL_SIZE)),
+        "max_overflow": int(environ.get("DB_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW)),
+        "pool_recycle": int(environ.get("DB_POOL_RECYCLE", DEFAULT_POOL_RECYCLE)),
+        "pool_timeout": int(environ.get("DB_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT)),
+        "pool_pre_ping": True,
+    }
+
+
+def configure_database(app, db, environ=os.environ, apply_pragmas=True):
+    """Point ``db`` at the configured database and tune its engine.
+
+    Values already present in ``app.config`` (as in tests) win over the
+    environment.
+    """
+    app.config.setdefault("SQLALCHEMY_DATABASE_URI", database_url(environ))
+    app.config.setdefault("SQLALCHEMY_TRACK_MODIFICATIONS", False)
+    # Autosave writes go through src.services.group_commit when enabled
+    app.config.setdefault("GROUP_COMMIT_ENABLED", environ.get("GROUP_COMMIT_ENABLED", "").lower() in _TRUE_VALUES)
+    app.config.setdefault(
+        "GROUP_COMMIT_WINDOW_MS", float(environ.get("GROUP_COMMIT_WINDOW_MS", DEFAULT_GROUP_COMMIT_WINDOW_MS))
+    )
+    app.config.setdefault(
+        "GROUP_COMMIT_MAX_BATCH", int(environ.get("GROUP_COMMIT_MAX_BATCH", DEFAULT_GROUP_COMMIT_MAX_BATCH))
+    )
+    url = app.config["SQLALCHEMY_DATABASE_URI"]
+    options = engine_options(url, environ)
+    options.update(app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}))
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
+
+    database = make_url(url).database
+    if make_url(url).get_backend_name() == "sqlite" and database and database != ":memory:":
+        os.makedirs(os.path.dirname(os.path.abspath(database)), exist_ok=True)
+
+    db.init_app(app)
+
+    if apply_pragmas and make_url(url).get_backend_name() == "sqlite":
+        pragmas = sqlite_pragmas(environ)
+        with app.app_context():
+            event.listen(db.engine, "connect", lambda connection, _: _apply_pragmas(connection, pragmas))
+
+
+def _apply_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas:
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from flask import Flask, send_from_directory
 from flask_cors import CORS
 from flask_migrate import Migrate
+from src.config import configure_database
 from src.models.assessment import db
 from src.routes.user import user_bp
 from src.routes.auth import auth_bp
@@ -16,24 +17,30 @@ from src.routes.mind_mapping import mind_mapping_bp
 from src.routes.value_zone_validator import value_zone_bp
 from src.routes.ai_adoption_roadmap import ai_adoption_bp
 from src.routes.enhanced_assessment import enhanced_assessment_bp
+from src.routes.admin import admin_bp
+from src.utils.wire_format import WireFormatProvider, WireFormatRequest
 
 app = Flask(
     __name__,
     static_folder=os.path.join(os.path.dirname(__file__), "static")
 )
 
+app.json = WireFormatProvider(app)
+app.request_class = WireFormatRequest
+
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "changepreneurship-secret-key-2024-secure")
 
 DEFAULT_ORIGINS = "http://localhost:5173,https://changepreneurship-1.onrender.com"
 ALLOWED_ORIGINS = [o.strip() for o in os.environ.get("ALLOWED_ORIGINS", DEFAULT_ORIGINS).split(",") if o.strip()]
+ALLOWED_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
 
 CORS(
     app,
     resources={
         r"/api/*": {
             "origins": ALLOWED_ORIGINS,
-            "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"],
+            "methods": ALLOWED_METHODS,
+            "allow_headers": ["Content-Type", "Authorization", "X-Admin-Token"],
             "supports_credentials": True,
         }
     },
@@ -49,16 +56,14 @@ app.register_blueprint(mind_mapping_bp, url_prefix="/api/mind-mapping")
 app.register_blueprint(value_zone_bp, url_prefix="/api/value-zone")
 app.register_blueprint(ai_adoption_bp, url_prefix="/api/ai-adoption")
 app.register_blueprint(enhanced_assessment_bp, url_prefix="/api/enhanced-assessment")
+app.register_blueprint(admin_bp, url_prefix="/api/admin")
 
-db_path = os.path.join(os.path.dirname(__file__), "database", "app.db")
-app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-db.init_app(app)
+configure_database(app, db)
 migrate = Migrate(app, db)
 
 @app.route("/api/<path:any_path>", methods=["OPTIONS"])
 def cors_preflight(any_path):
-    return ("", 204)
+    return ("", 204, {"Allow": ", ".join(ALLOWED_METHODS)})
 
 @app.get("/", defaults={"path": ""})
 @app.get("/<path:path>")
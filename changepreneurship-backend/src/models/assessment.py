@@ -1,9 +1,31 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.ext.associationproxy import association_proxy
 from datetime import datetime
+import hashlib
 import json
 
+from src.utils.blob_codec import JSONBlob, pack_json_text, unpack_json_text
+from src.utils.json_provider import RawJSON
+
 db = SQLAlchemy()
 
+
+def content_hash(text):
+    """SHA-256 of a stored JSON/text column, used to spot unchanged writes"""
+    if text is None:
+        return None
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def encode_json(value):
+    """Compact JSON text, the form SQLite's json_patch() writes, so merged and rewritten values hash alike"""
+    return json.dumps(value, separators=(',', ':'))
+
+
+def project(serializers, fields=None):
+    """Build a to_dict result, computing only the keys in ``fields`` (all when None)"""
+    return {key: serialize() for key, serialize in serializers.items() if fields is None or key in fields}
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
@@ -23,8 +45,8 @@ class User(db.Model):
             'id': self.id,
             'username': self.username,
             'email': self.email,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'last_login': self.last_login.isoformat() if self.last_login else None
+            'created_at': self.created_at,
+            'last_login': self.last_login
         }
 
 class Assessment(db.Model):
@@ -38,7 +60,8 @@ class Assessment(db.Model):
     progress_percentage = db.Column(db.Float, default=0.0)
     
     # Store assessment data as JSON
-    assessment_data = db.Column(db.Text)  # JSON string
+    assessment_data = db.Column(JSONBlob)  # JSON string, compressed when large
+    assessment_data_hash = db.Column(db.String(64))  # content_hash of the JSON text
     
     # Relationships
     responses = db.relationship('AssessmentResponse', backref='assessment', lazy=True, cascade='all, delete-orphan')
@@ -48,36 +71,108 @@ class Assessment(db.Model):
     
     def get_assessment_data(self):
         if self.assessment_data:
-            return json.loads(self.assessment_data)
+            return json.loads(unpack_json_text(self.assessment_data))
         return {}
     
     def set_assessment_data(self, data):
-        self.assessment_data = json.dumps(data)
+        """Store ``data``; returns False without touching the row when it is unchanged"""
+        encoded = encode_json(data)
+        digest = content_hash(encoded)
+        if digest == (self.assessment_data_hash or content_hash(unpack_json_text(self.assessment_data))):
+            return False
+        self.assessment_data = pack_json_text(encoded)
+        self.assessment_data_hash = digest
+        return True
     
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'phase_id': self.phase_id,
-            'phase_name': self.phase_name,
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'is_completed': self.is_completed,
-            'progress_percentage': self.progress_percentage,
-            'assessment_data': self.get_assessment_data()
-        }
+    def get_raw_assessment_data(self):
+        """assessment_data as RawJSON, spliced into the response without decoding"""
+        text = unpack_json_text(self.assessment_data)
+        return RawJSON(text) if text else {}
+    
+    def to_dict(self, fields=None, raw_json=False):
+        """``fields`` limits the keys returned; ``raw_json`` passes stored JSON through as RawJSON"""
+        return project({
+            'id': lambda: self.id,
+            'user_id': lambda: self.user_id,
+            'phase_id': lambda: self.phase_id,
+            'phase_name': lambda: self.phase_name,
+            'started_at': lambda: self.started_at,
+            'completed_at': lambda: self.completed_at,
+            'is_completed': lambda: self.is_completed,
+            'progress_percentage': lambda: self.progress_percentage,
+            'assessment_data': self.get_raw_assessment_data if raw_json else self.get_assessment_data
+        }, fields)
 
-class AssessmentResponse(db.Model):
+class Question(db.Model):
+    """Question catalog shared by every response to the same question"""
+    __table_args__ = (
+        db.UniqueConstraint('phase_id', 'section_id', 'question_id', name='uq_question_key'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
-    assessment_id = db.Column(db.Integer, db.ForeignKey('assessment.id'), nullable=False)
+    phase_id = db.Column(db.String(50), nullable=False)
     section_id = db.Column(db.String(100), nullable=False)  # e.g., 'core_motivation', 'life_impact'
     question_id = db.Column(db.String(100), nullable=False)
+    
+    def __repr__(self):
+        return f'<Question {self.phase_id}/{self.section_id}/{self.question_id}>'
+
+class QuestionVersion(db.Model):
+    """One wording and response type of a catalog question.
+
+    Rows never change once written; a new wording or response type is
+    added as the question's next version.
+    """
+    __table_args__ = (
+        db.UniqueConstraint('question_ref_id', 'version', name='uq_question_version'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    question_ref_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1)
     question_text = db.Column(db.Text, nullable=False)
     response_type = db.Column(db.String(50), nullable=False)  # 'multiple_choice', 'text', 'scale', 'matrix'
+    
+    question = db.relationship('Question')
+    
+    def __repr__(self):
+        return f'<QuestionVersion {self.question_ref_id} v{self.version}>'
+
+def catalog_field(target, attr):
+    """Read-only proxy to a column of a response's shared catalog row"""
+    def read_only(*args):
+        raise AttributeError(f"{attr} belongs to the shared question catalog and cannot be set on a response")
+
+    def getset(collection_class, proxy):
+        return (lambda row: getattr(row, attr) if row is not None else None), read_only
+
+    return association_proxy(target, attr, creator=read_only, getset_factory=getset)
+
+class AssessmentResponse(db.Model):
+    # Keyed and, on SQLite, stored by assessment so one assessment's answers
+    # sit on a few neighbouring pages (CLUSTERed by the migration on Postgres)
+    __table_args__ = (
+        db.PrimaryKeyConstraint('assessment_id', 'question_ref_id', name='pk_assessment_response'),
+        {'sqlite_with_rowid': False},
+    )
+    
+    assessment_id = db.Column(db.Integer, db.ForeignKey('assessment.id'), nullable=False)
+    question_ref_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False)
+    question_version_id = db.Column(db.Integer, db.ForeignKey('question_version.id'), nullable=False)  # wording answered
     response_value = db.Column(db.Text)  # JSON string for complex responses
+    response_value_hash = db.Column(db.String(64))  # content_hash(response_value)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    question = db.relationship('Question', lazy='joined', innerjoin=True)
+    wording = db.relationship('QuestionVersion', lazy='joined', innerjoin=True)
+    
+    # Read through to the catalog rows, which other responses share
+    section_id = catalog_field('question', 'section_id')
+    question_id = catalog_field('question', 'question_id')
+    question_text = catalog_field('wording', 'question_text')
+    response_type = catalog_field('wording', 'response_type')
+    
     def __repr__(self):
         return f'<Response {self.question_id} for Assessment {self.assessment_id}>'
     
@@ -91,24 +186,42 @@ class AssessmentResponse(db.Model):
                 return self.response_value
         return None
     
-    def set_response_value(self, value):
+    @staticmethod
+    def encode_response_value(value):
         if isinstance(value, (dict, list)):
-            self.response_value = json.dumps(value)
-        else:
-            self.response_value = str(value)
+            return json.dumps(value)
+        return str(value)
     
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'assessment_id': self.assessment_id,
-            'section_id': self.section_id,
-            'question_id': self.question_id,
-            'question_text': self.question_text,
-            'response_type': self.response_type,
-            'response_value': self.get_response_value(),
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def set_response_value(self, value):
+        self.response_value = self.encode_response_value(value)
+        self.response_value_hash = content_hash(self.response_value)
+    
+    def matches(self, question_text, response_type, value_hash):
+        """Whether saving these values again would change nothing"""
+        stored_hash = self.response_value_hash or content_hash(self.response_value)
+        return (
+            stored_hash == value_hash
+            and self.question_text == question_text
+            and self.response_type == response_type
+        )
+    
+    @property
+    def key(self):
+        """Stable id of this answer: assessment, section and question, which rewording does not change"""
+        return f'{self.assessment_id}/{self.section_id}/{self.question_id}'
+    
+    def to_dict(self, fields=None):
+        return project({
+            'id': lambda: self.key,
+            'assessment_id': lambda: self.assessment_id,
+            'section_id': lambda: self.section_id,
+            'question_id': lambda: self.question_id,
+            'question_text': lambda: self.question_text,
+            'response_type': lambda: self.response_type,
+            'response_value': self.get_response_value,
+            'created_at': lambda: self.created_at,
+            'updated_at': lambda: self.updated_at
+        }, fields)
 
 class EntrepreneurProfile(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -121,28 +234,28 @@ class EntrepreneurProfile(db.Model):
     confidence_level = db.Column(db.Float)
     
     # Idea Discovery Results
-    primary_opportunity = db.Column(db.Text)  # JSON
+    primary_opportunity = db.Column(JSONBlob)  # JSON
     opportunity_score = db.Column(db.Float)
-    skills_assessment = db.Column(db.Text)  # JSON
+    skills_assessment = db.Column(JSONBlob)  # JSON
     
     # Market Research Results
-    market_analysis = db.Column(db.Text)  # JSON
-    competitive_analysis = db.Column(db.Text)  # JSON
-    target_customers = db.Column(db.Text)  # JSON
+    market_analysis = db.Column(JSONBlob)  # JSON
+    competitive_analysis = db.Column(JSONBlob)  # JSON
+    target_customers = db.Column(JSONBlob)  # JSON
     
     # Business Planning Results
-    business_model = db.Column(db.Text)  # JSON
-    financial_projections = db.Column(db.Text)  # JSON
-    go_to_market_strategy = db.Column(db.Text)  # JSON
+    business_model = db.Column(JSONBlob)  # JSON
+    financial_projections = db.Column(JSONBlob)  # JSON
+    go_to_market_strategy = db.Column(JSONBlob)  # JSON
     
     # Implementation & Testing Results
-    product_concept_results = db.Column(db.Text)  # JSON
-    business_development_plan = db.Column(db.Text)  # JSON
-    prototype_testing_results = db.Column(db.Text)  # JSON
+    product_concept_results = db.Column(JSONBlob)  # JSON
+    business_development_plan = db.Column(JSONBlob)  # JSON
+    prototype_testing_results = db.Column(JSONBlob)  # JSON
     
     # AI Analysis Results
     success_probability = db.Column(db.Float)
-    ai_recommendations = db.Column(db.Text)  # JSON
+    ai_recommendations = db.Column(JSONBlob)  # JSON
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -157,42 +270,49 @@ class EntrepreneurProfile(db.Model):
         field_value = getattr(self, field_name)
         if field_value:
             try:
-                return json.loads(field_value)
+                return json.loads(unpack_json_text(field_value))
             except json.JSONDecodeError:
                 return {}
         return {}
     
+    def get_raw_json_field(self, field_name):
+        """A JSON field as RawJSON, spliced into the response without decoding"""
+        text = unpack_json_text(getattr(self, field_name))
+        return RawJSON(text) if text else {}
+    
     def set_json_field(self, field_name, value):
         if isinstance(value, (dict, list)):
-            setattr(self, field_name, json.dumps(value))
+            setattr(self, field_name, pack_json_text(encode_json(value)))
         else:
-            setattr(self, field_name, json.dumps({}))
+            setattr(self, field_name, encode_json({}))
     
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'entrepreneur_archetype': self.entrepreneur_archetype,
-            'core_motivation': self.core_motivation,
-            'risk_tolerance': self.risk_tolerance,
-            'confidence_level': self.confidence_level,
-            'primary_opportunity': self.get_json_field('primary_opportunity'),
-            'opportunity_score': self.opportunity_score,
-            'skills_assessment': self.get_json_field('skills_assessment'),
-            'market_analysis': self.get_json_field('market_analysis'),
-            'competitive_analysis': self.get_json_field('competitive_analysis'),
-            'target_customers': self.get_json_field('target_customers'),
-            'business_model': self.get_json_field('business_model'),
-            'financial_projections': self.get_json_field('financial_projections'),
-            'go_to_market_strategy': self.get_json_field('go_to_market_strategy'),
-            'product_concept_results': self.get_json_field('product_concept_results'),
-            'business_development_plan': self.get_json_field('business_development_plan'),
-            'prototype_testing_results': self.get_json_field('prototype_testing_results'),
-            'success_probability': self.success_probability,
-            'ai_recommendations': self.get_json_field('ai_recommendations'),
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def to_dict(self, fields=None, raw_json=False):
+        """``fields`` limits the keys returned; ``raw_json`` passes stored JSON through as RawJSON"""
+        json_field = self.get_raw_json_field if raw_json else self.get_json_field
+        return project({
+            'id': lambda: self.id,
+            'user_id': lambda: self.user_id,
+            'entrepreneur_archetype': lambda: self.entrepreneur_archetype,
+            'core_motivation': lambda: self.core_motivation,
+            'risk_tolerance': lambda: self.risk_tolerance,
+            'confidence_level': lambda: self.confidence_level,
+            'primary_opportunity': lambda: json_field('primary_opportunity'),
+            'opportunity_score': lambda: self.opportunity_score,
+            'skills_assessment': lambda: json_field('skills_assessment'),
+            'market_analysis': lambda: json_field('market_analysis'),
+            'competitive_analysis': lambda: json_field('competitive_analysis'),
+            'target_customers': lambda: json_field('target_customers'),
+            'business_model': lambda: json_field('business_model'),
+            'financial_projections': lambda: json_field('financial_projections'),
+            'go_to_market_strategy': lambda: json_field('go_to_market_strategy'),
+            'product_concept_results': lambda: json_field('product_concept_results'),
+            'business_development_plan': lambda: json_field('business_development_plan'),
+            'prototype_testing_results': lambda: json_field('prototype_testing_results'),
+            'success_probability': lambda: self.success_probability,
+            'ai_recommendations': lambda: json_field('ai_recommendations'),
+            'created_at': lambda: self.created_at,
+            'updated_at': lambda: self.updated_at
+        }, fields)
 
 class UserSession(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -216,8 +336,208 @@ class UserSession(db.Model):
             'id': self.id,
             'user_id': self.user_id,
             'session_token': self.session_token,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'expires_at': self.expires_at.isoformat() if self.expires_at else None,
+            'created_at': self.created_at,
+            'expires_at': self.expires_at,
             'is_active': self.is_active,
             'is_expired': self.is_expired()
-        }
\ No newline at end of file
+        }
+
+class EnhancedAssessment(db.Model):
+    id = db.Column(db.String(36), primary_key=True)  # uuid4 issued by the engine
+    user_id = db.Column(db.Integer, index=True)
+    assessment_type = db.Column(db.String(50), default='comprehensive')
+    current_phase = db.Column(db.Integer, default=1)
+    completion_status = db.Column(db.String(20), default='in_progress')
+
+    # Per-phase results and scores as JSON keyed by phase number
+    phase_results = db.Column(db.Text)
+    phase_scores = db.Column(db.Text)
+
+    # Running totals maintained by EnhancedAssessmentEngine.apply_phase_result
+    weighted_score_sum = db.Column(db.Float, default=0.0)
+    weight_total = db.Column(db.Float, default=0.0)
+    overall_score = db.Column(db.Float, default=0.0)
+
+    final_results = db.Column(db.Text)  # JSON
+    started_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f'<EnhancedAssessment {self.id} for User {self.user_id}>'
+
+    def get_phase_results(self):
+        if self.phase_results:
+            return {int(phase): result for phase, result in json.loads(self.phase_results).items()}
+        return {}
+
+    def get_phase_scores(self):
+        if self.phase_scores:
+            return {int(phase): score for phase, score in json.loads(self.phase_scores).items()}
+        return {}
+
+    def get_final_results(self):
+        if self.final_results:
+            return json.loads(self.final_results)
+        return None
+
+    def to_dict(self):
+        phase_scores = self.get_phase_scores()
+        data = {
+            'id': self.id,
+            'user_id': self.user_id,
+            'type': self.assessment_type,
+            'started_at': self.started_at,
+            'current_phase': self.current_phase,
+            'phase_progress': {phase: 100 if phase in phase_scores else 0 for phase in range(1, 8)},
+            'phase_results': self.get_phase_results(),
+            'phase_scores': phase_scores,
+            'overall_score': round(self.overall_score or 0, 2),
+            'recommendations': [],
+            'next_steps': [],
+            'completion_status': self.completion_status,
+            'completed_at': self.completed_at,
+        }
+        final_results = self.get_final_results()
+        if final_results is not None:
+            data['final_results'] = final_results
+            data['next_steps'] = final_results.get('next_steps', [])
+        return data
+
+
+class MindMap(db.Model):
+    id = db.Column(db.String(36), primary_key=True)  # uuid4 issued by MindMappingTool
+    user_id = db.Column(db.Integer, index=True)
+    business_idea = db.Column(db.Text)
+
+    # Bumped on every edit; nodes record the revision that last touched them
+    revision = db.Column(db.Integer, default=0, nullable=False)
+    layout_revision = db.Column(db.Integer)  # map revision of the last server layout
+
+    # JSON {category: count}, maintained incrementally as answers change
+    element_counts = db.Column(db.Text)
+    completed_counts = db.Column(db.Text)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    nodes = db.relationship('MindMapNode', backref='mind_map', lazy='dynamic', cascade='all, delete-orphan')
+    connections = db.relationship('MindMapConnection', backref='mind_map', lazy='dynamic', cascade='all, delete-orphan')
+    scenarios = db.relationship('MindMapScenario', backref='mind_map', lazy='dynamic', cascade='all, delete-orphan')
+
+    def __repr__(self):
+        return f'<MindMap {self.id} for User {self.user_id}>'
+
+    def get_element_counts(self):
+        return json.loads(self.element_counts) if self.element_counts else {}
+
+    def get_completed_counts(self):
+        return json.loads(self.completed_counts) if self.completed_counts else {}
+
+    def adjust_completed(self, category, delta):
+        counts = self.get_completed_counts()
+        counts[category] = counts.get(category, 0) + delta
+        self.completed_counts = json.dumps(counts)
+
+    def completion_status(self):
+        totals = self.get_element_counts()
+        completed = self.get_completed_counts()
+        status = {
+            category: round(100 * completed.get(category, 0) / total) if total else 0
+            for category, total in totals.items()
+        }
+        overall_total = sum(totals.values())
+        status['overall'] = round(100 * sum(completed.values()) / overall_total) if overall_total else 0
+        return status
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'business_idea': self.business_idea,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'revision': self.revision,
+            'completion_status': self.completion_status(),
+        }
+
+
+class MindMapNode(db.Model):
+    mind_map_id = db.Column(db.String(36), db.ForeignKey('mind_map.id'), primary_key=True)
+    node_id = db.Column(db.String(64), primary_key=True)  # e.g., 'category_1', 'element_2'
+    sort_order = db.Column(db.Integer, nullable=False)  # keyset for paged loads
+    node_type = db.Column(db.String(20), nullable=False)  # 'category' or 'element'
+    label = db.Column(db.String(200))
+    category = db.Column(db.String(50))
+    question = db.Column(db.Text)
+    answer = db.Column(db.Text)
+    x = db.Column(db.Float, default=0.0)
+    y = db.Column(db.Float, default=0.0)
+    completed = db.Column(db.Boolean, default=False)
+    parent_id = db.Column(db.String(64))
+    children = db.Column(db.Text)  # JSON list of child node ids
+    revision = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (db.Index('ix_mind_map_node_order', 'mind_map_id', 'sort_order'),)
+
+    def __repr__(self):
+        return f'<MindMapNode {self.node_id} in MindMap {self.mind_map_id}>'
+
+    def to_dict(self):
+        data = {
+            'id': self.node_id,
+            'type': self.node_type,
+            'label': self.label,
+            'position': {'x': self.x, 'y': self.y},
+            'completed': bool(self.completed),
+        }
+        if self.node_type == 'category':
+            data['category'] = self.category
+            data['children'] = json.loads(self.children) if self.children else []
+        else:
+            data['question'] = self.question
+            data['answer'] = self.answer or ''
+            data['parent'] = self.parent_id
+        return data
+
+
+class MindMapConnection(db.Model):
+    id = db.Column(db.String(36), primary_key=True)
+    mind_map_id = db.Column(db.String(36), db.ForeignKey('mind_map.id'), nullable=False, index=True)
+    source_node = db.Column(db.String(64), nullable=False)
+    target_node = db.Column(db.String(64), nullable=False)
+    connection_type = db.Column(db.String(50))
+    description = db.Column(db.Text)
+    strength = db.Column(db.Float)
+    revision = db.Column(db.Integer, default=0, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<MindMapConnection {self.source_node} -> {self.target_node}>'
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'source': self.source_node,
+            'target': self.target_node,
+            'type': self.connection_type,
+            'description': self.description,
+            'strength': self.strength,
+            'created_at': self.created_at,
+        }
+
+
+class MindMapScenario(db.Model):
+    id = db.Column(db.String(36), primary_key=True)
+    mind_map_id = db.Column(db.String(36), db.ForeignKey('mind_map.id'), nullable=False, index=True)
+    name = db.Column(db.String(200))
+    scenario_type = db.Column(db.String(50))
+    scenario_data = db.Column(db.Text)  # JSON scenario as built by MindMappingTool.create_scenario
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<MindMapScenario {self.name} in MindMap {self.mind_map_id}>'
+
+    def to_dict(self):
+        return json.loads(self.scenario_data) if self.scenario_data else {}
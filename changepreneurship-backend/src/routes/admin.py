@@ -0,0 +1,106 @@
+"""
+Admin API Routes
+Operational endpoints, enabled only when ADMIN_API_TOKEN is set and
+authenticated with the X-Admin-Token header
+"""
+import hmac
+import os
+import time
+from collections import Counter
+
+from flask import Blueprint, request, jsonify
+
+from src.models.assessment import db, EnhancedAssessment
+from src.routes.enhanced_assessment import enhanced_assessment_engine
+from src.services.assessment_scoring import readiness_label
+from src.services.plan_export import section_cache
+from src.utils.result_cache import analysis_cache
+
+DEFAULT_RESCORE_CHUNK = 2000
+MAX_RESCORE_CHUNK = 20000
+
+admin_bp = Blueprint('admin', __name__)
+
+
+@admin_bp.before_request
+def require_admin_token():
+    expected = os.environ.get("ADMIN_API_TOKEN")
+    if not expected:
+        return jsonify({"success": False, "error": "Admin API is disabled"}), 403
+    provided = request.headers.get("X-Admin-Token", "")
+    if not hmac.compare_digest(provided.encode(), expected.encode()):
+        return jsonify({"success": False, "error": "Invalid admin token"}), 401
+    return None
+
+
+@admin_bp.route('/cache-stats', methods=['GET'])
+def get_cache_stats():
+    """Hit rates and sizes of the in-process result caches"""
+    return jsonify({
+        "success": True,
+        "data": {
+            "analysis": analysis_cache.stats(),
+            "plan_sections": section_cache.stats(),
+        },
+    })
+
+
+@admin_bp.route('/cache-clear', methods=['POST'])
+def clear_caches():
+    analysis_cache.clear()
+    section_cache.clear()
+    return jsonify({"success": True})
+
+
+@admin_bp.route('/rescore', methods=['POST'])
+def rescore_assessments():
+    """Re-score every stored enhanced assessment with the current weights.
+
+    ``dry_run`` reports the outcome without writing, and is the only mode
+    that accepts custom ``weights`` (phase number -> weight) so a what-if
+    run cannot leave stored scores out of step with the live weights.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        dry_run = bool(data.get('dry_run', False))
+        weights = data.get('weights')
+        if weights and not dry_run:
+            return jsonify({"success": False, "error": "Custom weights require dry_run"}), 400
+        chunk_size = min(max(int(data.get('chunk_size', DEFAULT_RESCORE_CHUNK)), 1), MAX_RESCORE_CHUNK)
+
+        started = time.perf_counter()
+        rescored = 0
+        overall_total = 0.0
+        readiness = Counter()
+        last_id = None
+        while True:
+            query = EnhancedAssessment.query.order_by(EnhancedAssessment.id)
+            if last_id is not None:
+                query = query.filter(EnhancedAssessment.id > last_id)
+            records = query.limit(chunk_size).all()
+            if not records:
+                break
+
+            last_id = records[-1].id
+            batch = enhanced_assessment_engine.rescore_records(records, weights, persist=not dry_run)
+            if not dry_run:
+                db.session.commit()
+            db.session.expunge_all()
+
+            rescored += len(records)
+            overall_total += float(batch['overall_score'].sum())
+            readiness.update(readiness_label(level) for level in batch['readiness_level'].tolist())
+
+        return jsonify({
+            "success": True,
+            "data": {
+                "rescored": rescored,
+                "dry_run": dry_run,
+                "mean_overall_score": round(overall_total / rescored, 2) if rescored else 0,
+                "readiness_distribution": dict(readiness),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            },
+        })
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"success": False, "error": str(e)}), 400
@@ -2,214 +2,377 @@ from flask import Blueprint, request, jsonify, session
 from datetime import datetime, timedelta
 import json
 import uuid
+from src.utils.catalog import freeze
+from src.utils.result_cache import analysis_cache
+from src.services.roadmap_planning import (
+    DEFAULT_MAX_PER_PHASE,
+    DEFAULT_PHASE_BUDGET,
+    DEFAULT_TIME_LIMIT_MS,
+    MAX_TIME_LIMIT_MS,
+    pack_phases,
+    schedule_initiatives,
+)
 
 ai_adoption_bp = Blueprint('ai_adoption', __name__)
 
+# Bump when readiness or opportunity output changes for the same input
+ENGINE_VERSION = "1"
+
+AI_CATEGORIES = freeze({
+    "automation": {
+        "name": "Process Automation",
+        "description": "Automate repetitive tasks and workflows",
+        "examples": [
+            "Customer service chatbots",
+            "Invoice processing",
+            "Data entry automation",
+        ],
+        "complexity": "Low",
+        "roi_timeline": "3-6 months",
+    },
+    "analytics": {
+        "name": "Data Analytics & Insights",
+        "description": "Extract insights from business data",
+        "examples": [
+            "Customer behavior analysis",
+            "Sales forecasting",
+            "Market trend analysis",
+        ],
+        "complexity": "Medium",
+        "roi_timeline": "6-12 months",
+    },
+    "personalization": {
+        "name": "Personalization & Recommendations",
+        "description": "Deliver personalized experiences to customers",
+        "examples": [
+            "Product recommendations",
+            "Content personalization",
+            "Dynamic pricing",
+        ],
+        "complexity": "Medium",
+        "roi_timeline": "6-18 months",
+    },
+    "prediction": {
+        "name": "Predictive Analytics",
+        "description": "Predict future outcomes and trends",
+        "examples": [
+            "Demand forecasting",
+            "Risk assessment",
+            "Maintenance prediction",
+        ],
+        "complexity": "High",
+        "roi_timeline": "12-24 months",
+    },
+    "generation": {
+        "name": "Content & Code Generation",
+        "description": "Generate content, code, and creative assets",
+        "examples": [
+            "Marketing copy",
+            "Code generation",
+            "Design assets",
+        ],
+        "complexity": "Medium",
+        "roi_timeline": "3-9 months",
+    },
+    "optimization": {
+        "name": "Business Optimization",
+        "description": "Optimize business processes and decisions",
+        "examples": [
+            "Supply chain optimization",
+            "Resource allocation",
+            "Pricing optimization",
+        ],
+        "complexity": "High",
+        "roi_timeline": "12-36 months",
+    },
+})
+
+INDUSTRY_AI_OPPORTUNITIES = freeze({
+    "E-commerce": {
+        "high_impact": ["personalization", "analytics", "automation"],
+        "medium_impact": ["prediction", "generation"],
+        "low_impact": ["optimization"],
+    },
+    "Healthcare": {
+        "high_impact": ["prediction", "analytics", "automation"],
+        "medium_impact": ["personalization", "optimization"],
+        "low_impact": ["generation"],
+    },
+    "Education": {
+        "high_impact": ["personalization", "generation", "analytics"],
+        "medium_impact": ["automation", "prediction"],
+        "low_impact": ["optimization"],
+    },
+    "Finance": {
+        "high_impact": ["prediction", "analytics", "automation"],
+        "medium_impact": ["optimization", "personalization"],
+        "low_impact": ["generation"],
+    },
+    "Manufacturing": {
+        "high_impact": ["optimization", "prediction", "automation"],
+        "medium_impact": ["analytics"],
+        "low_impact": ["personalization", "generation"],
+    },
+    "Retail": {
+        "high_impact": ["personalization", "analytics", "prediction"],
+        "medium_impact": ["automation", "generation"],
+        "low_impact": ["optimization"],
+    },
+})
+
+AI_VENDORS = freeze({
+    "automation": [
+        {"name": "UiPath", "type": "RPA", "complexity": "Medium", "cost": "$$"},
+        {
+            "name": "Zapier",
+            "type": "Workflow",
+            "complexity": "Low",
+            "cost": " $",
+        },
+        {
+            "name": "Microsoft Power Automate",
+            "type": "Workflow",
+            "complexity": "Low",
+            "cost": "$",
+        },
+    ],
+    "analytics": [
+        {"name": "Tableau", "type": "BI", "complexity": "Medium", "cost": "$$$"},
+        {
+            "name": "Google Analytics Intelligence",
+            "type": "Web Analytics",
+            "complexity": "Low",
+            "cost": "$",
+        },
+        {
+            "name": "IBM Watson Analytics",
+            "type": "Advanced Analytics",
+            "complexity": "High",
+            "cost": "$$$",
+        },
+    ],
+    "generation": [
+        {"name": "OpenAI GPT", "type": "Text Generation", "complexity": "Low", "cost": "$$"},
+        {
+            "name": "Jasper AI",
+            "type": "Marketing Content",
+            "complexity": "Low",
+            "cost": "$$",
+        },
+        {
+            "name": "GitHub Copilot",
+            "type": "Code Generation",
+            "complexity": "Medium",
+            "cost": "$",
+        },
+    ],
+})
+
+DATA_STRATEGY_COMPONENTS = freeze({
+    "collection": {
+        "name": "Data Collection",
+        "description": "Systematic gathering of relevant business data",
+        "key_areas": [
+            "Customer data",
+            "Operational data",
+            "Market data",
+            "Financial data",
+        ],
+    },
+    "storage": {
+        "name": "Data Storage & Management",
+        "description": "Secure and scalable data storage solutions",
+        "key_areas": [
+            "Cloud storage",
+            "Data warehousing",
+            "Data lakes",
+            "Security protocols",
+        ],
+    },
+    "processing": {
+        "name": "Data Processing & Cleaning",
+        "description": "Preparing data for analysis and AI applications",
+        "key_areas": [
+            "Data cleaning",
+            "ETL processes",
+            "Data validation",
+            "Quality assurance",
+        ],
+    },
+    "analysis": {
+        "name": "Data Analysis & Insights",
+        "description": "Extracting actionable insights from data",
+        "key_areas": [
+            "Statistical analysis",
+            "Machine learning",
+            "Visualization",
+            "Reporting",
+        ],
+    },
+    "governance": {
+        "name": "Data Governance",
+        "description": "Policies and procedures for data management",
+        "key_areas": [
+            "Privacy compliance",
+            "Access controls",
+            "Data lineage",
+            "Audit trails",
+        ],
+    },
+})
+
+AI_ALIGNED_GOALS = (
+    'efficiency_improvement',
+    'customer_experience_enhancement',
+    'data_driven_decisions',
+    'automation',
+    'innovation',
+)
+
+IMPACT_SCORES = freeze({"High": 9, "Medium": 6, "Low": 3})
+
+COMPLEXITY_FEASIBILITY = freeze({"Low": 8, "Medium": 6, "High": 4})
+
+IMPLEMENTATION_BASE_COSTS = freeze({
+    "automation": {"small": 5000, "medium": 25000, "large": 100000},
+    "analytics": {"small": 10000, "medium": 50000, "large": 200000},
+    "personalization": {"small": 15000, "medium": 75000, "large": 300000},
+    "prediction": {"small": 20000, "medium": 100000, "large": 500000},
+    "generation": {"small": 3000, "medium": 15000, "large": 75000},
+    "optimization": {"small": 25000, "medium": 125000, "large": 600000},
+})
+
+AI_CATEGORY_BENEFITS = freeze({
+    "automation": [
+        "Reduced operational costs",
+        "Improved efficiency",
+        "Fewer human errors",
+        "24/7 availability",
+    ],
+    "analytics": [
+        "Better decision making",
+        "Improved customer insights",
+        "Optimized operations",
+        "Competitive advantage",
+    ],
+    "personalization": [
+        "Increased customer satisfaction",
+        "Higher conversion rates",
+        "Improved customer retention",
+        "Enhanced user experience",
+    ],
+    "prediction": [
+        "Better planning and forecasting",
+        "Risk mitigation",
+        "Optimized resource allocation",
+        "Proactive problem solving",
+    ],
+    "generation": [
+        "Faster content creation",
+        "Consistent quality",
+        "Reduced creative costs",
+        "Scalable content production",
+    ],
+    "optimization": [
+        "Improved efficiency",
+        "Cost reduction",
+        "Better resource utilization",
+        "Enhanced performance",
+    ],
+})
+
+AI_CATEGORY_METRICS = freeze({
+    "automation": ["Process completion time", "Error reduction rate", "Cost savings"],
+    "analytics": ["Decision accuracy", "Insight generation rate", "Business impact"],
+    "personalization": ["Engagement rate", "Conversion rate", "Customer satisfaction"],
+    "prediction": ["Prediction accuracy", "Planning effectiveness", "Risk reduction"],
+    "generation": ["Content quality score", "Production speed", "Cost per asset"],
+    "optimization": ["Efficiency improvement", "Cost reduction", "Performance gains"],
+})
+
+IMPLEMENTATION_STEPS = (
+    "Define specific use cases and requirements",
+    "Evaluate and select appropriate AI tools/vendors",
+    "Prepare data and infrastructure",
+    "Develop pilot implementation",
+    "Test and validate results",
+    "Scale successful implementations",
+    "Monitor and optimize performance",
+)
+
+COMPLEXITY_DURATION_MONTHS = freeze({"High": 6, "Medium": 4, "Low": 2})
+
+# Foundational categories that must finish before advanced ones start
+FOUNDATION_CATEGORIES = ("automation", "analytics")
+ADVANCED_CATEGORIES = ("prediction", "optimization")
+
+DEFAULT_MAX_PARALLEL = 3
+
+PAIN_POINT_CATEGORIES = freeze({
+    "manual_processes": "automation",
+    "poor_customer_insights": "analytics",
+    "low_engagement": "personalization",
+    "unpredictable_demand": "prediction",
+    "content_creation_bottleneck": "generation",
+    "inefficient_operations": "optimization",
+})
+
+
+DEFAULT_IMPLEMENTATION_COST = 10000
+
+DEFAULT_CATEGORY_BENEFITS = ("Improved business performance",)
+
+DEFAULT_CATEGORY_METRICS = ("ROI", "User satisfaction", "Performance improvement")
+
+
+def _opportunity_template(ai_category, impact_level):
+    """Everything about an opportunity that does not depend on the business profile"""
+    category_info = AI_CATEGORIES[ai_category]
+    return freeze({
+        "fields": {
+            "category": ai_category,
+            "name": category_info["name"],
+            "description": category_info["description"],
+            "examples": category_info["examples"],
+            "impact_level": impact_level,
+            "impact_score": IMPACT_SCORES.get(impact_level, 5),
+            "complexity": category_info["complexity"],
+            "roi_timeline": category_info["roi_timeline"],
+            "potential_benefits": AI_CATEGORY_BENEFITS.get(ai_category, DEFAULT_CATEGORY_BENEFITS),
+            "implementation_steps": IMPLEMENTATION_STEPS,
+            "success_metrics": AI_CATEGORY_METRICS.get(ai_category, DEFAULT_CATEGORY_METRICS),
+        },
+        "impact_score": IMPACT_SCORES.get(impact_level, 5),
+        "feasibility_base": COMPLEXITY_FEASIBILITY.get(category_info["complexity"], 5),
+        "costs": IMPLEMENTATION_BASE_COSTS.get(ai_category, {}),
+    })
+
+
+# One shared template per (category, impact level), built at import time
+OPPORTUNITY_TEMPLATES = freeze({
+    (ai_category, impact_level): _opportunity_template(ai_category, impact_level)
+    for ai_category in AI_CATEGORIES
+    for impact_level in IMPACT_SCORES
+})
+
+# High-impact then medium-impact templates per industry, in catalog order
+INDUSTRY_OPPORTUNITY_TEMPLATES = freeze({
+    industry: tuple(
+        OPPORTUNITY_TEMPLATES[(ai_category, impact_level)]
+        for key, impact_level in (("high_impact", "High"), ("medium_impact", "Medium"))
+        for ai_category in levels.get(key, ())
+        if ai_category in AI_CATEGORIES
+    )
+    for industry, levels in INDUSTRY_AI_OPPORTUNITIES.items()
+})
+
 
 class AIAdoptionRoadmap:
     def __init__(self):
-        self.ai_categories = {
-            "automation": {
-                "name": "Process Automation",
-                "description": "Automate repetitive tasks and workflows",
-                "examples": [
-                    "Customer service chatbots",
-                    "Invoice processing",
-                    "Data entry automation",
-                ],
-                "complexity": "Low",
-                "roi_timeline": "3-6 months",
-            },
-            "analytics": {
-                "name": "Data Analytics & Insights",
-                "description": "Extract insights from business data",
-                "examples": [
-                    "Customer behavior analysis",
-                    "Sales forecasting",
-                    "Market trend analysis",
-                ],
-                "complexity": "Medium",
-                "roi_timeline": "6-12 months",
-            },
-            "personalization": {
-                "name": "Personalization & Recommendations",
-                "description": "Deliver personalized experiences to customers",
-                "examples": [
-                    "Product recommendations",
-                    "Content personalization",
-                    "Dynamic pricing",
-                ],
-                "complexity": "Medium",
-                "roi_timeline": "6-18 months",
-            },
-            "prediction": {
-                "name": "Predictive Analytics",
-                "description": "Predict future outcomes and trends",
-                "examples": [
-                    "Demand forecasting",
-                    "Risk assessment",
-                    "Maintenance prediction",
-                ],
-                "complexity": "High",
-                "roi_timeline": "12-24 months",
-            },
-            "generation": {
-                "name": "Content & Code Generation",
-                "description": "Generate content, code, and creative assets",
-                "examples": [
-                    "Marketing copy",
-                    "Code generation",
-                    "Design assets",
-                ],
-                "complexity": "Medium",
-                "roi_timeline": "3-9 months",
-            },
-            "optimization": {
-                "name": "Business Optimization",
-                "description": "Optimize business processes and decisions",
-                "examples": [
-                    "Supply chain optimization",
-                    "Resource allocation",
-                    "Pricing optimization",
-                ],
-                "complexity": "High",
-                "roi_timeline": "12-36 months",
-            },
-        }
-
-        self.industry_ai_opportunities = {
-            "E-commerce": {
-                "high_impact": ["personalization", "analytics", "automation"],
-                "medium_impact": ["prediction", "generation"],
-                "low_impact": ["optimization"],
-            },
-            "Healthcare": {
-                "high_impact": ["prediction", "analytics", "automation"],
-                "medium_impact": ["personalization", "optimization"],
-                "low_impact": ["generation"],
-            },
-            "Education": {
-                "high_impact": ["personalization", "generation", "analytics"],
-                "medium_impact": ["automation", "prediction"],
-                "low_impact": ["optimization"],
-            },
-            "Finance": {
-                "high_impact": ["prediction", "analytics", "automation"],
-                "medium_impact": ["optimization", "personalization"],
-                "low_impact": ["generation"],
-            },
-            "Manufacturing": {
-                "high_impact": ["optimization", "prediction", "automation"],
-                "medium_impact": ["analytics"],
-                "low_impact": ["personalization", "generation"],
-            },
-            "Retail": {
-                "high_impact": ["personalization", "analytics", "prediction"],
-                "medium_impact": ["automation", "generation"],
-                "low_impact": ["optimization"],
-            },
-        }
-
-        self.ai_vendors = {
-            "automation": [
-                {"name": "UiPath", "type": "RPA", "complexity": "Medium", "cost": "$$"},
-                {
-                    "name": "Zapier",
-                    "type": "Workflow",
-                    "complexity": "Low",
-                    "cost": " $",
-                },
-                {
-                    "name": "Microsoft Power Automate",
-                    "type": "Workflow",
-                    "complexity": "Low",
-                    "cost": "$",
-                },
-            ],
-            "analytics": [
-                {"name": "Tableau", "type": "BI", "complexity": "Medium", "cost": "$$$"},
-                {
-                    "name": "Google Analytics Intelligence",
-                    "type": "Web Analytics",
-                    "complexity": "Low",
-                    "cost": "$",
-                },
-                {
-                    "name": "IBM Watson Analytics",
-                    "type": "Advanced Analytics",
-                    "complexity": "High",
-                    "cost": "$$$",
-                },
-            ],
-            "generation": [
-                {"name": "OpenAI GPT", "type": "Text Generation", "complexity": "Low", "cost": "$$"},
-                {
-                    "name": "Jasper AI",
-                    "type": "Marketing Content",
-                    "complexity": "Low",
-                    "cost": "$$",
-                },
-                {
-                    "name": "GitHub Copilot",
-                    "type": "Code Generation",
-                    "complexity": "Medium",
-                    "cost": "$",
-                },
-            ],
-        }
-
-        self.data_strategy_components = {
-            "collection": {
-                "name": "Data Collection",
-                "description": "Systematic gathering of relevant business data",
-                "key_areas": [
-                    "Customer data",
-                    "Operational data",
-                    "Market data",
-                    "Financial data",
-                ],
-            },
-            "storage": {
-                "name": "Data Storage & Management",
-                "description": "Secure and scalable data storage solutions",
-                "key_areas": [
-                    "Cloud storage",
-                    "Data warehousing",
-                    "Data lakes",
-                    "Security protocols",
-                ],
-            },
-            "processing": {
-                "name": "Data Processing & Cleaning",
-                "description": "Preparing data for analysis and AI applications",
-                "key_areas": [
-                    "Data cleaning",
-                    "ETL processes",
-                    "Data validation",
-                    "Quality assurance",
-                ],
-            },
-            "analysis": {
-                "name": "Data Analysis & Insights",
-                "description": "Extracting actionable insights from data",
-                "key_areas": [
-                    "Statistical analysis",
-                    "Machine learning",
-                    "Visualization",
-                    "Reporting",
-                ],
-            },
-            "governance": {
-                "name": "Data Governance",
-                "description": "Policies and procedures for data management",
-                "key_areas": [
-                    "Privacy compliance",
-                    "Access controls",
-                    "Data lineage",
-                    "Audit trails",
-                ],
-            },
-        }
+        self.ai_categories = AI_CATEGORIES
+        self.industry_ai_opportunities = INDUSTRY_AI_OPPORTUNITIES
+        self.ai_vendors = AI_VENDORS
+        self.data_strategy_components = DATA_STRATEGY_COMPONENTS
 
     def assess_ai_readiness(self, business_profile):
         """Assess business readiness for AI adoption"""
@@ -353,14 +516,7 @@ class AIAdoptionRoadmap:
 
     def _assess_strategic_alignment(self, business_goals):
         score = 5
-        ai_aligned_goals = [
-            'efficiency_improvement',
-            'customer_experience_enhancement',
-            'data_driven_decisions',
-            'automation',
-            'innovation',
-        ]
-        for goal in ai_aligned_goals:
+        for goal in AI_ALIGNED_GOALS:
             if business_goals.get(goal, False):
                 score += 1
         return min(score, 10)
@@ -420,203 +576,98 @@ class AIAdoptionRoadmap:
             ]
 
     def identify_ai_opportunities(self, business_profile, industry):
-        opportunities = []
-        industry_opps = self.industry_ai_opportunities.get(industry, {})
-        for ai_category in industry_opps.get('high_impact', []):
-            if ai_category in self.ai_categories:
-                opportunity = self._create_opportunity(ai_category, 'High', business_profile)
-                opportunities.append(opportunity)
-        for ai_category in industry_opps.get('medium_impact', []):
-            if ai_category in self.ai_categories:
-                opportunity = self._create_opportunity(ai_category, 'Medium', business_profile)
-                opportunities.append(opportunity)
-        custom_opps = self._identify_custom_opportunities(business_profile)
-        opportunities.extend(custom_opps)
-        opportunities.sort(key=lambda x: (x['impact_score'], x['feasibility_score']), reverse=True)
-        return opportunities[:10]
-
-    def _create_opportunity(self, ai_category, impact_level, business_profile):
-        category_info = self.ai_categories[ai_category]
-        opportunity = {
-            "id": str(uuid.uuid4()),
-            "category": ai_category,
-            "name": category_info["name"],
-            "description": category_info["description"],
-            "examples": category_info["examples"],
-            "impact_level": impact_level,
-            "impact_score": self._calculate_impact_score(impact_level),
-            "feasibility_score": self._calculate_feasibility_score(
-                category_info, business_profile
-            ),
-            "complexity": category_info["complexity"],
-            "roi_timeline": category_info["roi_timeline"],
-            "estimated_cost": self._estimate_implementation_cost(
-                ai_category, business_profile
-            ),
-            "potential_benefits": self._identify_potential_benefits(
-                ai_category, business_profile
-            ),
-            "implementation_steps": self._generate_implementation_steps(ai_category),
-            "success_metrics": self._define_success_metrics(ai_category),
-        }
-        return opportunity
-
-    def _calculate_impact_score(self, impact_level):
-        impact_scores = {"High": 9, "Medium": 6, "Low": 3}
-        return impact_scores.get(impact_level, 5)
-
-    def _calculate_feasibility_score(self, category_info, business_profile):
-        """Calculate feasibility score based on complexity and business readiness"""
-        complexity_scores = {"Low": 8, "Medium": 6, "High": 4}
-        base_score = complexity_scores.get(category_info["complexity"], 5)
-        if business_profile.get('tech_readiness', 0) > 7:
-            base_score += 1
-        if business_profile.get('team_readiness', 0) > 7:
-            base_score += 1
-        return min(base_score, 10)
-
-    def _estimate_implementation_cost(self, ai_category, business_profile):
-        """Estimate implementation cost"""
-        base_costs = {
-            "automation": {"small": 5000, "medium": 25000, "large": 100000},
-            "analytics": {"small": 10000, "medium": 50000, "large": 200000},
-            "personalization": {"small": 15000, "medium": 75000, "large": 300000},
-            "prediction": {"small": 20000, "medium": 100000, "large": 500000},
-            "generation": {"small": 3000, "medium": 15000, "large": 75000},
-            "optimization": {"small": 25000, "medium": 125000, "large": 600000},
-        }
+        bonus = self._feasibility_bonus(business_profile)
+        candidates = [(template, None) for template in INDUSTRY_OPPORTUNITY_TEMPLATES.get(industry, ())]
+        candidates.extend(self._identify_custom_opportunities(business_profile))
+        scored = [
+            (template, reason, min(template["feasibility_base"] + bonus, 10))
+            for template, reason in candidates
+        ]
+        scored.sort(key=lambda item: (item[0]["impact_score"], item[2]), reverse=True)
         business_size = business_profile.get('size', 'small')
-        return base_costs.get(ai_category, {}).get(business_size, 10000)
-
-    def _identify_potential_benefits(self, ai_category, business_profile):
-        """Identify potential benefits for AI category"""
-        benefit_map = {
-            "automation": [
-                "Reduced operational costs",
-                "Improved efficiency",
-                "Fewer human errors",
-                "24/7 availability",
-            ],
-            "analytics": [
-                "Better decision making",
-                "Improved customer insights",
-                "Optimized operations",
-                "Competitive advantage",
-            ],
-            "personalization": [
-                "Increased customer satisfaction",
-                "Higher conversion rates",
-                "Improved customer retention",
-                "Enhanced user experience",
-            ],
-            "prediction": [
-                "Better planning and forecasting",
-                "Risk mitigation",
-                "Optimized resource allocation",
-                "Proactive problem solving",
-            ],
-            "generation": [
-                "Faster content creation",
-                "Consistent quality",
-                "Reduced creative costs",
-                "Scalable content production",
-            ],
-            "optimization": [
-                "Improved efficiency",
-                "Cost reduction",
-                "Better resource utilization",
-                "Enhanced performance",
-            ],
-        }
-        return benefit_map.get(ai_category, ["Improved business performance"])
-
-    def _generate_implementation_steps(self, ai_category):
-        """Generate implementation steps for AI category"""
         return [
-            "Define specific use cases and requirements",
-            "Evaluate and select appropriate AI tools/vendors",
-            "Prepare data and infrastructure",
-            "Develop pilot implementation",
-            "Test and validate results",
-            "Scale successful implementations",
-            "Monitor and optimize performance",
+            self._create_opportunity(template, feasibility, business_size, reason)
+            for template, reason, feasibility in scored[:10]
         ]
 
-    def _define_success_metrics(self, ai_category):
-        """Define success metrics for AI category"""
-        metric_map = {
-            "automation": ["Process completion time", "Error reduction rate", "Cost savings"],
-            "analytics": ["Decision accuracy", "Insight generation rate", "Business impact"],
-            "personalization": ["Engagement rate", "Conversion rate", "Customer satisfaction"],
-            "prediction": ["Prediction accuracy", "Planning effectiveness", "Risk reduction"],
-            "generation": ["Content quality score", "Production speed", "Cost per asset"],
-            "optimization": ["Efficiency improvement", "Cost reduction", "Performance gains"],
-        }
-        return metric_map.get(ai_category, ["ROI", "User satisfaction", "Performance improvement"])
+    def _create_opportunity(self, template, feasibility_score, business_size, custom_reason=None):
+        """Overlay the profile-dependent fields on a precomputed template"""
+        # mappingproxy.copy() hands back a plain dict copy of the frozen fields
+        opportunity = template["fields"].copy()
+        opportunity["id"] = str(uuid.uuid4())
+        opportunity["feasibility_score"] = feasibility_score
+        opportunity["estimated_cost"] = template["costs"].get(business_size, DEFAULT_IMPLEMENTATION_COST)
+        if custom_reason:
+            opportunity["custom_reason"] = custom_reason
+        return opportunity
+
+    def _feasibility_bonus(self, business_profile):
+        """Feasibility points earned by tech and team readiness"""
+        bonus = 0
+        if business_profile.get('tech_readiness', 0) > 7:
+            bonus += 1
+        if business_profile.get('team_readiness', 0) > 7:
+            bonus += 1
+        return bonus
 
     def _identify_custom_opportunities(self, business_profile):
         """Identify custom AI opportunities based on specific business needs"""
         custom_opportunities = []
         pain_points = business_profile.get('pain_points', [])
-        pain_point_ai_map = {
-            "manual_processes": "automation",
-            "poor_customer_insights": "analytics",
-            "low_engagement": "personalization",
-            "unpredictable_demand": "prediction",
-            "content_creation_bottleneck": "generation",
-            "inefficient_operations": "optimization",
-        }
         for pain_point in pain_points:
-            if pain_point in pain_point_ai_map:
-                ai_category = pain_point_ai_map[pain_point]
-                opportunity = self._create_opportunity(ai_category, 'High', business_profile)
-                opportunity['custom_reason'] = f"Addresses specific pain point: {pain_point}"
-                custom_opportunities.append(opportunity)
+            if pain_point in PAIN_POINT_CATEGORIES:
+                template = OPPORTUNITY_TEMPLATES[(PAIN_POINT_CATEGORIES[pain_point], 'High')]
+                custom_opportunities.append((template, f"Addresses specific pain point: {pain_point}"))
         return custom_opportunities
 
     def create_implementation_roadmap(self, selected_opportunities, business_constraints):
         """Create implementation roadmap for selected AI opportunities"""
+        schedule = self._schedule_opportunities(selected_opportunities, business_constraints)
         roadmap = {
             "phases": [],
-            "timeline": self._calculate_total_timeline(selected_opportunities),
+            "timeline": schedule["makespan_months"],
+            "schedule": schedule,
             "total_investment": self._calculate_total_investment(selected_opportunities),
             "expected_roi": self._calculate_expected_roi(selected_opportunities),
             "risk_assessment": self._assess_implementation_risks(selected_opportunities),
             "success_factors": self._identify_success_factors(selected_opportunities),
         }
-        phases = self._organize_into_phases(selected_opportunities, business_constraints)
+        phases, packing = self._organize_into_phases(selected_opportunities, business_constraints)
         roadmap["phases"] = phases
+        roadmap["phase_packing"] = packing
         return roadmap
 
     def _organize_into_phases(self, opportunities, constraints):
-        """Organize opportunities into implementation phases"""
-        sorted_opps = sorted(
-            opportunities,
-            key=lambda x: (x['feasibility_score'], x['impact_score']),
-            reverse=True,
-        )
-        phases = []
-        current_phase = 1
-        phase_budget = constraints.get('phase_budget', 50000)
+        """Pack opportunities into the fewest phases, front-loading impact.
+
+        ``phase_budgets`` (or a single ``phase_budget``) and
+        ``max_per_phase`` bound each phase; ``planning_time_limit_ms`` is
+        capped at ``MAX_TIME_LIMIT_MS``. Returns the phases and a summary
+        of how the packing was found.
+        """
+        phase_budgets = constraints.get('phase_budgets') or [constraints.get('phase_budget', DEFAULT_PHASE_BUDGET)]
         phase_duration = constraints.get('phase_duration_months', 6)
-        current_phase_opps = []
-        current_phase_cost = 0
-        for opp in sorted_opps:
-            opp_cost = opp['estimated_cost']
-            if current_phase_cost + opp_cost <= phase_budget and len(current_phase_opps) < 3:
-                current_phase_opps.append(opp)
-                current_phase_cost += opp_cost
-            else:
-                if current_phase_opps:
-                    phase = self._create_phase(current_phase, current_phase_opps, phase_duration)
-                    phases.append(phase)
-                    current_phase += 1
-                current_phase_opps = [opp]
-                current_phase_cost = opp_cost
-        if current_phase_opps:
-            phase = self._create_phase(current_phase, current_phase_opps, phase_duration)
-            phases.append(phase)
-        return phases
+        time_limit_ms = constraints.get('planning_time_limit_ms', DEFAULT_TIME_LIMIT_MS)
+        if isinstance(time_limit_ms, bool) or not isinstance(time_limit_ms, (int, float)):
+            raise ValueError("planning_time_limit_ms must be a number")
+        plan = pack_phases(
+            [opp['estimated_cost'] for opp in opportunities],
+            [opp['impact_score'] * opp['feasibility_score'] for opp in opportunities],
+            phase_budgets=phase_budgets,
+            max_per_phase=constraints.get('max_per_phase', DEFAULT_MAX_PER_PHASE),
+            time_limit_ms=min(time_limit_ms, MAX_TIME_LIMIT_MS),
+        )
+        phases = [
+            self._create_phase(number, [opportunities[i] for i in members], phase_duration)
+            for number, members in enumerate(plan["phases"], 1)
+        ]
+        packing = {
+            "method": plan["method"],
+            "optimal": plan["optimal"],
+            "lower_bound": plan["lower_bound"],
+            "phase_count": len(phases),
+        }
+        return phases, packing
 
     def _create_phase(self, phase_number, opportunities, duration_months):
         """Create implementation phase"""
@@ -678,18 +729,56 @@ class AIAdoptionRoadmap:
         criteria.append("Team successfully trained on new AI tools")
         return criteria[:5]
 
-    def _calculate_total_timeline(self, opportunities):
-        """Calculate total implementation timeline"""
-        total_months = 0
-        for opp in opportunities:
-            if opp['complexity'] == 'High':
-                total_months += 6
-            elif opp['complexity'] == 'Medium':
-                total_months += 4
-            else:
-                total_months += 2
-        parallel_factor = 0.7
-        return int(total_months * parallel_factor)
+    def _schedule_opportunities(self, opportunities, constraints):
+        """Schedule opportunities along their dependencies with limited parallelism.
+
+        Foundational categories precede advanced ones through a single
+        zero-length milestone, so that rule adds one edge per opportunity
+        rather than one per pair. ``dependencies`` in the constraints add
+        ``{"before": id, "after": id}`` edges between opportunity ids, and
+        ``max_parallel`` caps how many run at once.
+        """
+        count = len(opportunities)
+        durations = [
+            opp.get('duration_months', COMPLEXITY_DURATION_MONTHS.get(opp.get('complexity'), 2))
+            for opp in opportunities
+        ]
+        milestone = count
+        durations.append(0)
+
+        edges = []
+        for i, opp in enumerate(opportunities):
+            if opp.get('category') in FOUNDATION_CATEGORIES:
+                edges.append((i, milestone))
+            elif opp.get('category') in ADVANCED_CATEGORIES:
+                edges.append((milestone, i))
+
+        index = {opp.get('id'): i for i, opp in enumerate(opportunities)}
+        for dependency in constraints.get('dependencies', []):
+            before, after = dependency.get('before'), dependency.get('after')
+            if before not in index or after not in index:
+                raise ValueError(f"Unknown opportunity in dependency: {before} -> {after}")
+            edges.append((index[before], index[after]))
+
+        result = schedule_initiatives(
+            durations, edges, constraints.get('max_parallel', DEFAULT_MAX_PARALLEL)
+        )
+        return {
+            "makespan_months": result["makespan"],
+            "critical_path": [opportunities[i].get('id') for i in result["critical_path"] if i != milestone],
+            "initiatives": [
+                {
+                    "id": opp.get('id'),
+                    "name": opp.get('name'),
+                    "category": opp.get('category'),
+                    "start_month": result["start"][i],
+                    "end_month": result["end"][i],
+                    "duration_months": durations[i],
+                    "slack_months": result["slack"][i],
+                }
+                for i, opp in enumerate(opportunities)
+            ],
+        }
 
     def _calculate_total_investment(self, opportunities):
         """Calculate total investment required"""
@@ -763,14 +852,19 @@ class AIAdoptionRoadmap:
         ]
 
 
+ai_adoption_roadmap = AIAdoptionRoadmap()
+
+
 @ai_adoption_bp.route('/assess-readiness', methods=['POST'])
 def assess_readiness():
     try:
         data = request.get_json()
         business_profile = data.get('business_profile', {})
 
-        roadmap = AIAdoptionRoadmap()
-        assessment = roadmap.assess_ai_readiness(business_profile)
+        assessment = analysis_cache.get_or_compute(
+            "ai-adoption/assess-readiness", ENGINE_VERSION, {"business_profile": business_profile},
+            lambda: ai_adoption_roadmap.assess_ai_readiness(business_profile),
+        )
 
         session['ai_readiness'] = assessment
 
@@ -786,8 +880,13 @@ def identify_opportunities():
         business_profile = data.get('business_profile', {})
         industry = data.get('industry', 'General')
 
-        roadmap = AIAdoptionRoadmap()
-        opportunities = roadmap.identify_ai_opportunities(business_profile, industry)
+        cached = analysis_cache.get_or_compute(
+            "ai-adoption/identify-opportunities", ENGINE_VERSION,
+            {"business_profile": business_profile, "industry": industry},
+            lambda: ai_adoption_roadmap.identify_ai_opportunities(business_profile, industry),
+        )
+        # Every response still gets its own opportunity ids
+        opportunities = [dict(opportunity, id=str(uuid.uuid4())) for opportunity in cached]
 
         session['ai_opportunities'] = opportunities
 
@@ -803,8 +902,7 @@ def create_roadmap():
         selected_opportunities = data.get('selected_opportunities', [])
         business_constraints = data.get('business_constraints', {})
 
-        roadmap_tool = AIAdoptionRoadmap()
-        roadmap = roadmap_tool.create_implementation_roadmap(selected_opportunities, business_constraints)
+        roadmap = ai_adoption_roadmap.create_implementation_roadmap(selected_opportunities, business_constraints)
 
         session['ai_roadmap'] = roadmap
 
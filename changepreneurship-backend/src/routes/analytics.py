@@ -4,7 +4,7 @@ Uses token-based authentication and aligns with current model fields
 """
 
 from flask import Blueprint, request, jsonify, current_app
-from src.models.assessment import db, Assessment, AssessmentResponse, EntrepreneurProfile
+from src.models.assessment import db, Assessment, AssessmentResponse, EntrepreneurProfile, QuestionVersion
 from src.utils.auth import verify_session_token
 from sqlalchemy import func, desc
 from datetime import datetime, timedelta
@@ -275,11 +275,13 @@ def get_assessment_statistics():
         
         # Response types breakdown
         response_types = db.session.query(
-            AssessmentResponse.response_type,
-            func.count(AssessmentResponse.id).label('count')
-        ).join(Assessment)\
+            QuestionVersion.response_type,
+            func.count(AssessmentResponse.question_ref_id).label('count')
+        ).select_from(AssessmentResponse)\
+         .join(QuestionVersion)\
+         .join(Assessment)\
          .filter(Assessment.user_id == user_id)\
-         .group_by(AssessmentResponse.response_type).all()
+         .group_by(QuestionVersion.response_type).all()
         
         for response_type, count in response_types:
             stats['response_types'][response_type] = count
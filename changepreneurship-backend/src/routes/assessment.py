@@ -1,11 +1,202 @@
 from flask import Blueprint, request, jsonify, current_app
 from datetime import datetime
+import json
+from sqlalchemy import func, inspect, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from src.models.assessment import db, Assessment, AssessmentResponse, EntrepreneurProfile
+from src.models.assessment import (
+    db, content_hash, encode_json, Assessment, AssessmentResponse, EntrepreneurProfile, Question, QuestionVersion
+)
+from src.services.group_commit import group_commit_writer
+from src.utils import blob_codec
 from src.utils.auth import verify_session_token
+from src.utils.fieldsets import requested_fields
+from src.utils.json_patch import (
+    JSON_PATCH_MIMETYPE,
+    MERGE_PATCH_MIMETYPE,
+    JsonPatchError,
+    JsonPatchTestFailed,
+    apply_json_patch,
+    merge_patch,
+    parse_pointer,
+)
 
 assessment_bp = Blueprint('assessment', __name__)
 
+PROFILE_FIELDS = [
+    'entrepreneur_archetype', 'core_motivation', 'risk_tolerance', 'confidence_level',
+    'opportunity_score', 'success_probability'
+]
+
+PROFILE_JSON_FIELDS = [
+    'primary_opportunity', 'skills_assessment', 'market_analysis', 'competitive_analysis',
+    'target_customers', 'business_model', 'financial_projections', 'go_to_market_strategy',
+    'product_concept_results', 'business_development_plan', 'prototype_testing_results',
+    'ai_recommendations'
+]
+
+
+def _insert_missing(connection, table, values):
+    """INSERT that leaves an existing row alone when a unique key collides"""
+    # Concurrent first saves of the same catalog row must not fail
+    dialect = connection.dialect.name
+    if dialect == 'sqlite':
+        statement = sqlite_insert(table).values(**values).on_conflict_do_nothing()
+    elif dialect == 'postgresql':
+        statement = postgresql_insert(table).values(**values).on_conflict_do_nothing()
+    else:
+        statement = insert(table).values(**values)
+    connection.execute(statement)
+
+
+def _catalog_question(connection, phase_id, section_id, question_id, question_text, response_type):
+    """Ids of the catalog question and of the version with this wording.
+
+    Catalog rows are shared by every response and never changed; a new
+    wording or response type is added as the question's next version.
+    """
+    questions = Question.__table__
+    lookup = select(questions.c.id).where(
+        questions.c.phase_id == phase_id,
+        questions.c.section_id == section_id,
+        questions.c.question_id == question_id,
+    )
+    question_ref_id = connection.execute(lookup).scalar()
+    if question_ref_id is None:
+        _insert_missing(connection, questions, dict(phase_id=phase_id, section_id=section_id, question_id=question_id))
+        question_ref_id = connection.execute(lookup).scalar()
+
+    versions = QuestionVersion.__table__
+    lookup = select(versions.c.id, versions.c.version, versions.c.question_text, versions.c.response_type).where(
+        versions.c.question_ref_id == question_ref_id
+    )
+    while True:
+        rows = connection.execute(lookup).all()
+        for row in rows:
+            if (row.question_text, row.response_type) == (question_text, response_type):
+                return question_ref_id, row.id
+        # A concurrent save may claim the same version; look again either way
+        _insert_missing(connection, versions, dict(
+            question_ref_id=question_ref_id,
+            version=max((row.version for row in rows), default=0) + 1,
+            question_text=question_text,
+            response_type=response_type,
+        ))
+
+
+def _upsert_response(assessment_id, phase_id, section_id, question_id, question_text, response_type, stored_value):
+    """Write operation behind save_response, run directly or by the group-commit writer"""
+    responses = AssessmentResponse.__table__
+    value_hash = content_hash(stored_value)
+    now = datetime.utcnow()
+
+    def operation(connection):
+        question_ref_id, question_version_id = _catalog_question(
+            connection, phase_id, section_id, question_id, question_text, response_type
+        )
+        values = dict(
+            assessment_id=assessment_id,
+            question_ref_id=question_ref_id,
+            question_version_id=question_version_id,
+            response_value=stored_value,
+            response_value_hash=value_hash,
+            created_at=now,
+            updated_at=now,
+        )
+        changes = dict(
+            question_version_id=question_version_id,
+            response_value=stored_value,
+            response_value_hash=value_hash,
+            updated_at=now,
+        )
+        dialect = connection.dialect.name
+        if dialect in ('sqlite', 'postgresql'):
+            upsert = sqlite_insert if dialect == 'sqlite' else postgresql_insert
+            connection.execute(
+                upsert(responses).values(**values).on_conflict_do_update(
+                    index_elements=[responses.c.assessment_id, responses.c.question_ref_id],
+                    set_=changes,
+                )
+            )
+            return
+        updated = connection.execute(
+            update(responses)
+            .where(responses.c.assessment_id == assessment_id, responses.c.question_ref_id == question_ref_id)
+            .values(**changes)
+        ).rowcount
+        if not updated:
+            connection.execute(insert(responses).values(**values))
+
+    return operation
+
+
+def _update_assessment(assessment_id, values):
+    assessments = Assessment.__table__
+
+    def operation(connection):
+        connection.execute(update(assessments).where(assessments.c.id == assessment_id).values(**values))
+
+    return operation
+
+
+def _merges_in_sql(stored, patch):
+    """Whether json_patch() can merge ``patch`` into the stored column value.
+
+    SQLite only, and only while the value is plain text that stays under
+    the compression threshold; anything else goes through the model so it
+    is (de)compressed on the way.
+    """
+    if db.engine.dialect.name != 'sqlite' or blob_codec.is_packed(stored):
+        return False
+    threshold = blob_codec.COMPRESSION_THRESHOLD
+    return threshold <= 0 or len(stored or '') + len(encode_json(patch)) < threshold
+
+
+def _merge_assessment_data(assessment_id, patch):
+    """Merge-patch assessment_data inside SQLite with json_patch().
+
+    Only the patch crosses the wire and the row is only rewritten when the
+    result differs. The hash is cleared and recomputed from the stored
+    text when next needed; json_patch() writes the same compact text as
+    encode_json(), so an identical document saved later still matches it. Compressed values are never touched. Returns
+    the number of rows changed.
+    """
+    assessments = Assessment.__table__
+    patched = func.json_patch(func.coalesce(func.nullif(assessments.c.assessment_data, ''), '{}'), encode_json(patch))
+
+    def operation(connection):
+        return connection.execute(
+            update(assessments)
+            .where(
+                assessments.c.id == assessment_id,
+                func.typeof(assessments.c.assessment_data) != 'blob',
+                patched.is_distinct_from(assessments.c.assessment_data),
+            )
+            .values(assessment_data=patched, assessment_data_hash=None)
+        ).rowcount
+
+    return operation
+
+
+def _read_patch():
+    """(kind, patch document) for a PATCH body, or (None, error response)"""
+    mimetype = request.mimetype
+    if mimetype not in (MERGE_PATCH_MIMETYPE, JSON_PATCH_MIMETYPE):
+        return None, (jsonify({
+            'error': f'Unsupported patch format. Use {MERGE_PATCH_MIMETYPE} or {JSON_PATCH_MIMETYPE}.'
+        }), 415)
+    patch = request.get_json(silent=True)
+    if patch is None:
+        return None, (jsonify({'error': 'No data provided'}), 400)
+    if mimetype == JSON_PATCH_MIMETYPE and not isinstance(patch, list):
+        return None, (jsonify({'error': 'JSON Patch must be an array of operations'}), 400)
+    return ('merge' if mimetype == MERGE_PATCH_MIMETYPE else 'json-patch'), patch
+
+
+def _patch_error(e):
+    return jsonify({'error': str(e)}), 409 if isinstance(e, JsonPatchTestFailed) else 400
+
 @assessment_bp.route('/phases', methods=['GET'])
 def get_assessment_phases():
     """Get all assessment phases with user progress"""
@@ -141,7 +332,7 @@ def start_assessment(phase_id):
         
         return jsonify({
             'message': f'Assessment {phase_names[phase_id]} started',
-            'assessment': assessment.to_dict()
+            'assessment': assessment.to_dict(requested_fields('assessment', primary=True), raw_json=True)
         }), 200
         
     except Exception as e:
@@ -179,34 +370,31 @@ def save_response(assessment_id):
             return jsonify({'error': 'Missing required fields'}), 400
         
         # Check if response already exists
-        existing_response = AssessmentResponse.query.filter_by(
-            assessment_id=assessment_id,
-            question_id=question_id
+        existing_response = AssessmentResponse.query.join(Question).filter(
+            AssessmentResponse.assessment_id == assessment_id,
+            Question.phase_id == assessment.phase_id,
+            Question.section_id == section_id,
+            Question.question_id == question_id
         ).first()
         
-        if existing_response:
-            # Update existing response
-            existing_response.set_response_value(response_value)
-            if response_type:
-                existing_response.response_type = response_type
-            if question_text:
-                existing_response.question_text = question_text
-            existing_response.updated_at = datetime.utcnow()
+        # Periodic autosaves mostly resend what is already stored
+        stored_value = AssessmentResponse.encode_response_value(response_value)
+        if existing_response and existing_response.matches(question_text, response_type, content_hash(stored_value)):
+            return jsonify({'message': 'Response unchanged', 'noop': True}), 200
+        
+        operation = _upsert_response(
+            assessment_id, assessment.phase_id, section_id, question_id, question_text, response_type, stored_value
+        )
+        writer = group_commit_writer()
+        if writer is not None:
+            # End the read transaction before waiting on the writer
+            db.session.rollback()
+            writer.execute(operation)
         else:
-            # Create new response
-            response = AssessmentResponse(
-                assessment_id=assessment_id,
-                section_id=section_id,
-                question_id=question_id,
-                question_text=question_text,
-                response_type=response_type
-            )
-            response.set_response_value(response_value)
-            db.session.add(response)
-        
-        db.session.commit()
+            operation(db.session.connection())
+            db.session.commit()
         
-        return jsonify({'message': 'Response saved successfully'}), 200
+        return jsonify({'message': 'Response saved successfully', 'noop': False}), 200
         
     except Exception as e:
         current_app.logger.error(f"Save response error: {str(e)}")
@@ -245,25 +433,185 @@ def update_progress(assessment_id):
 
             assessment.progress_percentage = max(0, min(100, progress_value))
         
-        if is_completed:
+        if is_completed and not assessment.is_completed:
             assessment.is_completed = True
             assessment.completed_at = datetime.utcnow()
+        if is_completed:
             assessment.progress_percentage = 100.0
         
         if assessment_data:
+            # Skipped when the hash matches, so an idle tab costs no write
             assessment.set_assessment_data(assessment_data)
         
-        db.session.commit()
+        changes = {
+            attribute.key: attribute.value
+            for attribute in inspect(assessment).attrs
+            if attribute.history.has_changes()
+        }
+        if not changes:
+            return jsonify({
+                'message': 'Progress unchanged',
+                'noop': True,
+                'assessment': assessment.to_dict(requested_fields('assessment', primary=True), raw_json=True)
+            }), 200
+        
+        writer = group_commit_writer()
+        if writer is not None:
+            db.session.rollback()
+            writer.execute(_update_assessment(assessment_id, changes))
+        else:
+            db.session.commit()
         
         return jsonify({
             'message': 'Progress updated successfully',
-            'assessment': assessment.to_dict()
+            'noop': False,
+            'assessment': assessment.to_dict(requested_fields('assessment', primary=True), raw_json=True)
         }), 200
         
     except Exception as e:
         current_app.logger.error(f"Update progress error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@assessment_bp.route('/<int:assessment_id>/data', methods=['PATCH'])
+def patch_assessment_data(assessment_id):
+    """Patch assessment_data with a merge patch or a JSON Patch"""
+    try:
+        user, session, error, status_code = verify_session_token()
+        if error:
+            return jsonify(error), status_code
+        
+        kind, patch = _read_patch()
+        if kind is None:
+            return patch
+        
+        # Verify assessment belongs to user
+        assessment = Assessment.query.filter_by(
+            id=assessment_id,
+            user_id=user.id
+        ).first()
+        
+        if not assessment:
+            return jsonify({'error': 'Assessment not found'}), 404
+        
+        if kind == 'merge' and isinstance(patch, dict) and _merges_in_sql(assessment.assessment_data, patch):
+            operation = _merge_assessment_data(assessment_id, patch)
+            writer = group_commit_writer()
+            if writer is not None:
+                db.session.rollback()
+                changed = writer.execute(operation)
+            else:
+                changed = operation(db.session.connection())
+                db.session.commit()
+        else:
+            current = assessment.get_assessment_data()
+            try:
+                if kind == 'merge':
+                    patched = merge_patch(current, patch)
+                else:
+                    patched = apply_json_patch(current, patch)
+            except JsonPatchError as e:
+                return _patch_error(e)
+            if not isinstance(patched, dict):
+                return jsonify({'error': 'assessment_data must stay a JSON object'}), 400
+            changed = assessment.set_assessment_data(patched)
+            if changed:
+                db.session.commit()
+        
+        return jsonify({
+            'message': 'Assessment data updated' if changed else 'Assessment data unchanged',
+            'noop': not changed
+        }), 200
+        
+    except Exception as e:
+        current_app.logger.error(f"Patch assessment data error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@assessment_bp.route('/profile', methods=['PATCH'])
+def patch_profile():
+    """Patch the entrepreneur profile, viewed as one JSON document of its fields.
+
+    Merge patches into small JSON fields run inside SQLite with json_patch();
+    JSON Patch paths start with the field name, e.g. /market_analysis/size.
+    """
+    try:
+        user, session, error, status_code = verify_session_token()
+        if error:
+            return jsonify(error), status_code
+        
+        kind, patch = _read_patch()
+        if kind is None:
+            return patch
+        
+        if kind == 'merge':
+            if not isinstance(patch, dict):
+                return jsonify({'error': 'Profile merge patch must be an object'}), 400
+            touched = set(patch)
+        else:
+            try:
+                pointers = [
+                    parse_pointer(operation[key])
+                    for operation in patch
+                    for key in ('path', 'from')
+                    if isinstance(operation, dict) and key in operation
+                ]
+            except JsonPatchError:
+                return jsonify({'error': 'Invalid JSON Patch path'}), 400
+            if any(not tokens for tokens in pointers):
+                # The profile is a view over its columns, not one stored document
+                return jsonify({'error': 'JSON Patch paths must start with a profile field'}), 400
+            touched = {tokens[0] for tokens in pointers}
+        unknown = touched - set(PROFILE_FIELDS) - set(PROFILE_JSON_FIELDS)
+        if unknown:
+            return jsonify({'error': f"Unknown profile fields: {', '.join(sorted(unknown))}"}), 400
+        
+        profile = EntrepreneurProfile.query.filter_by(user_id=user.id).first()
+        if not profile:
+            profile = EntrepreneurProfile(user_id=user.id)
+            db.session.add(profile)
+            db.session.flush()
+        
+        in_place = {}
+        if kind == 'merge':
+            for field, value in patch.items():
+                if field in PROFILE_FIELDS:
+                    setattr(profile, field, value)
+                elif isinstance(value, dict) and _merges_in_sql(getattr(profile, field), value):
+                    column = EntrepreneurProfile.__table__.c[field]
+                    in_place[field] = func.json_patch(func.coalesce(func.nullif(column, ''), '{}'), encode_json(value))
+                else:
+                    profile.set_json_field(field, merge_patch(profile.get_json_field(field), value))
+        else:
+            document = {
+                field: profile.get_json_field(field) if field in PROFILE_JSON_FIELDS else getattr(profile, field)
+                for field in touched
+            }
+            try:
+                document = apply_json_patch(document, patch)
+            except JsonPatchError as e:
+                return _patch_error(e)
+            for field in touched:
+                value = document.get(field)
+                if field in PROFILE_FIELDS:
+                    setattr(profile, field, value)
+                else:
+                    profile.set_json_field(field, value)
+        
+        profile.updated_at = datetime.utcnow()
+        db.session.flush()
+        if in_place:
+            profiles = EntrepreneurProfile.__table__
+            db.session.execute(update(profiles).where(profiles.c.id == profile.id).values(**in_place))
+        db.session.commit()
+        
+        return jsonify({
+            'message': 'Profile updated successfully',
+            'profile': profile.to_dict(requested_fields('profile', primary=True), raw_json=True)
+        }), 200
+        
+    except Exception as e:
+        current_app.logger.error(f"Patch profile error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @assessment_bp.route('/<int:assessment_id>/responses', methods=['GET'])
 def get_responses(assessment_id):
     """Get all responses for an assessment"""
@@ -282,10 +630,11 @@ def get_responses(assessment_id):
             return jsonify({'error': 'Assessment not found'}), 404
         
         responses = AssessmentResponse.query.filter_by(assessment_id=assessment_id).all()
+        response_fields = requested_fields('response', primary=True)
         
         return jsonify({
-            'assessment': assessment.to_dict(),
-            'responses': [response.to_dict() for response in responses]
+            'assessment': assessment.to_dict(requested_fields('assessment'), raw_json=True),
+            'responses': [response.to_dict(response_fields) for response in responses]
         }), 200
         
     except Exception as e:
@@ -310,24 +659,12 @@ def update_profile():
             db.session.add(profile)
         
         # Update profile fields
-        updatable_fields = [
-            'entrepreneur_archetype', 'core_motivation', 'risk_tolerance', 'confidence_level',
-            'opportunity_score', 'success_probability'
-        ]
-        
-        for field in updatable_fields:
+        for field in PROFILE_FIELDS:
             if field in data:
                 setattr(profile, field, data[field])
         
         # Update JSON fields
-        json_fields = [
-            'primary_opportunity', 'skills_assessment', 'market_analysis', 'competitive_analysis',
-            'target_customers', 'business_model', 'financial_projections', 'go_to_market_strategy',
-            'product_concept_results', 'business_development_plan', 'prototype_testing_results',
-            'ai_recommendations'
-        ]
-        
-        for field in json_fields:
+        for field in PROFILE_JSON_FIELDS:
             if field in data:
                 profile.set_json_field(field, data[field])
         
@@ -336,7 +673,7 @@ def update_profile():
         
         return jsonify({
             'message': 'Profile updated successfully',
-            'profile': profile.to_dict()
+            'profile': profile.to_dict(requested_fields('profile', primary=True), raw_json=True)
         }), 200
         
     except Exception as e:
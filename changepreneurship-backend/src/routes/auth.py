@@ -6,6 +6,7 @@ import re
 
 from src.models.assessment import db, User, UserSession, EntrepreneurProfile
 from src.utils.auth import verify_session_token
+from src.utils.fieldsets import requested_fields
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -42,7 +43,7 @@ def create_user_session(user_id, expires_in_days=30):
 def auth_options():
     resp = make_response(('', 204))
     resp.headers['Access-Control-Allow-Origin'] = '*'
-    resp.headers['Access-Control-Allow-Methods'] = 'GET,POST,PUT,DELETE,OPTIONS'
+    resp.headers['Access-Control-Allow-Methods'] = 'GET,POST,PUT,PATCH,DELETE,OPTIONS'
     resp.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
     return resp
 
@@ -181,7 +182,10 @@ def get_profile():
         if not profile:
             return jsonify({'error': 'Profile not found'}), 404
 
-        return jsonify({'user': user.to_dict(), 'profile': profile.to_dict()}), 200
+        return jsonify({
+            'user': user.to_dict(),
+            'profile': profile.to_dict(requested_fields('profile', primary=True), raw_json=True)
+        }), 200
 
     except Exception as e:
         current_app.logger.error(f"Profile retrieval error: {str(e)}")
@@ -2,108 +2,121 @@ from flask import Blueprint, request, jsonify, session
 from datetime import datetime
 import json
 import uuid
-from .purpose_discovery import PurposeDiscoveryModule
-from .mind_mapping import MindMappingTool
-from .value_zone_validator import ValueZoneValidator
-from .ai_adoption_roadmap import AIAdoptionRoadmap
+from .purpose_discovery import purpose_discovery_module
+from .mind_mapping import mind_mapping_tool
+from .value_zone_validator import value_zone_validator
+from .ai_adoption_roadmap import ai_adoption_roadmap
+from sqlalchemy import update
+from src.models.assessment import db, EnhancedAssessment
+from src.services.assessment_scoring import (
+    MAX_SUCCESS_PROBABILITY,
+    PHASE_NUMBERS,
+    READINESS_LEVELS,
+    SUCCESS_FACTORS,
+    phase_weights_from,
+    score_batch,
+)
+from src.utils.catalog import freeze
 
 enhanced_assessment_bp = Blueprint('enhanced_assessment', __name__)
 
+ENHANCED_PHASES = freeze({
+    1: {
+        "name": "Deep Self Discovery & Purpose",
+        "description": "Discover your core purpose, values, and entrepreneurial motivations",
+        "modules": ["purpose_discovery", "personality_assessment"],
+        "weight": 0.20,
+    },
+    2: {
+        "name": "Value Zone Identification",
+        "description": "Find the intersection of your passion, skills, and market demand",
+        "modules": ["value_zone_analysis", "skill_assessment"],
+        "weight": 0.15,
+    },
+    3: {
+        "name": "Dynamic Strategy Development",
+        "description": "Create flexible, adaptive business strategies using mind mapping",
+        "modules": ["mind_mapping", "business_model_canvas"],
+        "weight": 0.15,
+    },
+    4: {
+        "name": "Enhanced Market Intelligence",
+        "description": "Deep market research with AI-powered insights and trend analysis",
+        "modules": [
+            "market_research",
+            "competitive_analysis",
+            "trend_analysis",
+        ],
+        "weight": 0.15,
+    },
+    5: {
+        "name": "Leadership & Culture Development",
+        "description": "Build leadership skills and define your company culture",
+        "modules": [
+            "leadership_assessment",
+            "culture_builder",
+            "communication_training",
+        ],
+        "weight": 0.10,
+    },
+    6: {
+        "name": "AI-Powered Future-Proofing",
+        "description": "Prepare your business for the AI-driven future",
+        "modules": ["ai_adoption_roadmap", "technology_strategy"],
+        "weight": 0.15,
+    },
+    7: {
+        "name": "Comprehensive Business Plan & Roadmap",
+        "description": "Generate your complete business plan and implementation roadmap",
+        "modules": [
+            "business_plan_generation",
+            "implementation_roadmap",
+            "success_metrics",
+        ],
+        "weight": 0.10,
+    },
+})
+
+ASSESSMENT_CRITERIA = freeze({
+    "purpose_clarity": {
+        "weight": 0.25,
+        "description": "How clear and compelling is your purpose?",
+    },
+    "market_opportunity": {
+        "weight": 0.20,
+        "description": "How strong is your market opportunity?",
+    },
+    "skill_alignment": {
+        "weight": 0.15,
+        "description": "How well do your skills match your business idea?",
+    },
+    "strategic_thinking": {
+        "weight": 0.15,
+        "description": "How strategic and adaptable is your approach?",
+    },
+    "leadership_readiness": {
+        "weight": 0.10,
+        "description": "How ready are you to lead and build a team?",
+    },
+    "future_readiness": {
+        "weight": 0.10,
+        "description": "How prepared are you for future challenges?",
+    },
+    "execution_capability": {
+        "weight": 0.05,
+        "description": "How capable are you of executing your plan?",
+    },
+})
+
 
 class EnhancedAssessmentEngine:
     def __init__(self):
-        self.purpose_module = PurposeDiscoveryModule()
-        self.mind_mapping = MindMappingTool()
-        self.value_zone = ValueZoneValidator()
-        self.ai_roadmap = AIAdoptionRoadmap()
-
-        self.enhanced_phases = {
-            1: {
-                "name": "Deep Self Discovery & Purpose",
-                "description": "Discover your core purpose, values, and entrepreneurial motivations",
-                "modules": ["purpose_discovery", "personality_assessment"],
-                "weight": 0.20,
-            },
-            2: {
-                "name": "Value Zone Identification",
-                "description": "Find the intersection of your passion, skills, and market demand",
-                "modules": ["value_zone_analysis", "skill_assessment"],
-                "weight": 0.15,
-            },
-            3: {
-                "name": "Dynamic Strategy Development",
-                "description": "Create flexible, adaptive business strategies using mind mapping",
-                "modules": ["mind_mapping", "business_model_canvas"],
-                "weight": 0.15,
-            },
-            4: {
-                "name": "Enhanced Market Intelligence",
-                "description": "Deep market research with AI-powered insights and trend analysis",
-                "modules": [
-                    "market_research",
-                    "competitive_analysis",
-                    "trend_analysis",
-                ],
-                "weight": 0.15,
-            },
-            5: {
-                "name": "Leadership & Culture Development",
-                "description": "Build leadership skills and define your company culture",
-                "modules": [
-                    "leadership_assessment",
-                    "culture_builder",
-                    "communication_training",
-                ],
-                "weight": 0.10,
-            },
-            6: {
-                "name": "AI-Powered Future-Proofing",
-                "description": "Prepare your business for the AI-driven future",
-                "modules": ["ai_adoption_roadmap", "technology_strategy"],
-                "weight": 0.15,
-            },
-            7: {
-                "name": "Comprehensive Business Plan & Roadmap",
-                "description": "Generate your complete business plan and implementation roadmap",
-                "modules": [
-                    "business_plan_generation",
-                    "implementation_roadmap",
-                    "success_metrics",
-                ],
-                "weight": 0.10,
-            },
-        }
-
-        self.assessment_criteria = {
-            "purpose_clarity": {
-                "weight": 0.25,
-                "description": "How clear and compelling is your purpose?",
-            },
-            "market_opportunity": {
-                "weight": 0.20,
-                "description": "How strong is your market opportunity?",
-            },
-            "skill_alignment": {
-                "weight": 0.15,
-                "description": "How well do your skills match your business idea?",
-            },
-            "strategic_thinking": {
-                "weight": 0.15,
-                "description": "How strategic and adaptable is your approach?",
-            },
-            "leadership_readiness": {
-                "weight": 0.10,
-                "description": "How ready are you to lead and build a team?",
-            },
-            "future_readiness": {
-                "weight": 0.10,
-                "description": "How prepared are you for future challenges?",
-            },
-            "execution_capability": {
-                "weight": 0.05,
-                "description": "How capable are you of executing your plan?",
-            },
-        }
+        self.purpose_module = purpose_discovery_module
+        self.mind_mapping = mind_mapping_tool
+        self.value_zone = value_zone_validator
+        self.ai_roadmap = ai_adoption_roadmap
+        self.enhanced_phases = ENHANCED_PHASES
+        self.assessment_criteria = ASSESSMENT_CRITERIA
 
     def start_enhanced_assessment(self, user_id, assessment_type="comprehensive"):
         """Start a new enhanced assessment"""
@@ -306,44 +319,75 @@ class EnhancedAssessmentEngine:
         return recommendations
 
     def calculate_overall_assessment(self, phase_results):
+        phase_scores = {
+            int(phase_num): result.get('score', 0)
+            for phase_num, result in phase_results.items()
+        }
         overall_score = 0
         total_weight = 0
         for phase_num, phase_info in self.enhanced_phases.items():
-            if phase_num in phase_results:
-                phase_score = phase_results[phase_num].get('score', 0)
+            if phase_num in phase_scores:
                 weight = phase_info['weight']
-                overall_score += phase_score * weight
+                overall_score += phase_scores[phase_num] * weight
                 total_weight += weight
         if total_weight > 0:
             overall_score = overall_score / total_weight
+        return self._summarize_scores(phase_scores, overall_score)
+
+    def apply_phase_result(self, record, phase_result):
+        """Fold a completed phase into the running totals of a stored assessment"""
+        phase_number = phase_result['phase_number']
+        score = phase_result['score']
+        weight = self.enhanced_phases[phase_number]['weight']
+
+        phase_scores = record.get_phase_scores()
+        phase_results = record.get_phase_results()
+        previous_score = phase_scores.get(phase_number)
+
+        if previous_score is None:
+            record.weight_total = (record.weight_total or 0) + weight
+        else:
+            # Re-completing a phase replaces its earlier contribution
+            record.weighted_score_sum = (record.weighted_score_sum or 0) - previous_score * weight
+
+        record.weighted_score_sum = (record.weighted_score_sum or 0) + score * weight
+        record.overall_score = (
+            record.weighted_score_sum / record.weight_total if record.weight_total else 0
+        )
+
+        phase_scores[phase_number] = score
+        phase_results[phase_number] = phase_result
+        record.phase_scores = json.dumps(phase_scores)
+        record.phase_results = json.dumps(phase_results)
+        record.current_phase = max(record.current_phase or 1, phase_number + 1)
+        return record
+
+    def summarize_record(self, record):
+        """Build final results from the running totals of a stored assessment"""
+        return self._summarize_scores(record.get_phase_scores(), record.overall_score or 0)
+
+    def _summarize_scores(self, phase_scores, overall_score):
         assessment_result = {
             "overall_score": round(overall_score, 2),
             "readiness_level": self._determine_readiness_level(overall_score),
-            "strengths": self._identify_strengths(phase_results),
-            "areas_for_improvement": self._identify_improvement_areas(phase_results),
-            "next_steps": self._generate_next_steps(phase_results, overall_score),
-            "success_probability": self._estimate_success_probability(phase_results),
-            "recommended_timeline": self._suggest_timeline(phase_results),
-            "resource_requirements": self._estimate_resources(phase_results),
+            "strengths": self._identify_strengths(phase_scores),
+            "areas_for_improvement": self._identify_improvement_areas(phase_scores),
+            "next_steps": self._generate_next_steps(phase_scores, overall_score),
+            "success_probability": self._estimate_success_probability(phase_scores),
+            "recommended_timeline": self._suggest_timeline(phase_scores),
+            "resource_requirements": self._estimate_resources(phase_scores),
         }
         return assessment_result
 
     def _determine_readiness_level(self, score):
-        if score >= 8.5:
-            return "Highly Ready - Exceptional entrepreneurial potential"
-        elif score >= 7.0:
-            return "Ready - Strong foundation for entrepreneurship"
-        elif score >= 5.5:
-            return "Developing - Good potential with focused development"
-        elif score >= 4.0:
-            return "Emerging - Significant development needed"
-        else:
-            return "Early Stage - Foundational work required"
+        for threshold, level in READINESS_LEVELS:
+            if score >= threshold:
+                return level
+        return READINESS_LEVELS[-1][1]
 
-    def _identify_strengths(self, phase_results):
+    def _identify_strengths(self, phase_scores):
         strengths = []
-        for phase_num, result in phase_results.items():
-            score = result.get('score', 0)
+        for phase_num, score in phase_scores.items():
             phase_name = self.enhanced_phases[phase_num]['name']
             if score >= 8:
                 strengths.append(f"Excellent {phase_name.lower()}")
@@ -351,10 +395,9 @@ class EnhancedAssessmentEngine:
                 strengths.append(f"Strong {phase_name.lower()}")
         return strengths
 
-    def _identify_improvement_areas(self, phase_results):
+    def _identify_improvement_areas(self, phase_scores):
         improvements = []
-        for phase_num, result in phase_results.items():
-            score = result.get('score', 0)
+        for phase_num, score in phase_scores.items():
             phase_name = self.enhanced_phases[phase_num]['name']
             if score < 5:
                 improvements.append(f"Develop {phase_name.lower()}")
@@ -362,7 +405,7 @@ class EnhancedAssessmentEngine:
                 improvements.append(f"Strengthen {phase_name.lower()}")
         return improvements
 
-    def _generate_next_steps(self, phase_results, overall_score):
+    def _generate_next_steps(self, phase_scores, overall_score):
         next_steps = []
         if overall_score >= 7:
             next_steps.extend([
@@ -387,23 +430,13 @@ class EnhancedAssessmentEngine:
             ])
         return next_steps
 
-    def _estimate_success_probability(self, phase_results):
-        purpose_score = phase_results.get(1, {}).get('score', 0)
-        value_zone_score = phase_results.get(2, {}).get('score', 0)
-        strategy_score = phase_results.get(3, {}).get('score', 0)
-        market_score = phase_results.get(4, {}).get('score', 0)
-        success_factors = [
-            (purpose_score, 0.3),
-            (value_zone_score, 0.25),
-            (strategy_score, 0.25),
-            (market_score, 0.2),
-        ]
-        weighted_score = sum(score * weight for score, weight in success_factors)
-        probability = min(weighted_score / 10, 0.9)
+    def _estimate_success_probability(self, phase_scores):
+        weighted_score = sum(phase_scores.get(phase, 0) * weight for phase, weight in SUCCESS_FACTORS)
+        probability = min(weighted_score / 10, MAX_SUCCESS_PROBABILITY)
         return round(probability, 2)
 
-    def _suggest_timeline(self, phase_results):
-        overall_avg = sum(result.get('score', 0) for result in phase_results.values()) / len(phase_results)
+    def _suggest_timeline(self, phase_scores):
+        overall_avg = sum(phase_scores.values()) / max(len(phase_scores), 1)
         if overall_avg >= 8:
             return "3-6 months to launch"
         elif overall_avg >= 6:
@@ -413,7 +446,7 @@ class EnhancedAssessmentEngine:
         else:
             return "18+ months of preparation needed"
 
-    def _estimate_resources(self, phase_results):
+    def _estimate_resources(self, phase_scores):
         return {
             "financial": "Varies by business model - see detailed financial projections",
             "time": "Expect 20-40 hours per week during development phase",
@@ -423,6 +456,60 @@ class EnhancedAssessmentEngine:
         }
 
 
+    def score_batch(self, assessments, weight_overrides=None):
+        """Vectorized scores for many ``{phase_number: phase_data}`` mappings"""
+        return score_batch(assessments, phase_weights_from(self.enhanced_phases, weight_overrides))
+
+    def rescore_records(self, records, weight_overrides=None, persist=True):
+        """Re-score stored assessments from their saved phase data in one batch.
+
+        With ``persist`` the phase scores, running totals and any final
+        results are rewritten with one bulk UPDATE; the caller commits.
+        """
+        phase_results = [record.get_phase_results() for record in records]
+        batch = self.score_batch(
+            [{phase: result.get('data', {}) for phase, result in results.items()} for results in phase_results],
+            weight_overrides,
+        )
+        if not persist or not records:
+            return batch
+
+        phase_scores = batch['phase_scores'].tolist()
+        rows = []
+        for index, (record, results) in enumerate(zip(records, phase_results)):
+            scores = {
+                phase: score for phase, score in zip(PHASE_NUMBERS, phase_scores[index]) if phase in results
+            }
+            for phase, score in scores.items():
+                results[phase]['score'] = score
+            row = {
+                'id': record.id,
+                'phase_scores': json.dumps(scores),
+                'phase_results': json.dumps(results),
+                'weighted_score_sum': float(batch['weighted_score_sum'][index]),
+                'weight_total': float(batch['weight_total'][index]),
+                'overall_score': float(batch['overall_score'][index]),
+            }
+            final_results = record.get_final_results()
+            if final_results is not None:
+                row['final_results'] = json.dumps(self._summarize_scores(scores, row['overall_score']))
+            rows.append(row)
+
+        db.session.execute(update(EnhancedAssessment), rows)
+        return batch
+
+
+enhanced_assessment_engine = EnhancedAssessmentEngine()
+
+
+def _load_assessment(assessment_id=None):
+    """Resolve the stored assessment from an explicit id or the session"""
+    assessment_id = assessment_id or session.get('enhanced_assessment_id')
+    if not assessment_id:
+        return None
+    return db.session.get(EnhancedAssessment, assessment_id)
+
+
 @enhanced_assessment_bp.route('/start', methods=['POST'])
 def start_assessment():
     try:
@@ -430,62 +517,88 @@ def start_assessment():
         user_id = data.get('user_id')
         assessment_type = data.get('type', 'comprehensive')
 
-        engine = EnhancedAssessmentEngine()
-        assessment = engine.start_enhanced_assessment(user_id, assessment_type)
+        assessment = enhanced_assessment_engine.start_enhanced_assessment(user_id, assessment_type)
 
-        session['enhanced_assessment'] = assessment
+        record = EnhancedAssessment(
+            id=assessment['id'],
+            user_id=user_id,
+            assessment_type=assessment_type,
+            current_phase=assessment['current_phase'],
+            completion_status=assessment['completion_status'],
+        )
+        db.session.add(record)
+        db.session.commit()
 
-        return jsonify({"success": True, "data": assessment})
+        session['enhanced_assessment_id'] = record.id
+
+        return jsonify({"success": True, "data": record.to_dict()})
     except Exception as e:
+        db.session.rollback()
         return jsonify({"success": False, "error": str(e)}), 400
 
 
 @enhanced_assessment_bp.route('/complete-phase', methods=['POST'])
 def complete_phase():
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         assessment_id = data.get('assessment_id')
-        phase_number = data.get('phase_number')
+        try:
+            phase_number = int(data.get('phase_number'))
+        except (TypeError, ValueError):
+            phase_number = None
+        # Scores are kept per phase; an unknown phase would break every later summary
+        if phase_number not in ENHANCED_PHASES:
+            return jsonify({
+                "success": False,
+                "error": f"phase_number must be one of {sorted(ENHANCED_PHASES)}",
+            }), 400
         phase_data = data.get('phase_data', {})
 
-        engine = EnhancedAssessmentEngine()
-        phase_result = engine.complete_phase(assessment_id, phase_number, phase_data)
+        record = _load_assessment(assessment_id)
+        if not record:
+            return jsonify({"success": False, "error": "Assessment not found"}), 404
 
-        assessment = session.get('enhanced_assessment', {})
-        if 'phase_results' not in assessment:
-            assessment['phase_results'] = {}
-        assessment['phase_results'][phase_number] = phase_result
-        assessment['current_phase'] = phase_number + 1
-        session['enhanced_assessment'] = assessment
+        phase_result = enhanced_assessment_engine.complete_phase(record.id, phase_number, phase_data)
+        enhanced_assessment_engine.apply_phase_result(record, phase_result)
+        db.session.commit()
+
+        session['enhanced_assessment_id'] = record.id
 
         return jsonify({"success": True, "data": phase_result})
     except Exception as e:
+        db.session.rollback()
         return jsonify({"success": False, "error": str(e)}), 400
 
 
 @enhanced_assessment_bp.route('/final-results', methods=['POST'])
 def get_final_results():
     try:
-        assessment = session.get('enhanced_assessment', {})
-        phase_results = assessment.get('phase_results', {})
+        data = request.get_json(silent=True) or {}
+        record = _load_assessment(data.get('assessment_id'))
+        if not record:
+            return jsonify({"success": False, "error": "Assessment not found"}), 404
 
-        engine = EnhancedAssessmentEngine()
-        final_results = engine.calculate_overall_assessment(phase_results)
+        final_results = enhanced_assessment_engine.summarize_record(record)
 
-        assessment['final_results'] = final_results
-        assessment['completion_status'] = 'completed'
-        assessment['completed_at'] = datetime.now().isoformat()
-        session['enhanced_assessment'] = assessment
+        record.final_results = json.dumps(final_results)
+        record.completion_status = 'completed'
+        record.completed_at = datetime.utcnow()
+        db.session.commit()
 
-        return jsonify({"success": True, "data": {"assessment": assessment, "final_results": final_results}})
+        return jsonify({"success": True, "data": {"assessment": record.to_dict(), "final_results": final_results}})
     except Exception as e:
+        db.session.rollback()
         return jsonify({"success": False, "error": str(e)}), 400
 
 
 @enhanced_assessment_bp.route('/status', methods=['GET'])
 def get_assessment_status():
     try:
-        assessment = session.get('enhanced_assessment', {})
-        return jsonify({"success": True, "data": assessment})
+        record = _load_assessment(request.args.get('assessment_id'))
+        if not record:
+            return jsonify({"success": True, "data": {}})
+
+        session['enhanced_assessment_id'] = record.id
+        return jsonify({"success": True, "data": record.to_dict()})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
@@ -1,84 +1,176 @@
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, Response, request, jsonify, session, stream_with_context
+from sqlalchemy import func
 from datetime import datetime
 import json
 import uuid
+from src.models.assessment import (
+    db,
+    MindMap,
+    MindMapConnection,
+    MindMapNode,
+    MindMapScenario,
+)
+from src.utils.catalog import freeze
+from src.utils.keyword_classifier import KeywordClassifier
+from src.services.graph_layout import DEFAULT_ITERATIONS, force_directed_layout
+from src.services.plan_export import (
+    EXPORT_FORMATS,
+    render_footer,
+    render_header,
+    render_section,
+    section_cache,
+)
+from src.services.scenario_simulation import (
+    DEFAULT_PATHS,
+    DEFAULT_PERCENTILES,
+    DEFAULT_GRID_YEARS,
+    DEFAULT_YEARS,
+    evaluate_projection_grid,
+    simulate_scenario,
+    template_distributions,
+)
 
 mind_mapping_bp = Blueprint('mind_mapping', __name__)
 
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+
+# Stands in for the map's scenarios among a plan section's sources
+SCENARIO_SOURCE = "scenarios"
+
+# (key, title, generator method, node categories the section draws on)
+PLAN_SECTIONS = (
+    ("executive_summary", "Executive Summary", "_generate_executive_summary", ("core",)),
+    ("company_description", "Company Description", "_generate_company_description", ("core",)),
+    ("market_analysis", "Market Analysis", "_generate_market_analysis", ("market",)),
+    ("organization_management", "Organization & Management", "_generate_organization_section", ("team", "operations")),
+    ("service_product_line", "Service or Product Line", "_generate_product_section", ("core", "operations")),
+    ("marketing_sales", "Marketing & Sales", "_generate_marketing_section", ("market", "growth")),
+    ("funding_request", "Funding Request", "_generate_funding_section", ("financial",)),
+    ("financial_projections", "Financial Projections", "_generate_financial_section", ("financial", SCENARIO_SOURCE)),
+    ("appendix", "Appendix", "_generate_appendix", ()),
+)
+
+BUSINESS_MODEL_ELEMENTS = freeze({
+    "core": {
+        "value_proposition": "What unique value do you provide?",
+        "target_customer": "Who is your ideal customer?",
+        "problem_solution": "What problem are you solving?",
+    },
+    "operations": {
+        "key_activities": "What key activities does your business require?",
+        "key_resources": "What key resources do you need?",
+        "key_partnerships": "Who are your key partners?",
+    },
+    "financial": {
+        "revenue_streams": "How will you make money?",
+        "cost_structure": "What are your main costs?",
+        "pricing_strategy": "How will you price your offering?",
+    },
+    "market": {
+        "market_size": "How big is your market?",
+        "competition": "Who are your competitors?",
+        "marketing_channels": "How will you reach customers?",
+    },
+    "team": {
+        "team_structure": "What team do you need?",
+        "advisors": "Who will advise you?",
+        "culture": "What culture will you build?",
+    },
+    "growth": {
+        "scaling_strategy": "How will you scale?",
+        "expansion_plans": "Where will you expand?",
+        "exit_strategy": "What's your exit strategy?",
+    },
+})
+
+AI_SUGGESTIONS = freeze({
+    "value_proposition": [
+        "Consider the jobs-to-be-done framework",
+        "Focus on emotional and functional benefits",
+        "Quantify the value you provide",
+        "Test with real customers early",
+    ],
+    "target_customer": [
+        "Create detailed customer personas",
+        "Identify early adopters vs mainstream market",
+        "Consider customer lifetime value",
+        "Map the customer journey",
+    ],
+    "revenue_streams": [
+        "Consider recurring revenue models",
+        "Explore multiple revenue streams",
+        "Think about pricing psychology",
+        "Plan for revenue diversification",
+    ],
+})
+
+SCENARIO_TEMPLATES = freeze({
+    "conservative": {
+        "growth_rate": 0.1,
+        "market_penetration": 0.01,
+        "risk_level": "low",
+    },
+    "optimistic": {
+        "growth_rate": 0.3,
+        "market_penetration": 0.05,
+        "risk_level": "medium",
+    },
+    "aggressive": {
+        "growth_rate": 0.5,
+        "market_penetration": 0.1,
+        "risk_level": "high",
+    },
+})
+
+CATEGORY_POSITIONS = freeze({
+    "core": {"x": 400, "y": 300},
+    "operations": {"x": 200, "y": 150},
+    "financial": {"x": 600, "y": 150},
+    "market": {"x": 700, "y": 300},
+    "team": {"x": 600, "y": 450},
+    "growth": {"x": 200, "y": 450},
+})
+
+NODE_RELATIONSHIPS = freeze({
+    "customer": ["target_customer", "marketing_channels", "value_proposition"],
+    "revenue": ["revenue_streams", "pricing_strategy", "cost_structure"],
+    "team": ["team_structure", "key_activities", "culture"],
+    "technology": ["key_resources", "key_activities", "scaling_strategy"],
+})
+
+RELATIONSHIP_CLASSIFIER = KeywordClassifier({keyword: [keyword] for keyword in NODE_RELATIONSHIPS})
+CONTENT_TERM_CLASSIFIER = KeywordClassifier(
+    {term: [term] for term in ("customer", "pain", "revenue", "competition", "advantage")}
+)
+
+SCENARIO_RISKS = freeze({
+    "low": [
+        "Market saturation",
+        "Slow customer adoption",
+        "Operational inefficiencies",
+    ],
+    "medium": [
+        "Competitive pressure",
+        "Technology disruption",
+        "Regulatory changes",
+        "Funding challenges",
+    ],
+    "high": [
+        "Market volatility",
+        "Execution risks",
+        "Team scalability",
+        "Cash flow management",
+        "Product-market fit",
+    ],
+})
+
 
 class MindMappingTool:
     def __init__(self):
-        self.business_model_elements = {
-            "core": {
-                "value_proposition": "What unique value do you provide?",
-                "target_customer": "Who is your ideal customer?",
-                "problem_solution": "What problem are you solving?",
-            },
-            "operations": {
-                "key_activities": "What key activities does your business require?",
-                "key_resources": "What key resources do you need?",
-                "key_partnerships": "Who are your key partners?",
-            },
-            "financial": {
-                "revenue_streams": "How will you make money?",
-                "cost_structure": "What are your main costs?",
-                "pricing_strategy": "How will you price your offering?",
-            },
-            "market": {
-                "market_size": "How big is your market?",
-                "competition": "Who are your competitors?",
-                "marketing_channels": "How will you reach customers?",
-            },
-            "team": {
-                "team_structure": "What team do you need?",
-                "advisors": "Who will advise you?",
-                "culture": "What culture will you build?",
-            },
-            "growth": {
-                "scaling_strategy": "How will you scale?",
-                "expansion_plans": "Where will you expand?",
-                "exit_strategy": "What's your exit strategy?",
-            },
-        }
-
-        self.ai_suggestions = {
-            "value_proposition": [
-                "Consider the jobs-to-be-done framework",
-                "Focus on emotional and functional benefits",
-                "Quantify the value you provide",
-                "Test with real customers early",
-            ],
-            "target_customer": [
-                "Create detailed customer personas",
-                "Identify early adopters vs mainstream market",
-                "Consider customer lifetime value",
-                "Map the customer journey",
-            ],
-            "revenue_streams": [
-                "Consider recurring revenue models",
-                "Explore multiple revenue streams",
-                "Think about pricing psychology",
-                "Plan for revenue diversification",
-            ],
-        }
-
-        self.scenario_templates = {
-            "conservative": {
-                "growth_rate": 0.1,
-                "market_penetration": 0.01,
-                "risk_level": "low",
-            },
-            "optimistic": {
-                "growth_rate": 0.3,
-                "market_penetration": 0.05,
-                "risk_level": "medium",
-            },
-            "aggressive": {
-                "growth_rate": 0.5,
-                "market_penetration": 0.1,
-                "risk_level": "high",
-            },
-        }
+        self.business_model_elements = BUSINESS_MODEL_ELEMENTS
+        self.ai_suggestions = AI_SUGGESTIONS
+        self.scenario_templates = SCENARIO_TEMPLATES
 
     def create_mind_map(self, user_id, business_idea):
         """Create a new mind map for business strategy development"""
@@ -141,15 +233,7 @@ class MindMappingTool:
 
     def _calculate_position(self, category, node_id):
         """Calculate position for category nodes in circular layout"""
-        positions = {
-            "core": {"x": 400, "y": 300},
-            "operations": {"x": 200, "y": 150},
-            "financial": {"x": 600, "y": 150},
-            "market": {"x": 700, "y": 300},
-            "team": {"x": 600, "y": 450},
-            "growth": {"x": 200, "y": 450},
-        }
-        return positions.get(category, {"x": 400, "y": 300})
+        return dict(CATEGORY_POSITIONS.get(category, {"x": 400, "y": 300}))
 
     def _calculate_child_position(self, category, element, node_id):
         """Calculate position for child nodes around parent"""
@@ -172,6 +256,112 @@ class MindMappingTool:
             "overall": 0,
         }
 
+    def build_records(self, mind_map):
+        """Turn a freshly created mind map into its map and node rows"""
+        element_counts = dict.fromkeys(self.business_model_elements, 0)
+        node_records = []
+        nodes = mind_map["nodes"]
+        for node in nodes.values():
+            if node["type"] == "element":
+                category = nodes[node["parent"]]["category"]
+                element_counts[category] += 1
+            else:
+                category = node["category"]
+            node_records.append(MindMapNode(
+                mind_map_id=mind_map["id"],
+                node_id=node["id"],
+                # Node ids carry their creation index, which keeps categories
+                # ahead of their elements when paging
+                sort_order=int(node["id"].rsplit("_", 1)[1]),
+                node_type=node["type"],
+                label=node["label"],
+                category=category,
+                question=node.get("question"),
+                answer=node.get("answer"),
+                x=node["position"]["x"],
+                y=node["position"]["y"],
+                completed=node["completed"],
+                parent_id=node.get("parent"),
+                children=json.dumps(node["children"]) if "children" in node else None,
+            ))
+
+        record = MindMap(
+            id=mind_map["id"],
+            user_id=mind_map["user_id"],
+            business_idea=mind_map["business_idea"],
+            revision=0,
+            element_counts=json.dumps(element_counts),
+            completed_counts=json.dumps(dict.fromkeys(element_counts, 0)),
+        )
+        return record, node_records
+
+    def apply_node_update(self, record, node, data):
+        """Apply an answer and/or move to one stored node.
+
+        Only the node row and the map's counters are written, so the cost of
+        an edit does not depend on the size of the map.
+        """
+        if "answer" in data and node.node_type == "element":
+            answer = data.get("answer") or ""
+            completed = bool(answer.strip())
+            if completed != bool(node.completed):
+                record.adjust_completed(node.category, 1 if completed else -1)
+            node.answer = answer
+            node.completed = completed
+
+        position = data.get("position")
+        if isinstance(position, dict):
+            node.x = float(position.get("x", node.x))
+            node.y = float(position.get("y", node.y))
+
+        record.revision += 1
+        node.revision = record.revision
+
+    def compute_layout(self, nodes, connections, layout_revision=None, full=False,
+                       iterations=DEFAULT_ITERATIONS, seed=None):
+        """Force-directed positions for stored nodes, keyed by node id.
+
+        After a first full layout only the endpoints of connections added
+        since ``layout_revision`` are moved; every other node keeps its
+        position and is held fixed, so an unchanged map costs nothing.
+        """
+        index = {node.node_id: i for i, node in enumerate(nodes)}
+        edges = [
+            (index[node.node_id], index[node.parent_id])
+            for node in nodes if node.parent_id in index
+        ]
+        edges.extend(
+            (index[connection.source_node], index[connection.target_node])
+            for connection in connections
+            if connection.source_node in index and connection.target_node in index
+        )
+
+        if full or layout_revision is None:
+            positions = force_directed_layout(len(nodes), edges, iterations=iterations, seed=seed)
+            moved = range(len(nodes))
+        else:
+            moved = sorted({
+                index[node_id]
+                for connection in connections if connection.revision > layout_revision
+                for node_id in (connection.source_node, connection.target_node)
+                if node_id in index
+            })
+            if not moved:
+                return {}
+            fixed = [True] * len(nodes)
+            for i in moved:
+                fixed[i] = False
+            positions = force_directed_layout(
+                len(nodes), edges,
+                positions=[(node.x or 0.0, node.y or 0.0) for node in nodes],
+                fixed=fixed, iterations=iterations, seed=seed,
+            )
+
+        return {
+            nodes[i].node_id: {"x": round(float(positions[i, 0]), 1), "y": round(float(positions[i, 1]), 1)}
+            for i in moved
+        }
+
     def update_node(self, mind_map_id, node_id, data):
         """Update a specific node in the mind map"""
         update_result = {
@@ -188,7 +378,7 @@ class MindMappingTool:
         """Get AI-powered suggestions for node improvement"""
         element_type = data.get('label', '').lower().replace(' ', '_')
 
-        suggestions = self.ai_suggestions.get(element_type, [])
+        suggestions = list(self.ai_suggestions.get(element_type, ()))
 
         if data.get('answer'):
             content_suggestions = self._analyze_content_for_suggestions(data['answer'])
@@ -199,24 +389,24 @@ class MindMappingTool:
     def _analyze_content_for_suggestions(self, content):
         """Analyze content and provide contextual suggestions"""
         suggestions = []
-        content_lower = content.lower()
+        terms = CONTENT_TERM_CLASSIFIER.matched_keywords(content)
 
         if len(content.split()) < 10:
             suggestions.append(
                 "Consider providing more detail to strengthen this element"
             )
 
-        if "customer" in content_lower and "pain" not in content_lower:
+        if "customer" in terms and "pain" not in terms:
             suggestions.append(
                 "Consider explicitly mentioning customer pain points"
             )
 
-        if "revenue" in content_lower and "$" not in content:
+        if "revenue" in terms and "$" not in content:
             suggestions.append(
                 "Consider adding specific financial projections"
             )
 
-        if "competition" in content_lower and "advantage" not in content_lower:
+        if "competition" in terms and "advantage" not in terms:
             suggestions.append("Highlight your competitive advantages")
 
         return suggestions
@@ -224,18 +414,10 @@ class MindMappingTool:
     def _find_related_nodes(self, node_id, data):
         """Find nodes that should be connected based on content"""
         related_nodes = []
-        content = data.get('answer', '').lower()
-
-        relationship_map = {
-            "customer": ["target_customer", "marketing_channels", "value_proposition"],
-            "revenue": ["revenue_streams", "pricing_strategy", "cost_structure"],
-            "team": ["team_structure", "key_activities", "culture"],
-            "technology": ["key_resources", "key_activities", "scaling_strategy"],
-        }
+        content = data.get('answer', '')
 
-        for keyword, related_elements in relationship_map.items():
-            if keyword in content:
-                related_nodes.extend(related_elements)
+        for keyword in RELATIONSHIP_CLASSIFIER.categories_present(content):
+            related_nodes.extend(NODE_RELATIONSHIPS[keyword])
 
         return list(set(related_nodes))
 
@@ -266,8 +448,8 @@ class MindMappingTool:
         """Calculate the strength of connection between nodes"""
         return 0.7
 
-    def create_scenario(self, mind_map_id, scenario_name, scenario_type="custom"):
-        """Create a new business scenario"""
+    def create_scenario(self, mind_map_id, scenario_name, scenario_type="custom", simulation=None):
+        """Create a new business scenario, optionally with Monte Carlo risk ranges"""
         scenario_id = str(uuid.uuid4())
 
         if scenario_type in self.scenario_templates:
@@ -286,8 +468,56 @@ class MindMappingTool:
             "created_at": datetime.now().isoformat(),
         }
 
+        if simulation is not None:
+            scenario["simulation"] = self._simulate_projections(template, simulation)
+
         return scenario
 
+    def _simulate_projections(self, template, options):
+        """Run the Monte Carlo simulator, defaulting distributions to the template"""
+        if not isinstance(options, dict):
+            options = {}
+        distributions = template_distributions(template)
+        for parameter in ("growth_rate", "churn_rate", "market_penetration"):
+            if parameter in options:
+                distributions[parameter] = options[parameter]
+
+        return simulate_scenario(
+            years=options.get("years", DEFAULT_YEARS),
+            paths=options.get("paths", DEFAULT_PATHS),
+            percentiles=options.get("percentiles", DEFAULT_PERCENTILES),
+            seed=options.get("seed"),
+            **distributions,
+        )
+
+    def evaluate_scenario_grid(self, options):
+        """Evaluate projections for a grid of scenario parameters in one pass.
+
+        ``scenario_types`` compares the named templates side by side; otherwise
+        ``growth_rate`` and ``market_penetration`` ranges span a full grid.
+        """
+        years = options.get("years", DEFAULT_GRID_YEARS)
+        scenario_types = options.get("scenario_types")
+        if scenario_types:
+            unknown = [name for name in scenario_types if name not in self.scenario_templates]
+            if unknown:
+                raise ValueError(f"Unknown scenario types: {', '.join(unknown)}")
+            templates = [self.scenario_templates[name] for name in scenario_types]
+            grid = evaluate_projection_grid(
+                [template["growth_rate"] for template in templates],
+                [template["market_penetration"] for template in templates],
+                years,
+                paired=True,
+            )
+            grid["axes"]["scenario"] = list(scenario_types)
+            return grid
+
+        return evaluate_projection_grid(
+            options.get("growth_rate", self.scenario_templates["conservative"]["growth_rate"]),
+            options.get("market_penetration", self.scenario_templates["conservative"]["market_penetration"]),
+            years,
+        )
+
     def _calculate_projections(self, template):
         """Calculate financial and growth projections"""
         growth_rate = template["growth_rate"]
@@ -317,28 +547,7 @@ class MindMappingTool:
         """Identify risks based on scenario parameters"""
         risk_level = template["risk_level"]
 
-        risk_map = {
-            "low": [
-                "Market saturation",
-                "Slow customer adoption",
-                "Operational inefficiencies",
-            ],
-            "medium": [
-                "Competitive pressure",
-                "Technology disruption",
-                "Regulatory changes",
-                "Funding challenges",
-            ],
-            "high": [
-                "Market volatility",
-                "Execution risks",
-                "Team scalability",
-                "Cash flow management",
-                "Product-market fit",
-            ],
-        }
-
-        return risk_map.get(risk_level, risk_map["medium"])
+        return SCENARIO_RISKS.get(risk_level, SCENARIO_RISKS["medium"])
 
     def _identify_opportunities(self, template):
         """Identify opportunities based on scenario parameters"""
@@ -369,19 +578,69 @@ class MindMappingTool:
     def export_business_plan(self, mind_map_id):
         """Export mind map as traditional business plan"""
         business_plan = {
-            "executive_summary": self._generate_executive_summary(),
-            "company_description": self._generate_company_description(),
-            "market_analysis": self._generate_market_analysis(),
-            "organization_management": self._generate_organization_section(),
-            "service_product_line": self._generate_product_section(),
-            "marketing_sales": self._generate_marketing_section(),
-            "funding_request": self._generate_funding_section(),
-            "financial_projections": self._generate_financial_section(),
-            "appendix": self._generate_appendix(),
+            key: getattr(self, generator)() for key, _, generator, _ in PLAN_SECTIONS
         }
 
         return business_plan
 
+    def stream_business_plan(self, record, fmt, cache=section_cache):
+        """Yield a stored mind map's business plan section by section.
+
+        Each rendered section is cached under the latest revision of the
+        nodes it draws on (and the scenario count for financials), so a
+        repeat export only re-renders sections whose sources changed.
+        """
+        revisions = dict(
+            db.session.query(MindMapNode.category, func.max(MindMapNode.revision))
+            .filter_by(mind_map_id=record.id, node_type="element")
+            .group_by(MindMapNode.category)
+        )
+        scenario_count = record.scenarios.count()
+
+        yield render_header(fmt, {
+            "mind_map_id": record.id,
+            "business_idea": record.business_idea,
+            "revision": record.revision,
+        })
+        for key, title, generator, sources in PLAN_SECTIONS:
+            signature = tuple(
+                scenario_count if source == SCENARIO_SOURCE else revisions.get(source, 0)
+                for source in sources
+            )
+            cache_key = (record.id, key, fmt, signature)
+            chunk = cache.get(cache_key)
+            if chunk is None:
+                chunk = render_section(
+                    fmt, key, title, getattr(self, generator)(), self._section_answers(record, sources)
+                )
+                cache.put(cache_key, chunk)
+            yield chunk
+        yield render_footer(fmt)
+
+    def _section_answers(self, record, sources):
+        """Answered elements, and scenarios where requested, feeding a plan section"""
+        categories = [source for source in sources if source != SCENARIO_SOURCE]
+        if categories:
+            nodes = (
+                record.nodes.filter(
+                    MindMapNode.node_type == "element",
+                    MindMapNode.category.in_(categories),
+                    MindMapNode.completed.is_(True),
+                )
+                .order_by(MindMapNode.sort_order)
+                .yield_per(500)
+            )
+            for node in nodes:
+                yield {"label": node.label, "answer": node.answer}
+
+        if SCENARIO_SOURCE in sources:
+            for scenario in record.scenarios.order_by(MindMapScenario.created_at).yield_per(100):
+                year_5 = scenario.to_dict().get("projections", {}).get("year_5", {})
+                yield {
+                    "label": f"Scenario: {scenario.name}",
+                    "answer": f"{scenario.scenario_type}, year 5 revenue {year_5.get('revenue', 0):,.0f}",
+                }
+
     def _generate_executive_summary(self):
         """Generate executive summary from mind map data"""
         return {
@@ -451,6 +710,22 @@ class MindMappingTool:
         }
 
 
+mind_mapping_tool = MindMappingTool()
+
+
+def _load_mind_map(mind_map_id=None, for_update=False):
+    """Resolve the stored mind map from an explicit id or the session"""
+    mind_map_id = mind_map_id or session.get('mind_map_id')
+    if not mind_map_id:
+        return None
+    return db.session.get(MindMap, mind_map_id, with_for_update=for_update)
+
+
+def _page_size():
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
 @mind_mapping_bp.route('/create', methods=['POST'])
 def create_mind_map():
     """Create a new mind map"""
@@ -459,12 +734,108 @@ def create_mind_map():
         user_id = data.get('user_id')
         business_idea = data.get('business_idea', '')
 
-        tool = MindMappingTool()
-        mind_map = tool.create_mind_map(user_id, business_idea)
+        mind_map = mind_mapping_tool.create_mind_map(user_id, business_idea)
+
+        record, node_records = mind_mapping_tool.build_records(mind_map)
+        db.session.add(record)
+        db.session.add_all(node_records)
+        db.session.commit()
 
-        session['current_mind_map'] = mind_map
+        session['mind_map_id'] = record.id
 
+        mind_map["revision"] = record.revision
         return jsonify({"success": True, "data": mind_map})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@mind_mapping_bp.route('/<mind_map_id>', methods=['GET'])
+def get_mind_map(mind_map_id):
+    """Get a stored mind map with the first page of its nodes"""
+    try:
+        record = _load_mind_map(mind_map_id)
+        if not record:
+            return jsonify({"success": False, "error": "Mind map not found"}), 404
+
+        limit = _page_size()
+        nodes = record.nodes.order_by(MindMapNode.sort_order).limit(limit + 1).all()
+
+        mind_map = record.to_dict()
+        mind_map["nodes"] = {node.node_id: node.to_dict() for node in nodes[:limit]}
+        mind_map["next_cursor"] = nodes[limit - 1].sort_order if len(nodes) > limit else None
+        mind_map["scenarios"] = {scenario.id: scenario.to_dict() for scenario in record.scenarios}
+        mind_map["connection_count"] = record.connections.count()
+
+        return jsonify({"success": True, "data": mind_map})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@mind_mapping_bp.route('/<mind_map_id>/nodes', methods=['GET'])
+def get_mind_map_nodes(mind_map_id):
+    """Page through a mind map's nodes by cursor"""
+    try:
+        record = _load_mind_map(mind_map_id)
+        if not record:
+            return jsonify({"success": False, "error": "Mind map not found"}), 404
+
+        limit = _page_size()
+        query = record.nodes.order_by(MindMapNode.sort_order)
+        cursor = request.args.get('cursor', type=int)
+        if cursor is not None:
+            query = query.filter(MindMapNode.sort_order > cursor)
+        nodes = query.limit(limit + 1).all()
+
+        return jsonify({"success": True, "data": {
+            "nodes": [node.to_dict() for node in nodes[:limit]],
+            "next_cursor": nodes[limit - 1].sort_order if len(nodes) > limit else None,
+        }})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@mind_mapping_bp.route('/<mind_map_id>/connections', methods=['GET'])
+def get_mind_map_connections(mind_map_id):
+    """Page through a mind map's connections by creation order"""
+    try:
+        record = _load_mind_map(mind_map_id)
+        if not record:
+            return jsonify({"success": False, "error": "Mind map not found"}), 404
+
+        limit = _page_size()
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        connections = (
+            record.connections.order_by(MindMapConnection.created_at, MindMapConnection.id)
+            .offset(offset)
+            .limit(limit + 1)
+            .all()
+        )
+
+        return jsonify({"success": True, "data": {
+            "connections": [connection.to_dict() for connection in connections[:limit]],
+            "next_offset": offset + limit if len(connections) > limit else None,
+        }})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@mind_mapping_bp.route('/<mind_map_id>/export', methods=['GET'])
+def stream_business_plan(mind_map_id):
+    """Stream a stored mind map as a Markdown, HTML or NDJSON business plan"""
+    try:
+        fmt = request.args.get('format', 'markdown')
+        if fmt not in EXPORT_FORMATS:
+            return jsonify({"success": False, "error": f"Unsupported format: {fmt}"}), 400
+
+        record = _load_mind_map(mind_map_id)
+        if not record:
+            return jsonify({"success": False, "error": "Mind map not found"}), 404
+
+        return Response(
+            stream_with_context(mind_mapping_tool.stream_business_plan(record, fmt)),
+            mimetype=EXPORT_FORMATS[fmt],
+        )
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
@@ -478,11 +849,24 @@ def update_node():
         node_id = data.get('node_id')
         node_data = data.get('node_data', {})
 
-        tool = MindMappingTool()
-        result = tool.update_node(mind_map_id, node_id, node_data)
+        record = _load_mind_map(mind_map_id, for_update=True)
+        if not record:
+            return jsonify({"success": False, "error": "Mind map not found"}), 404
+        node = db.session.get(MindMapNode, (record.id, node_id))
+        if not node:
+            return jsonify({"success": False, "error": "Node not found"}), 404
+
+        result = mind_mapping_tool.update_node(record.id, node_id, {"label": node.label, **node_data})
+        mind_mapping_tool.apply_node_update(record, node, node_data)
+        db.session.commit()
+
+        result["node"] = node.to_dict()
+        result["completion_status"] = record.completion_status()
+        result["revision"] = record.revision
 
         return jsonify({"success": True, "data": result})
     except Exception as e:
+        db.session.rollback()
         return jsonify({"success": False, "error": str(e)}), 400
 
 
@@ -497,13 +881,77 @@ def create_connection():
         connection_type = data.get('connection_type', 'related')
         description = data.get('description', '')
 
-        tool = MindMappingTool()
-        connection = tool.create_connection(
-            mind_map_id, source_node, target_node, connection_type, description
+        record = _load_mind_map(mind_map_id, for_update=True)
+        if not record:
+            return jsonify({"success": False, "error": "Mind map not found"}), 404
+        for node_id in (source_node, target_node):
+            if not db.session.get(MindMapNode, (record.id, node_id)):
+                return jsonify({"success": False, "error": f"Node not found: {node_id}"}), 404
+
+        connection = mind_mapping_tool.create_connection(
+            record.id, source_node, target_node, connection_type, description
         )
 
+        db.session.add(MindMapConnection(
+            id=connection["id"],
+            mind_map_id=record.id,
+            source_node=source_node,
+            target_node=target_node,
+            connection_type=connection_type,
+            description=description,
+            strength=connection["strength"],
+            revision=record.revision + 1,
+            created_at=datetime.fromisoformat(connection["created_at"]),
+        ))
+        record.revision += 1
+        db.session.commit()
+
         return jsonify({"success": True, "data": connection})
     except Exception as e:
+        db.session.rollback()
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@mind_mapping_bp.route('/layout', methods=['POST'])
+def layout_mind_map():
+    """Compute node positions server-side and store them"""
+    try:
+        data = request.get_json()
+        mind_map_id = data.get('mind_map_id')
+        full = bool(data.get('full', False))
+
+        record = _load_mind_map(mind_map_id, for_update=True)
+        if not record:
+            return jsonify({"success": False, "error": "Mind map not found"}), 404
+
+        nodes = record.nodes.order_by(MindMapNode.sort_order).all()
+        positions = mind_mapping_tool.compute_layout(
+            nodes,
+            record.connections.all(),
+            record.layout_revision,
+            full=full,
+            iterations=min(int(data.get('iterations', DEFAULT_ITERATIONS)), 500),
+            seed=data.get('seed'),
+        )
+
+        if positions:
+            record.revision += 1
+            for node in nodes:
+                position = positions.get(node.node_id)
+                if position:
+                    node.x, node.y = position["x"], position["y"]
+                    node.revision = record.revision
+        mode = "full" if full or record.layout_revision is None else "incremental"
+        record.layout_revision = record.revision
+        db.session.commit()
+
+        return jsonify({"success": True, "data": {
+            "mode": mode,
+            "positions": positions,
+            "revision": record.revision,
+        }})
+    except Exception as e:
+        db.session.rollback()
         return jsonify({"success": False, "error": str(e)}), 400
 
 
@@ -515,11 +963,41 @@ def create_scenario():
         mind_map_id = data.get('mind_map_id')
         scenario_name = data.get('scenario_name')
         scenario_type = data.get('scenario_type', 'custom')
+        simulation = data.get('simulation')
 
-        tool = MindMappingTool()
-        scenario = tool.create_scenario(mind_map_id, scenario_name, scenario_type)
+        record = _load_mind_map(mind_map_id, for_update=True)
+        if not record:
+            return jsonify({"success": False, "error": "Mind map not found"}), 404
+
+        scenario = mind_mapping_tool.create_scenario(
+            record.id, scenario_name, scenario_type, simulation
+        )
+
+        db.session.add(MindMapScenario(
+            id=scenario["id"],
+            mind_map_id=record.id,
+            name=scenario_name,
+            scenario_type=scenario_type,
+            scenario_data=json.dumps(scenario),
+        ))
+        record.revision += 1
+        db.session.commit()
 
         return jsonify({"success": True, "data": scenario})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"success": False, "error": str(e)}), 400
+
+
+@mind_mapping_bp.route('/scenario-grid', methods=['POST'])
+def scenario_grid():
+    """Evaluate projections across a grid of scenario parameters"""
+    try:
+        data = request.get_json()
+
+        grid = mind_mapping_tool.evaluate_scenario_grid(data)
+
+        return jsonify({"success": True, "data": grid})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
@@ -531,8 +1009,7 @@ def export_business_plan():
         data = request.get_json()
         mind_map_id = data.get('mind_map_id')
 
-        tool = MindMappingTool()
-        business_plan = tool.export_business_plan(mind_map_id)
+        business_plan = mind_mapping_tool.export_business_plan(mind_map_id)
 
         return jsonify({"success": True, "data": business_plan})
     except Exception as e:
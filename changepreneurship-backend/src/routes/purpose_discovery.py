@@ -1,36 +1,154 @@
 from flask import Blueprint, request, jsonify, session
 from datetime import datetime
 import json
+from src.utils.catalog import freeze
+from src.utils.keyword_classifier import KeywordClassifier
+from src.utils.result_cache import analysis_cache
 
 purpose_discovery_bp = Blueprint('purpose_discovery', __name__)
 
+# Bump when the analyses below return something different for the same input
+ENGINE_VERSION = "1"
+
+FIVE_WHYS_QUESTIONS = (
+    "What motivates you to start a business?",
+    "Why is that important to you?",
+    "Why does that matter in your life?",
+    "What deeper need does this fulfill?",
+    "What is the ultimate impact you want to make?",
+)
+
+LEGACY_PROMPTS = (
+    "How do you want to be remembered?",
+    "What problem in the world keeps you up at night?",
+    "If you could solve one major challenge, what would it be?",
+    "What would success look like in 20 years?",
+    "What legacy do you want to leave behind?",
+)
+
+IMPACT_CATEGORIES = (
+    "Environmental Impact",
+    "Social Impact",
+    "Economic Impact",
+    "Educational Impact",
+    "Health & Wellness Impact",
+    "Technology Innovation Impact",
+)
+
+MOTIVATION_KEYWORDS = freeze({
+    "impact": ["help", "change", "improve", "solve", "impact"],
+    "freedom": ["freedom", "independence", "control", "flexibility"],
+    "legacy": ["legacy", "remember", "future", "generations"],
+    "passion": ["love", "passionate", "excited", "enjoy"],
+    "financial": ["money", "financial", "wealth", "income"],
+})
+
+CLARITY_INDICATORS = ("because", "specifically", "exactly", "precisely")
+
+FOCUS_AREA_KEYWORDS = freeze({
+    "Technology": ["technology", "digital", "software", "app", "platform"],
+    "Healthcare": ["health", "medical", "wellness", "care", "treatment"],
+    "Education": ["education", "learning", "teaching", "knowledge", "skills"],
+    "Environment": ["environment", "green", "sustainable", "climate", "eco"],
+    "Social Impact": ["community", "social", "people", "society", "equality"],
+})
+
+MOTIVATION_CLASSIFIER = KeywordClassifier(MOTIVATION_KEYWORDS)
+CLARITY_CLASSIFIER = KeywordClassifier({"clarity": CLARITY_INDICATORS})
+FOCUS_AREA_CLASSIFIER = KeywordClassifier(FOCUS_AREA_KEYWORDS)
+
+IMPACT_STAKEHOLDERS = freeze({
+    "Environmental Impact": [
+        "Environmental groups",
+        "Government agencies",
+        "Local communities",
+    ],
+    "Social Impact": [
+        "Non-profits",
+        "Community leaders",
+        "Beneficiary groups",
+    ],
+    "Economic Impact": [
+        "Investors",
+        "Employees",
+        "Customers",
+        "Local economy",
+    ],
+    "Educational Impact": [
+        "Students",
+        "Educators",
+        "Institutions",
+        "Parents",
+    ],
+    "Health & Wellness Impact": [
+        "Patients",
+        "Healthcare providers",
+        "Insurance companies",
+    ],
+    "Technology Innovation Impact": [
+        "Tech community",
+        "Early adopters",
+        "Industry partners",
+    ],
+})
+
+IMPACT_METRICS = freeze({
+    "Environmental Impact": [
+        "Carbon footprint reduction",
+        "Waste reduction",
+        "Energy savings",
+    ],
+    "Social Impact": [
+        "Lives improved",
+        "Communities served",
+        "Social problems addressed",
+    ],
+    "Economic Impact": [
+        "Jobs created",
+        "Revenue generated",
+        "Economic growth",
+    ],
+    "Educational Impact": [
+        "Students educated",
+        "Skills developed",
+        "Knowledge transferred",
+    ],
+    "Health & Wellness Impact": [
+        "Health outcomes improved",
+        "Lives saved",
+        "Wellness metrics",
+    ],
+    "Technology Innovation Impact": [
+        "Innovations created",
+        "Efficiency gains",
+        "Problems solved",
+    ],
+})
+
+IMPACT_DIFFICULTY = freeze({
+    "Environmental Impact": 8,
+    "Social Impact": 7,
+    "Economic Impact": 6,
+    "Educational Impact": 5,
+    "Health & Wellness Impact": 9,
+    "Technology Innovation Impact": 7,
+})
+
+IMPACT_RESOURCES = freeze({
+    "Environmental Impact": "High",
+    "Social Impact": "Medium",
+    "Economic Impact": "High",
+    "Educational Impact": "Medium",
+    "Health & Wellness Impact": "Very High",
+    "Technology Innovation Impact": "High",
+})
+
 
 class PurposeDiscoveryModule:
     def __init__(self):
-        self.five_whys_questions = [
-            "What motivates you to start a business?",
-            "Why is that important to you?",
-            "Why does that matter in your life?",
-            "What deeper need does this fulfill?",
-            "What is the ultimate impact you want to make?",
-        ]
-
-        self.legacy_prompts = [
-            "How do you want to be remembered?",
-            "What problem in the world keeps you up at night?",
-            "If you could solve one major challenge, what would it be?",
-            "What would success look like in 20 years?",
-            "What legacy do you want to leave behind?",
-        ]
-
-        self.impact_categories = [
-            "Environmental Impact",
-            "Social Impact",
-            "Economic Impact",
-            "Educational Impact",
-            "Health & Wellness Impact",
-            "Technology Innovation Impact",
-        ]
+        self.five_whys_questions = FIVE_WHYS_QUESTIONS
+        self.legacy_prompts = LEGACY_PROMPTS
+        self.impact_categories = IMPACT_CATEGORIES
 
     def process_five_whys(self, responses):
         """Process the 5 Whys exercise responses and extract core purpose"""
@@ -48,22 +166,10 @@ class PurposeDiscoveryModule:
 
     def _extract_motivations(self, responses):
         """Extract key motivational themes from responses"""
-        motivation_keywords = {
-            "impact": ["help", "change", "improve", "solve", "impact"],
-            "freedom": ["freedom", "independence", "control", "flexibility"],
-            "legacy": ["legacy", "remember", "future", "generations"],
-            "passion": ["love", "passionate", "excited", "enjoy"],
-            "financial": ["money", "financial", "wealth", "income"],
-        }
-
-        motivations = {}
-        for category, keywords in motivation_keywords.items():
-            score = 0
-            for response in responses:
-                for keyword in keywords:
-                    if keyword.lower() in response.lower():
-                        score += 1
-            motivations[category] = score
+        motivations = dict.fromkeys(MOTIVATION_KEYWORDS, 0)
+        for response in responses:
+            for category, hits in MOTIVATION_CLASSIFIER.category_hits(response).items():
+                motivations[category] += hits
 
         return motivations
 
@@ -72,34 +178,16 @@ class PurposeDiscoveryModule:
         total_length = sum(len(response.split()) for response in responses)
         specificity_score = min(total_length / 50, 10)
 
-        clarity_indicators = ["because", "specifically", "exactly", "precisely"]
         clarity_bonus = sum(
-            1
-            for response in responses
-            for indicator in clarity_indicators
-            if indicator in response.lower()
+            len(CLARITY_CLASSIFIER.matched_keywords(response)) for response in responses
         )
 
         return min(specificity_score + clarity_bonus, 10)
 
     def _identify_focus_areas(self, responses):
         """Identify recommended business focus areas based on responses"""
-        focus_areas = []
-        combined_text = " ".join(responses).lower()
-
-        area_keywords = {
-            "Technology": ["technology", "digital", "software", "app", "platform"],
-            "Healthcare": ["health", "medical", "wellness", "care", "treatment"],
-            "Education": ["education", "learning", "teaching", "knowledge", "skills"],
-            "Environment": ["environment", "green", "sustainable", "climate", "eco"],
-            "Social Impact": ["community", "social", "people", "society", "equality"],
-        }
-
-        for area, keywords in area_keywords.items():
-            if any(keyword in combined_text for keyword in keywords):
-                focus_areas.append(area)
-
-        return focus_areas[:3]
+        combined_text = " ".join(responses)
+        return FOCUS_AREA_CLASSIFIER.categories_present(combined_text)[:3]
 
     def _generate_next_steps(self, responses):
         """Generate personalized next steps based on purpose discovery"""
@@ -173,113 +261,29 @@ class PurposeDiscoveryModule:
 
     def _analyze_stakeholders(self, impact_areas):
         """Analyze key stakeholders for each impact area"""
-        stakeholder_map = {
-            "Environmental Impact": [
-                "Environmental groups",
-                "Government agencies",
-                "Local communities",
-            ],
-            "Social Impact": [
-                "Non-profits",
-                "Community leaders",
-                "Beneficiary groups",
-            ],
-            "Economic Impact": [
-                "Investors",
-                "Employees",
-                "Customers",
-                "Local economy",
-            ],
-            "Educational Impact": [
-                "Students",
-                "Educators",
-                "Institutions",
-                "Parents",
-            ],
-            "Health & Wellness Impact": [
-                "Patients",
-                "Healthcare providers",
-                "Insurance companies",
-            ],
-            "Technology Innovation Impact": [
-                "Tech community",
-                "Early adopters",
-                "Industry partners",
-            ],
-        }
-
         relevant_stakeholders = {}
         for area in impact_areas:
-            if area in stakeholder_map:
-                relevant_stakeholders[area] = stakeholder_map[area]
+            if area in IMPACT_STAKEHOLDERS:
+                relevant_stakeholders[area] = IMPACT_STAKEHOLDERS[area]
 
         return relevant_stakeholders
 
     def _create_measurement_framework(self, impact_areas):
         """Create framework for measuring impact"""
-        metrics = {
-            "Environmental Impact": [
-                "Carbon footprint reduction",
-                "Waste reduction",
-                "Energy savings",
-            ],
-            "Social Impact": [
-                "Lives improved",
-                "Communities served",
-                "Social problems addressed",
-            ],
-            "Economic Impact": [
-                "Jobs created",
-                "Revenue generated",
-                "Economic growth",
-            ],
-            "Educational Impact": [
-                "Students educated",
-                "Skills developed",
-                "Knowledge transferred",
-            ],
-            "Health & Wellness Impact": [
-                "Health outcomes improved",
-                "Lives saved",
-                "Wellness metrics",
-            ],
-            "Technology Innovation Impact": [
-                "Innovations created",
-                "Efficiency gains",
-                "Problems solved",
-            ],
-        }
-
         framework = {}
         for area in impact_areas:
-            if area in metrics:
-                framework[area] = metrics[area]
+            if area in IMPACT_METRICS:
+                framework[area] = IMPACT_METRICS[area]
 
         return framework
 
     def _assess_difficulty(self, area):
         """Assess difficulty level for impact area"""
-        difficulty_levels = {
-            "Environmental Impact": 8,
-            "Social Impact": 7,
-            "Economic Impact": 6,
-            "Educational Impact": 5,
-            "Health & Wellness Impact": 9,
-            "Technology Innovation Impact": 7,
-        }
-        return difficulty_levels.get(area, 5)
+        return IMPACT_DIFFICULTY.get(area, 5)
 
     def _assess_resources(self, area):
         """Assess resource requirements for impact area"""
-        resource_levels = {
-            "Environmental Impact": "High",
-            "Social Impact": "Medium",
-            "Economic Impact": "High",
-            "Educational Impact": "Medium",
-            "Health & Wellness Impact": "Very High",
-            "Technology Innovation Impact": "High",
-        }
-        return resource_levels.get(area, "Medium")
+        return IMPACT_RESOURCES.get(area, "Medium")
 
     def _generate_activities(self, milestone):
         """Generate key activities for milestone"""
@@ -301,6 +305,9 @@ class PurposeDiscoveryModule:
         ]
 
 
+purpose_discovery_module = PurposeDiscoveryModule()
+
+
 @purpose_discovery_bp.route('/five-whys', methods=['POST'])
 def process_five_whys():
     """Process 5 Whys exercise"""
@@ -308,8 +315,10 @@ def process_five_whys():
         data = request.get_json()
         responses = data.get('responses', [])
 
-        module = PurposeDiscoveryModule()
-        result = module.process_five_whys(responses)
+        result = analysis_cache.get_or_compute(
+            "purpose-discovery/five-whys", ENGINE_VERSION, {"responses": responses},
+            lambda: purpose_discovery_module.process_five_whys(responses),
+        )
 
         session['five_whys_result'] = result
 
@@ -327,8 +336,11 @@ def create_legacy_statement():
         values = data.get('values', [])
         vision = data.get('vision', '')
 
-        module = PurposeDiscoveryModule()
-        result = module.create_legacy_statement(legacy_responses, values, vision)
+        result = analysis_cache.get_or_compute(
+            "purpose-discovery/legacy-statement", ENGINE_VERSION,
+            {"legacy_responses": legacy_responses, "values": values, "vision": vision},
+            lambda: purpose_discovery_module.create_legacy_statement(legacy_responses, values, vision),
+        )
 
         session['legacy_statement'] = result
 
@@ -346,8 +358,11 @@ def create_impact_visualization():
         scale = data.get('scale', {})
         timeline = data.get('timeline', {})
 
-        module = PurposeDiscoveryModule()
-        result = module.visualize_impact(impact_areas, scale, timeline)
+        result = analysis_cache.get_or_compute(
+            "purpose-discovery/impact-visualization", ENGINE_VERSION,
+            {"impact_areas": impact_areas, "scale": scale, "timeline": timeline},
+            lambda: purpose_discovery_module.visualize_impact(impact_areas, scale, timeline),
+        )
 
         session['impact_visualization'] = result
 
@@ -1,71 +1,214 @@
 import flask
 from flask import Blueprint, request, jsonify
 from datetime import datetime
+from src.services.market_data import market_data_store
+from src.services.opportunity_matching import OpportunityMatcher
+from src.utils.catalog import freeze
+from src.utils.keyword_classifier import KeywordClassifier
+from src.utils.result_cache import analysis_cache
 
 value_zone_bp = Blueprint('value_zone', __name__)
 
+# Bump when the analyses below return something different for the same input
+ENGINE_VERSION = "2"
+
+PASSION_CATEGORIES = (
+    "Technology & Innovation",
+    "Health & Wellness",
+    "Education & Learning",
+    "Environment & Sustainability",
+    "Arts & Creativity",
+    "Finance & Investment",
+    "Social Impact & Community",
+    "Sports & Fitness",
+    "Travel & Adventure",
+    "Food & Nutrition",
+    "Fashion & Beauty",
+    "Entertainment & Media",
+)
+
+SKILL_CATEGORIES = (
+    "Technical Skills",
+    "Creative Skills",
+    "Analytical Skills",
+    "Communication Skills",
+    "Leadership Skills",
+    "Sales & Marketing",
+    "Financial Management",
+    "Operations Management",
+    "Product Development",
+    "Customer Service",
+    "Strategic Planning",
+    "Problem Solving",
+)
+
+MARKET_INDICATORS = freeze({
+    "market_size": "Total addressable market size",
+    "growth_rate": "Annual market growth rate",
+    "competition_level": "Level of competition",
+    "customer_willingness": "Customer willingness to pay",
+    "market_trends": "Current market trends",
+    "barriers_to_entry": "Barriers to market entry",
+})
+
+# Used for ideas the market dataset has nothing on
+DEFAULT_MARKET_SIZE = 1000000000
+DEFAULT_GROWTH_RATE = 0.08
+DEFAULT_MARKET_TRENDS = (
+    "Digital transformation",
+    "Remote work adoption",
+    "Sustainability focus",
+    "AI integration",
+)
+DIFFERENTIATION_OPPORTUNITIES = ("Better UX", "Lower cost", "Niche focus")
+
+PASSION_BUSINESS_KEYWORDS = ("solve", "help", "improve", "create", "build", "impact")
+
+PASSION_CLASSIFIER = KeywordClassifier(
+    {category: category.lower().split() for category in PASSION_CATEGORIES}
+)
+BUSINESS_KEYWORD_CLASSIFIER = KeywordClassifier({"business": PASSION_BUSINESS_KEYWORDS})
+
+PASSION_FOCUS_AREAS = freeze({
+    "Technology & Innovation": [
+        "AI/ML applications",
+        "Mobile apps",
+        "SaaS platforms",
+    ],
+    "Health & Wellness": [
+        "Digital health",
+        "Fitness tech",
+        "Mental wellness",
+    ],
+    "Education & Learning": [
+        "Online courses",
+        "Skill platforms",
+        "Educational tools",
+    ],
+})
+
+ESSENTIAL_SKILLS = (
+    "Leadership Skills",
+    "Sales & Marketing",
+    "Financial Management",
+    "Strategic Planning",
+    "Communication Skills",
+)
+
+SKILL_DEVELOPMENT_ACTIONS = freeze({
+    "Leadership Skills": [
+        "Take leadership courses",
+        "Practice team management",
+        "Seek mentorship",
+        "Lead volunteer projects",
+    ],
+    "Sales & Marketing": [
+        "Study sales methodologies",
+        "Practice pitching",
+        "Learn digital marketing",
+        "Analyze successful campaigns",
+    ],
+    "Financial Management": [
+        "Learn financial modeling",
+        "Study accounting basics",
+        "Practice budgeting",
+        "Understand investment principles",
+    ],
+})
+
+SKILL_RESOURCES = freeze({
+    "Leadership Skills": [
+        "Harvard Business Review Leadership courses",
+        "Dale Carnegie Leadership Training",
+        "Local leadership workshops",
+    ],
+    "Sales & Marketing": [
+        "HubSpot Academy",
+        "Google Digital Marketing courses",
+        "Sales training programs",
+    ],
+    "Financial Management": [
+        "Coursera Financial Management courses",
+        "Khan Academy Finance",
+        "Local business finance workshops",
+    ],
+})
+
+OPPORTUNITY_MAP = freeze({
+    ("Technology & Innovation", "Technical Skills"): [
+        "SaaS platform development",
+        "Mobile app creation",
+        "AI/ML consulting",
+    ],
+    ("Health & Wellness", "Communication Skills"): [
+        "Health coaching platform",
+        "Wellness content creation",
+        "Telemedicine services",
+    ],
+    ("Education & Learning", "Creative Skills"): [
+        "Educational content creation",
+        "Online course development",
+        "Learning app design",
+    ],
+    ("Environment & Sustainability", "Operations Management"): [
+        "Recycling logistics service",
+        "Sustainable supply chain consulting",
+    ],
+    ("Arts & Creativity", "Sales & Marketing"): [
+        "Online art marketplace",
+        "Creative agency",
+    ],
+    ("Finance & Investment", "Analytical Skills"): [
+        "Personal finance coaching",
+        "Investment research newsletter",
+    ],
+    ("Social Impact & Community", "Leadership Skills"): [
+        "Community development nonprofit",
+        "Social enterprise incubator",
+    ],
+    ("Sports & Fitness", "Customer Service"): [
+        "Personal training studio",
+        "Fitness class booking platform",
+    ],
+    ("Travel & Adventure", "Strategic Planning"): [
+        "Boutique travel agency",
+        "Adventure tour operator",
+    ],
+    ("Food & Nutrition", "Product Development"): [
+        "Healthy meal kit brand",
+        "Specialty food products",
+    ],
+    ("Fashion & Beauty", "Creative Skills"): [
+        "Sustainable fashion label",
+        "Beauty content studio",
+    ],
+    ("Entertainment & Media", "Communication Skills"): [
+        "Podcast production company",
+        "Event hosting and promotion",
+    ],
+    ("Technology & Innovation", "Problem Solving"): [
+        "IT support and automation services",
+        "Software development agency",
+    ],
+    ("Health & Wellness", "Financial Management"): [
+        "Medical practice billing service",
+    ],
+})
+
+# Precomputed once; matches every passion x skill pair in one pass
+OPPORTUNITY_MATCHER = OpportunityMatcher.from_pairs(OPPORTUNITY_MAP)
+
+# Opportunities considered for each value zone
+ZONE_OPPORTUNITIES = 3
+
 
 class ValueZoneValidator:
     def __init__(self):
-        self.passion_categories = [
-            "Technology & Innovation",
-            "Health & Wellness",
-            "Education & Learning",
-            "Environment & Sustainability",
-            "Arts & Creativity",
-            "Finance & Investment",
-            "Social Impact & Community",
-            "Sports & Fitness",
-            "Travel & Adventure",
-            "Food & Nutrition",
-            "Fashion & Beauty",
-            "Entertainment & Media",
-        ]
-
-        self.skill_categories = [
-            "Technical Skills",
-            "Creative Skills",
-            "Analytical Skills",
-            "Communication Skills",
-            "Leadership Skills",
-            "Sales & Marketing",
-            "Financial Management",
-            "Operations Management",
-            "Product Development",
-            "Customer Service",
-            "Strategic Planning",
-            "Problem Solving",
-        ]
-
-        self.market_indicators = {
-            "market_size": "Total addressable market size",
-            "growth_rate": "Annual market growth rate",
-            "competition_level": "Level of competition",
-            "customer_willingness": "Customer willingness to pay",
-            "market_trends": "Current market trends",
-            "barriers_to_entry": "Barriers to market entry",
-        }
-
-        self.market_data = {
-            "Technology & Innovation": {
-                "market_size": 5000000000,
-                "growth_rate": 0.15,
-                "competition_level": "High",
-                "trends": ["AI/ML", "Cloud Computing", "Cybersecurity"],
-            },
-            "Health & Wellness": {
-                "market_size": 4500000000,
-                "growth_rate": 0.12,
-                "competition_level": "Medium",
-                "trends": ["Telemedicine", "Mental Health", "Preventive Care"],
-            },
-            "Education & Learning": {
-                "market_size": 3000000000,
-                "growth_rate": 0.10,
-                "competition_level": "Medium",
-                "trends": ["Online Learning", "Skill Development", "EdTech"],
-            },
-        }
+        self.passion_categories = PASSION_CATEGORIES
+        self.skill_categories = SKILL_CATEGORIES
+        self.market_indicators = MARKET_INDICATORS
+        self.market_data = market_data_store
+        self.opportunity_matcher = OPPORTUNITY_MATCHER
 
     def analyze_passions(self, passion_responses):
         """Analyze user's passions and interests"""
@@ -80,24 +223,20 @@ class ValueZoneValidator:
 
     def _identify_primary_passions(self, responses):
         """Identify the user's primary passion areas"""
-        passion_scores = {}
+        passion_scores = dict.fromkeys(self.passion_categories, 0)
 
-        for category in self.passion_categories:
-            score = 0
-            category_lower = category.lower()
-
-            for response in responses.values():
-                if isinstance(response, str):
-                    response_lower = response.lower()
-                    if any(
-                        word in response_lower for word in category_lower.split()
-                    ):
-                        score += 1
-                elif isinstance(response, (int, float)):
-                    if category in responses and response > 7:
-                        score += response
+        numeric_bonus = 0
+        for response in responses.values():
+            if isinstance(response, str):
+                for category in PASSION_CLASSIFIER.categories_present(response):
+                    passion_scores[category] += 1
+            elif isinstance(response, (int, float)) and response > 7:
+                numeric_bonus += response
 
-            passion_scores[category] = score
+        if numeric_bonus:
+            for category in self.passion_categories:
+                if category in responses:
+                    passion_scores[category] += numeric_bonus
 
         sorted_passions = sorted(
             passion_scores.items(), key=lambda x: x[1], reverse=True
@@ -120,42 +259,20 @@ class ValueZoneValidator:
         """Assess how well passions align with business potential"""
         alignment_score = 0
 
-        business_keywords = ["solve", "help", "improve", "create", "build", "impact"]
-
         for response in responses.values():
             if isinstance(response, str):
-                for keyword in business_keywords:
-                    if keyword.lower() in response.lower():
-                        alignment_score += 1
+                alignment_score += len(BUSINESS_KEYWORD_CLASSIFIER.matched_keywords(response))
 
-        return min(alignment_score / len(business_keywords), 1.0)
+        return min(alignment_score / len(PASSION_BUSINESS_KEYWORDS), 1.0)
 
     def _recommend_passion_focus(self, responses):
         """Recommend specific focus areas within passions"""
         recommendations = []
         primary_passions = self._identify_primary_passions(responses)
 
-        focus_map = {
-            "Technology & Innovation": [
-                "AI/ML applications",
-                "Mobile apps",
-                "SaaS platforms",
-            ],
-            "Health & Wellness": [
-                "Digital health",
-                "Fitness tech",
-                "Mental wellness",
-            ],
-            "Education & Learning": [
-                "Online courses",
-                "Skill platforms",
-                "Educational tools",
-            ],
-        }
-
         for passion in primary_passions:
-            if passion in focus_map:
-                recommendations.extend(focus_map[passion])
+            if passion in PASSION_FOCUS_AREAS:
+                recommendations.extend(PASSION_FOCUS_AREAS[passion])
 
         return recommendations[:5]
 
@@ -216,16 +333,8 @@ class ValueZoneValidator:
 
     def _identify_skill_gaps(self, responses):
         """Identify critical skill gaps for entrepreneurship"""
-        essential_skills = [
-            "Leadership Skills",
-            "Sales & Marketing",
-            "Financial Management",
-            "Strategic Planning",
-            "Communication Skills",
-        ]
-
         gaps = []
-        for skill in essential_skills:
+        for skill in ESSENTIAL_SKILLS:
             rating = responses.get(skill, 0)
             if rating < 6:
                 gaps.append(
@@ -261,52 +370,13 @@ class ValueZoneValidator:
 
     def _get_skill_development_actions(self, skill):
         """Get recommended actions for skill development"""
-        action_map = {
-            "Leadership Skills": [
-                "Take leadership courses",
-                "Practice team management",
-                "Seek mentorship",
-                "Lead volunteer projects",
-            ],
-            "Sales & Marketing": [
-                "Study sales methodologies",
-                "Practice pitching",
-                "Learn digital marketing",
-                "Analyze successful campaigns",
-            ],
-            "Financial Management": [
-                "Learn financial modeling",
-                "Study accounting basics",
-                "Practice budgeting",
-                "Understand investment principles",
-            ],
-        }
-
-        return action_map.get(
+        return SKILL_DEVELOPMENT_ACTIONS.get(
             skill, ["Study fundamentals", "Practice regularly", "Seek feedback"]
         )
 
     def _get_skill_resources(self, skill):
         """Get recommended resources for skill development"""
-        resource_map = {
-            "Leadership Skills": [
-                "Harvard Business Review Leadership courses",
-                "Dale Carnegie Leadership Training",
-                "Local leadership workshops",
-            ],
-            "Sales & Marketing": [
-                "HubSpot Academy",
-                "Google Digital Marketing courses",
-                "Sales training programs",
-            ],
-            "Financial Management": [
-                "Coursera Financial Management courses",
-                "Khan Academy Finance",
-                "Local business finance workshops",
-            ],
-        }
-
-        return resource_map.get(skill, ["Online courses", "Books", "Workshops"])
+        return SKILL_RESOURCES.get(skill, ["Online courses", "Books", "Workshops"])
 
     def _identify_competitive_advantages(self, responses, experience_data):
         """Identify unique competitive advantages from skills"""
@@ -343,14 +413,17 @@ class ValueZoneValidator:
     def analyze_market_demand(self, business_ideas, target_markets):
         """Analyze market demand for business ideas"""
         market_analysis = {}
+        markets = self.market_data.resolve_markets(business_ideas, target_markets)
 
         for idea in business_ideas:
+            market = markets[idea]
             analysis = {
-                "market_size": self._get_market_size(idea, target_markets),
-                "growth_rate": self._get_growth_rate(idea),
-                "competition_analysis": self._analyze_competition(idea),
-                "customer_demand": self._assess_customer_demand(idea),
-                "market_trends": self._get_market_trends(idea),
+                "market": market["name"] if market else None,
+                "market_size": self._get_market_size(market),
+                "growth_rate": self._get_growth_rate(market),
+                "competition_analysis": self._analyze_competition(market),
+                "customer_demand": self._assess_customer_demand(market),
+                "market_trends": self._get_market_trends(market),
                 "opportunity_score": 0,
             }
 
@@ -359,48 +432,43 @@ class ValueZoneValidator:
 
         return market_analysis
 
-    def _get_market_size(self, idea, target_markets):
+    def _get_market_size(self, market):
         """Get market size data for business idea"""
-        for market in target_markets:
-            if market in self.market_data:
-                return self.market_data[market]["market_size"]
+        return market["market_size"] if market else DEFAULT_MARKET_SIZE
 
-        return 1000000000
-
-    def _get_growth_rate(self, idea):
+    def _get_growth_rate(self, market):
         """Get market growth rate"""
-        return 0.08
+        return market["growth_rate"] if market else DEFAULT_GROWTH_RATE
 
-    def _analyze_competition(self, idea):
+    def _analyze_competition(self, market):
         """Analyze competition level"""
+        leader_share = market["leader_share"] if market else 30
         return {
-            "level": "Medium",
+            "level": market["competition_level"] if market else "Medium",
             "key_competitors": ["Competitor A", "Competitor B"],
-            "market_share_distribution": {"Leader": 30, "Others": 70},
-            "differentiation_opportunities": [
-                "Better UX",
-                "Lower cost",
-                "Niche focus",
-            ],
+            "market_share_distribution": {"Leader": leader_share, "Others": 100 - leader_share},
+            "differentiation_opportunities": list(DIFFERENTIATION_OPPORTUNITIES),
         }
 
-    def _assess_customer_demand(self, idea):
+    def _assess_customer_demand(self, market):
         """Assess customer demand indicators"""
+        if not market:
+            return {
+                "search_volume": 50000,
+                "willingness_to_pay": "High",
+                "pain_point_severity": "Medium",
+                "current_solutions": "Limited",
+            }
         return {
-            "search_volume": 50000,
-            "willingness_to_pay": "High",
-            "pain_point_severity": "Medium",
-            "current_solutions": "Limited",
+            "search_volume": market["search_volume"],
+            "willingness_to_pay": market["willingness_to_pay"],
+            "pain_point_severity": market["pain_point_severity"],
+            "current_solutions": market["current_solutions"],
         }
 
-    def _get_market_trends(self, idea):
+    def _get_market_trends(self, market):
         """Get relevant market trends"""
-        return [
-            "Digital transformation",
-            "Remote work adoption",
-            "Sustainability focus",
-            "AI integration",
-        ]
+        return market["trends"] if market else list(DEFAULT_MARKET_TRENDS)
 
     def _calculate_opportunity_score(self, analysis):
         """Calculate overall market opportunity score"""
@@ -439,64 +507,59 @@ class ValueZoneValidator:
         top_passions = passion_analysis["primary_passions"]
         core_skills = skill_analysis["core_skills"]
 
-        for passion in top_passions:
-            for skill in core_skills[:3]:
-                matching_opportunities = self._find_matching_opportunities(
-                    passion, skill, market_analysis
-                )
-
-                if matching_opportunities:
-                    value_zone = {
-                        "passion": passion,
-                        "skill": skill,
-                        "opportunities": matching_opportunities,
-                        "zone_score": self._calculate_zone_score(
-                            passion, skill, matching_opportunities
-                        ),
-                        "recommended_actions": self._get_zone_recommendations(
-                            passion, skill
-                        ),
-                        "success_probability": self._estimate_success_probability(
-                            passion_analysis, skill_analysis, matching_opportunities
-                        ),
-                    }
-                    value_zones.append(value_zone)
+        pairs = [(passion, skill) for passion in top_passions for skill in core_skills[:3]]
+        all_matches = self._find_matching_opportunities(pairs, market_analysis)
+
+        for (passion, skill), matching_opportunities in zip(pairs, all_matches):
+            if matching_opportunities:
+                value_zone = {
+                    "passion": passion,
+                    "skill": skill,
+                    "opportunities": matching_opportunities,
+                    "zone_score": self._calculate_zone_score(
+                        passion, skill, matching_opportunities
+                    ),
+                    "recommended_actions": self._get_zone_recommendations(
+                        passion, skill
+                    ),
+                    "success_probability": self._estimate_success_probability(
+                        passion_analysis, skill_analysis, matching_opportunities
+                    ),
+                }
+                value_zones.append(value_zone)
 
         value_zones.sort(key=lambda x: x["zone_score"], reverse=True)
 
         return value_zones[:5]
 
-    def _find_matching_opportunities(self, passion, skill, market_analysis):
-        """Find business opportunities that match passion-skill combination"""
-        opportunities = []
-
-        opportunity_map = {
-            ("Technology & Innovation", "Technical Skills"): [
-                "SaaS platform development",
-                "Mobile app creation",
-                "AI/ML consulting",
-            ],
-            ("Health & Wellness", "Communication Skills"): [
-                "Health coaching platform",
-                "Wellness content creation",
-                "Telemedicine services",
-            ],
-            ("Education & Learning", "Creative Skills"): [
-                "Educational content creation",
-                "Online course development",
-                "Learning app design",
-            ],
-        }
+    def _find_matching_opportunities(self, pairs, market_analysis):
+        """Find business opportunities for every passion-skill combination at once.
 
-        key = (passion, skill)
-        if key in opportunity_map:
-            for opp in opportunity_map[key]:
-                if opp in market_analysis:
-                    opportunities.append(
-                        {"opportunity": opp, "market_data": market_analysis[opp]}
-                    )
+        Catalogued opportunities the user has not analyzed yet get their
+        market data from the market dataset in one batch.
+        """
+        all_matches = self.opportunity_matcher.match(pairs, top_k=ZONE_OPPORTUNITIES)
 
-        return opportunities
+        unanalyzed = sorted({
+            match["name"] for matches in all_matches for match in matches
+            if match["name"] not in market_analysis
+        })
+        market_data = dict(market_analysis)
+        if unanalyzed:
+            market_data.update(self.analyze_market_demand(unanalyzed, []))
+
+        return [
+            [
+                {
+                    "opportunity": match["name"],
+                    "market_data": market_data[match["name"]],
+                    "match_score": match["score"],
+                    "match_type": match["match_type"],
+                }
+                for match in matches
+            ]
+            for matches in all_matches
+        ]
 
     def _calculate_zone_score(self, passion, skill, opportunities):
         """Calculate value zone score"""
@@ -541,6 +604,9 @@ class ValueZoneValidator:
         return min(base_probability, 0.9)
 
 
+value_zone_validator = ValueZoneValidator()
+
+
 @value_zone_bp.route('/analyze-passions', methods=['POST'])
 def analyze_passions():
     """Analyze user passions"""
@@ -548,8 +614,10 @@ def analyze_passions():
         data = request.get_json()
         passion_responses = data.get('passion_responses', {})
 
-        validator = ValueZoneValidator()
-        analysis = validator.analyze_passions(passion_responses)
+        analysis = analysis_cache.get_or_compute(
+            "value-zone/analyze-passions", ENGINE_VERSION, {"passion_responses": passion_responses},
+            lambda: value_zone_validator.analyze_passions(passion_responses),
+        )
 
         flask.session['passion_analysis'] = analysis
 
@@ -566,8 +634,11 @@ def analyze_skills():
         skill_responses = data.get('skill_responses', {})
         experience_data = data.get('experience_data', {})
 
-        validator = ValueZoneValidator()
-        analysis = validator.analyze_skills(skill_responses, experience_data)
+        analysis = analysis_cache.get_or_compute(
+            "value-zone/analyze-skills", ENGINE_VERSION,
+            {"skill_responses": skill_responses, "experience_data": experience_data},
+            lambda: value_zone_validator.analyze_skills(skill_responses, experience_data),
+        )
 
         flask.session['skill_analysis'] = analysis
 
@@ -584,8 +655,11 @@ def analyze_market():
         business_ideas = data.get('business_ideas', [])
         target_markets = data.get('target_markets', [])
 
-        validator = ValueZoneValidator()
-        analysis = validator.analyze_market_demand(business_ideas, target_markets)
+        analysis = analysis_cache.get_or_compute(
+            "value-zone/analyze-market", f"{ENGINE_VERSION}:{market_data_store.fingerprint}",
+            {"business_ideas": business_ideas, "target_markets": target_markets},
+            lambda: value_zone_validator.analyze_market_demand(business_ideas, target_markets),
+        )
 
         flask.session['market_analysis'] = analysis
 
@@ -613,8 +687,7 @@ def find_value_zones():
                 400,
             )
 
-        validator = ValueZoneValidator()
-        value_zones = validator.find_value_zone(
+        value_zones = value_zone_validator.find_value_zone(
             passion_analysis, skill_analysis, market_analysis
         )
 
@@ -0,0 +1,194 @@
+"""
+Assessment Scoring - vectorized batch scoring for enhanced assessments
+"""
+from typing import Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+PHASE_NUMBERS = tuple(range(1, 8))
+
+# Lowest overall score for each readiness level, best first
+READINESS_LEVELS = (
+    (8.5, "Highly Ready - Exceptional entrepreneurial potential"),
+    (7.0, "Ready - Strong foundation for entrepreneurship"),
+    (5.5, "Developing - Good potential with focused development"),
+    (4.0, "Emerging - Significant development needed"),
+    (float("-inf"), "Early Stage - Foundational work required"),
+)
+
+# Phase weights behind the success probability estimate
+SUCCESS_FACTORS = ((1, 0.3), (2, 0.25), (3, 0.25), (4, 0.2))
+MAX_SUCCESS_PROBABILITY = 0.9
+
+BUSINESS_PLAN_SECTIONS = 9
+
+
+def _count(value) -> int:
+    return len(value) if value else 0
+
+
+def _purpose_features(phase_data):
+    return (
+        phase_data.get('five_whys_result', {}).get('purpose_clarity_score', 0),
+        len(phase_data.get('legacy_statement', {}).get('statement', '').split()),
+        _count(phase_data.get('impact_visualization', {}).get('impact_map')),
+    )
+
+
+def _value_zone_features(phase_data):
+    markets = phase_data.get('market_analysis', {})
+    opportunity_total = sum([opp.get('opportunity_score', 0) for opp in markets.values()])
+    return (
+        phase_data.get('passion_analysis', {}).get('passion_intensity', 0),
+        _count(phase_data.get('skill_analysis', {}).get('core_skills')),
+        opportunity_total / max(len(markets), 1),
+    )
+
+
+def _strategy_features(phase_data):
+    nodes = phase_data.get('mind_map', {}).get('nodes', {})
+    completed = sum([1 for node in nodes.values() if node.get('completed', False)])
+    return (
+        completed,
+        len(nodes),
+        _count(phase_data.get('scenarios')),
+        _count(phase_data.get('connections')),
+    )
+
+
+def _market_features(phase_data):
+    return (
+        phase_data.get('market_size', 0),
+        _count(phase_data.get('competitive_analysis', {}).get('competitors')),
+        _count(phase_data.get('trend_analysis', {}).get('trends')),
+    )
+
+
+def _leadership_features(phase_data):
+    return (
+        phase_data.get('leadership_assessment', {}).get('overall_score', 0),
+        _count(phase_data.get('culture_definition', {}).get('elements')),
+        phase_data.get('communication_assessment', {}).get('score', 0),
+    )
+
+
+def _ai_features(phase_data):
+    return (
+        phase_data.get('ai_readiness', {}).get('overall_score', 0),
+        _count(phase_data.get('ai_opportunities')),
+        _count(phase_data.get('ai_roadmap', {}).get('phases')),
+    )
+
+
+def _business_plan_features(phase_data):
+    return (
+        _count(phase_data.get('business_plan')),
+        _count(phase_data.get('financial_projections', {}).get('years')),
+        _count(phase_data.get('implementation_roadmap', {}).get('milestones')),
+    )
+
+
+# Missing keys become zeros, which contribute nothing to the score just
+# like the absent keys do in EnhancedAssessmentEngine._score_*_phase
+PHASE_FEATURES = {
+    1: _purpose_features,
+    2: _value_zone_features,
+    3: _strategy_features,
+    4: _market_features,
+    5: _leadership_features,
+    6: _ai_features,
+    7: _business_plan_features,
+}
+
+
+def phase_features(phase_number: int, phase_data: Mapping) -> tuple:
+    """Flatten the inputs one phase score depends on into a tuple of numbers"""
+    extract = PHASE_FEATURES.get(phase_number)
+    return extract(phase_data) if extract else ()
+
+
+def score_phase_features(phase_number: int, features: np.ndarray) -> np.ndarray:
+    """Phase scores for an ``(N, F)`` feature array, mirroring _score_*_phase"""
+    f = features.T
+    if phase_number == 1:
+        score = f[0] / 10 * 4 + np.minimum(f[1] / 20, 3) + np.minimum(f[2] / 3, 3)
+    elif phase_number == 2:
+        score = f[0] / 10 * 3 + np.minimum(f[1] / 5, 3) + f[2] / 10 * 4
+    elif phase_number == 3:
+        score = f[0] / np.maximum(f[1], 1) * 5 + np.minimum(f[2] / 3, 3) + np.minimum(f[3] / 5, 2)
+    elif phase_number == 4:
+        score = 5 + np.where(f[0] > 100000000, 2, 0) + np.minimum(f[1] / 5, 2) + np.minimum(f[2] / 3, 1)
+    elif phase_number == 5:
+        score = f[0] / 10 * 4 + np.minimum(f[1] / 5, 3) + f[2] / 10 * 3
+    elif phase_number == 6:
+        score = f[0] / 10 * 4 + np.minimum(f[1] / 5, 3) + np.minimum(f[2] / 3, 3)
+    elif phase_number == 7:
+        score = f[0] / BUSINESS_PLAN_SECTIONS * 5 + np.minimum(f[1] / 5, 3) + np.minimum(f[2] / 10, 2)
+    else:
+        return np.full(len(features), 5.0)
+    return np.minimum(score, 10)
+
+
+def readiness_levels(overall_scores: np.ndarray) -> np.ndarray:
+    """Index into READINESS_LEVELS for every overall score"""
+    thresholds = np.array([threshold for threshold, _ in READINESS_LEVELS])
+    # Thresholds are descending; count how many a score falls short of
+    return (np.asarray(overall_scores)[:, None] < thresholds[None, :]).sum(axis=1)
+
+
+def score_batch(
+    assessments: Sequence[Mapping[int, Mapping]],
+    phase_weights: Mapping[int, float],
+) -> Dict[str, np.ndarray]:
+    """Score many assessments at once.
+
+    ``assessments`` holds one ``{phase_number: phase_data}`` mapping per
+    assessment. Features are gathered per phase into arrays, then the
+    phase scores, weighted overall score, readiness level and success
+    probability are computed column-wise. Phases an assessment has not
+    completed are NaN in ``phase_scores`` and left out of its overall score.
+    """
+    count = len(assessments)
+    phase_scores = np.full((count, len(PHASE_NUMBERS)), np.nan)
+    for column, phase_number in enumerate(PHASE_NUMBERS):
+        extract = PHASE_FEATURES[phase_number]
+        rows = [row for row, phases in enumerate(assessments) if phase_number in phases]
+        features = [extract(assessments[row][phase_number]) for row in rows]
+        if rows:
+            phase_scores[rows, column] = score_phase_features(phase_number, np.array(features, dtype=float))
+
+    completed = ~np.isnan(phase_scores)
+    scores = np.where(completed, phase_scores, 0.0)
+    weights = np.array([phase_weights.get(phase_number, 0) for phase_number in PHASE_NUMBERS], dtype=float)
+    weight_total = completed @ weights
+    weighted_sum = scores @ weights
+    overall = np.divide(weighted_sum, weight_total, out=np.zeros(count), where=weight_total > 0)
+
+    success = np.zeros(count)
+    for phase_number, weight in SUCCESS_FACTORS:
+        success += scores[:, phase_number - 1] * weight
+    success = np.round(np.minimum(success / 10, MAX_SUCCESS_PROBABILITY), 2)
+
+    return {
+        "phase_scores": phase_scores,
+        "weighted_score_sum": weighted_sum,
+        "weight_total": weight_total,
+        "overall_score": overall,
+        "readiness_level": readiness_levels(overall),
+        "success_probability": success,
+    }
+
+
+def readiness_label(level_index: int) -> str:
+    return READINESS_LEVELS[int(level_index)][1]
+
+
+def phase_weights_from(phases: Mapping, overrides: Optional[Mapping] = None) -> Dict[int, float]:
+    """Weights per phase from the phase catalog, optionally overridden"""
+    weights = {int(number): float(info['weight']) for number, info in phases.items()}
+    for number, weight in (overrides or {}).items():
+        number = int(number)
+        if number not in weights:
+            raise ValueError(f"Unknown phase: {number}")
+        weights[number] = float(weight)
+    return weights
@@ -0,0 +1,174 @@
+"""
+Graph Layout - vectorized force-directed placement for mind map nodes
+"""
+from typing import Optional
+
+import numpy as np
+
+DEFAULT_ITERATIONS = 50
+DEFAULT_IDEAL_DISTANCE = 80.0
+
+# Above this many nodes repulsion is bucketed on a grid instead of all pairs
+GRID_THRESHOLD = 100
+
+# Pull toward the centroid that keeps disconnected components together
+GRAVITY = 0.5
+
+# Cells per side of the coarse grid whose centroids stand in for far nodes
+FAR_FIELD_CELLS = 12
+
+# Neighbouring grid cells, including the node's own cell
+_CELL_OFFSETS = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)])
+
+
+def force_directed_layout(
+    node_count: int,
+    edges,
+    positions=None,
+    fixed=None,
+    iterations: int = DEFAULT_ITERATIONS,
+    ideal_distance: float = DEFAULT_IDEAL_DISTANCE,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """Lay out a graph with Fruchterman-Reingold forces.
+
+    ``edges`` is a sequence of ``(source, target)`` node indices. When
+    ``positions`` is given the layout starts from it, otherwise nodes are
+    scattered over a square sized for ``node_count``. Nodes flagged in
+    ``fixed`` keep their starting position and only act on the others,
+    which is how unchanged parts of a map are reused between layouts.
+
+    Small graphs use exact all-pairs repulsion. Larger ones bucket nodes
+    into cells twice the ideal distance wide: nodes in neighbouring cells
+    repel exactly, and everything further away is approximated Barnes-Hut
+    style by the centroids of a coarse grid, weighted by how many nodes
+    each coarse cell holds.
+    """
+    rng = np.random.default_rng(seed)
+    k = float(ideal_distance)
+    side = k * max(np.sqrt(node_count), 1.0) * 1.5
+
+    if positions is None:
+        pos = rng.uniform(0.0, side, (node_count, 2))
+    else:
+        pos = np.array(positions, dtype=float).reshape(node_count, 2)
+        # Coincident nodes have no direction to push apart in
+        pos += rng.uniform(-0.5, 0.5, pos.shape) * 1e-3 * k
+    fixed = np.zeros(node_count, dtype=bool) if fixed is None else np.asarray(fixed, dtype=bool)
+    if node_count < 2 or fixed.all():
+        return pos
+
+    edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+
+    temperature = side / 10
+    cooling = temperature / max(iterations, 1)
+    for _ in range(iterations):
+        if node_count > GRID_THRESHOLD:
+            displacement = _grid_repulsion(pos, k) + _far_field_repulsion(pos, k)
+        else:
+            displacement = _exact_repulsion(pos, k)
+        displacement -= _attraction(pos, edges, k)
+        displacement -= GRAVITY * (pos - pos.mean(axis=0))
+        displacement[fixed] = 0.0
+
+        length = np.hypot(displacement[:, 0], displacement[:, 1])
+        step = np.minimum(length, temperature) / np.maximum(length, 1e-9)
+        pos += displacement * step[:, None]
+        temperature = max(temperature - cooling, k * 0.01)
+
+    return pos
+
+
+def _exact_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    delta = pos[:, None, :] - pos[None, :, :]
+    distance_sq = np.einsum("ijk,ijk->ij", delta, delta)
+    np.fill_diagonal(distance_sq, np.inf)
+    # k^2 / d along the unit vector delta / d
+    scale = k * k / np.maximum(distance_sq, 1e-9)
+    return np.einsum("ij,ijk->ik", scale, delta)
+
+
+def _grid_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    node_count = len(pos)
+    cell_size = 2 * k
+    cells = ((pos - pos.min(axis=0)) // cell_size).astype(np.intp)
+    columns, rows = cells.max(axis=0) + 1
+    cell_x, cell_y = cells[:, 0], cells[:, 1]
+    cell_ids = cell_x * rows + cell_y
+
+    order = np.argsort(cell_ids, kind="stable")
+    cell_count = np.bincount(cell_ids, minlength=columns * rows)
+    cell_start = np.cumsum(cell_count) - cell_count
+
+    # Every (node, neighbouring cell) combination, then every node in that cell
+    neighbour_x = cell_x[:, None] + _CELL_OFFSETS[:, 0]
+    neighbour_y = cell_y[:, None] + _CELL_OFFSETS[:, 1]
+    valid = (neighbour_x >= 0) & (neighbour_x < columns) & (neighbour_y >= 0) & (neighbour_y < rows)
+    source = np.nonzero(valid)[0]
+    neighbour_ids = (neighbour_x * rows + neighbour_y)[valid]
+    counts = cell_count[neighbour_ids]
+
+    pair_source = np.repeat(source, counts)
+    block_offset = np.repeat(cell_start[neighbour_ids] - (np.cumsum(counts) - counts), counts)
+    pair_target = order[block_offset + np.arange(len(pair_source))]
+
+    x, y = pos[:, 0], pos[:, 1]
+    dx = x[pair_source] - x[pair_target]
+    dy = y[pair_source] - y[pair_target]
+    distance_sq = dx * dx + dy * dy
+    # Drops self pairs as well as pairs beyond the cut-off radius
+    keep = np.flatnonzero((distance_sq > 0) & (distance_sq < cell_size * cell_size))
+    pair_source = pair_source[keep]
+    scale = k * k / distance_sq[keep]
+
+    displacement = np.empty_like(pos)
+    displacement[:, 0] = np.bincount(pair_source, weights=dx[keep] * scale, minlength=node_count)
+    displacement[:, 1] = np.bincount(pair_source, weights=dy[keep] * scale, minlength=node_count)
+    return displacement
+
+
+def _far_field_repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    origin = pos.min(axis=0)
+    cell_size = max(np.ptp(pos, axis=0).max() / FAR_FIELD_CELLS, 2 * k) * (1 + 1e-9)
+    cells = np.floor((pos - origin) / cell_size).astype(np.intp)
+    cell_ids = cells[:, 0] * FAR_FIELD_CELLS + cells[:, 1]
+
+    counts = np.bincount(cell_ids, minlength=FAR_FIELD_CELLS * FAR_FIELD_CELLS)
+    occupied = np.flatnonzero(counts)
+    mass = counts[occupied].astype(float)
+    centroids = np.stack([
+        np.bincount(cell_ids, weights=pos[:, axis])[occupied] / mass for axis in range(2)
+    ], axis=1)
+
+    # Cells interact centroid to centroid, skipping adjacent cells whose
+    # nodes are already covered by the exact near field
+    occupied_cells = np.stack(np.divmod(occupied, FAR_FIELD_CELLS), axis=1)
+    far = np.abs(occupied_cells[:, None, :] - occupied_cells[None, :, :]).max(axis=2) > 1
+    delta = centroids[:, None, :] - centroids[None, :, :]
+    distance_sq = np.einsum("ijk,ijk->ij", delta, delta)
+    scale = np.where(far, mass * k * k / np.maximum(distance_sq, 1e-9), 0.0)
+    cell_force = np.einsum("ij,ijk->ik", scale, delta)
+
+    lookup = np.zeros((FAR_FIELD_CELLS * FAR_FIELD_CELLS, 2))
+    lookup[occupied] = cell_force
+    return lookup[cell_ids]
+
+
+def _attraction(pos: np.ndarray, edges: np.ndarray, k: float) -> np.ndarray:
+    """Net pull on each node from its edges, as a displacement to subtract"""
+    node_count = len(pos)
+    if not len(edges):
+        return np.zeros_like(pos)
+    source, target = edges[:, 0], edges[:, 1]
+    delta = pos[source] - pos[target]
+    # d^2 / k along the unit vector delta / d
+    pull = delta * (np.hypot(delta[:, 0], delta[:, 1]) / k)[:, None]
+
+    displacement = np.empty_like(pos)
+    for axis in range(2):
+        displacement[:, axis] = (
+            np.bincount(source, weights=pull[:, axis], minlength=node_count)
+            - np.bincount(target, weights=pull[:, axis], minlength=node_count)
+        )
+    return displacement
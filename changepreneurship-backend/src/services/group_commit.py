@@ -0,0 +1,164 @@
+"""
+Group Commit - coalesces small autosave writes into shared transactions
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy.engine import Connection, Engine
+
+from src.models.assessment import db
+
+DEFAULT_WINDOW_MS = 5
+DEFAULT_MAX_BATCH = 500
+DEFAULT_ACK_TIMEOUT = 30.0
+
+Operation = Callable[[Connection], Any]
+
+_writers_lock = threading.Lock()
+
+
+class GroupCommitWriter:
+    """Single writer thread that commits queued operations in groups.
+
+    Callers hand in ``operation(connection)`` callables and block on the
+    returned future. The writer gathers whatever arrives within
+    ``window_ms`` of the first queued operation (up to ``max_batch``), runs
+    them in one transaction and resolves every future only after that
+    transaction has committed, so an acknowledged write is as durable as
+    one committed on its own. On SQLite the writer's groups commit with
+    ``synchronous=FULL``: one fsync is now shared by the whole group, so
+    there is no reason to trade durability for speed. Pooled connections
+    get their configured setting back afterwards.
+
+    If a group fails, its operations are replayed one transaction each so
+    a single bad write only fails its own caller.
+    """
+
+    def __init__(self, engine: Engine, window_ms: float = DEFAULT_WINDOW_MS, max_batch: int = DEFAULT_MAX_BATCH):
+        self.engine = engine
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Optional[Tuple[Operation, Future]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.groups = 0
+        self.operations = 0
+        self.failures = 0
+
+    def submit(self, operation: Operation) -> Future:
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Group commit writer is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="group-commit-writer", daemon=True)
+                self._thread.start()
+            self._queue.put((operation, future))
+        return future
+
+    def execute(self, operation: Operation, timeout: float = DEFAULT_ACK_TIMEOUT) -> Any:
+        """Queue ``operation`` and wait until its group has committed"""
+        return self.submit(operation).result(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Commit what is already queued, then stop the writer thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._queue.put(None)
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self) -> Dict:
+        return {
+            "groups": self.groups,
+            "operations": self.operations,
+            "failures": self.failures,
+            "mean_group_size": round(self.operations / self.groups, 2) if self.groups else 0,
+            "queued": self._queue.qsize(),
+        }
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit_group(batch)
+
+    def _commit_group(self, batch: List[Tuple[Operation, Future]]) -> None:
+        pending = [(operation, future) for operation, future in batch if future.set_running_or_notify_cancel()]
+        if not pending:
+            return
+        try:
+            results = self._transaction([operation for operation, _ in pending])
+        except Exception:
+            # Find the culprit: retry each operation in a transaction of its own
+            for operation, future in pending:
+                try:
+                    result = self._transaction([operation])[0]
+                except Exception as e:
+                    self.failures += 1
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            self.groups += len(pending)
+        else:
+            for (_, future), result in zip(pending, results):
+                future.set_result(result)
+            self.groups += 1
+        self.operations += len(pending)
+
+    def _transaction(self, operations: List[Operation]) -> List[Any]:
+        with self.engine.connect() as connection:
+            if self.engine.dialect.name != "sqlite":
+                with connection.begin():
+                    return [operation(connection) for operation in operations]
+            # The connection returns to the app's pool; hand it back as configured
+            previous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+            connection.exec_driver_sql("PRAGMA synchronous=FULL")
+            connection.commit()
+            try:
+                with connection.begin():
+                    return [operation(connection) for operation in operations]
+            finally:
+                connection.exec_driver_sql(f"PRAGMA synchronous={previous}")
+                connection.commit()
+
+
+def group_commit_writer() -> Optional[GroupCommitWriter]:
+    """The app's writer when GROUP_COMMIT_ENABLED is set, created on first use"""
+    app = current_app._get_current_object()
+    if not app.config.get("GROUP_COMMIT_ENABLED"):
+        return None
+    writer = app.extensions.get("group_commit_writer")
+    if writer is None:
+        with _writers_lock:
+            writer = app.extensions.get("group_commit_writer")
+            if writer is None:
+                writer = GroupCommitWriter(
+                    db.engine,
+                    window_ms=float(app.config.get("GROUP_COMMIT_WINDOW_MS", DEFAULT_WINDOW_MS)),
+                    max_batch=int(app.config.get("GROUP_COMMIT_MAX_BATCH", DEFAULT_MAX_BATCH)),
+                )
+                app.extensions["group_commit_writer"] = writer
+    return writer
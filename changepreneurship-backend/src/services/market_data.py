@@ -0,0 +1,280 @@
+"""
+Market Data Store - indexed local market dataset for the value-zone validator
+"""
+import csv
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+DEFAULT_CSV_PATH = os.path.join(BASE_DIR, "data", "markets.csv")
+DEFAULT_DB_PATH = os.path.join(BASE_DIR, "database", "market_data.db")
+
+# Bumped whenever the table layout changes so existing files are rebuilt
+SCHEMA_VERSION = "1"
+
+# Stay well under SQLite's bound-parameter limit
+QUERY_CHUNK = 900
+
+MMAP_SIZE = 256 * 1024 * 1024
+
+LIST_SEPARATOR = ";"
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE markets (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    market_size INTEGER NOT NULL,
+    growth_rate REAL NOT NULL,
+    competition_level TEXT NOT NULL,
+    leader_share INTEGER NOT NULL,
+    search_volume INTEGER NOT NULL,
+    willingness_to_pay TEXT NOT NULL,
+    pain_point_severity TEXT NOT NULL,
+    current_solutions TEXT NOT NULL,
+    trends TEXT NOT NULL
+);
+CREATE TABLE market_keywords (
+    keyword TEXT NOT NULL,
+    market_id INTEGER NOT NULL REFERENCES markets (id),
+    PRIMARY KEY (keyword, market_id)
+) WITHOUT ROWID;
+"""
+
+_MARKET_COLUMNS = (
+    "name, market_size, growth_rate, competition_level, leader_share, search_volume, "
+    "willingness_to_pay, pain_point_severity, current_solutions, trends"
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric words, the unit keywords are matched on"""
+    return _TOKEN_PATTERN.findall(str(text).lower())
+
+
+def _split_list(value: str) -> List[str]:
+    return [item.strip() for item in (value or "").split(LIST_SEPARATOR) if item.strip()]
+
+
+def _chunks(values: Sequence, size: int = QUERY_CHUNK):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class MarketDataStore:
+    """Markets imported from CSV into a SQLite file and read lazily.
+
+    The file is rebuilt whenever the source CSV (or the schema) changes and
+    is otherwise shared by every worker process. Lookups are batched: one
+    indexed query for any number of market names, ids or keywords.
+    """
+
+    def __init__(self, csv_path: Optional[str] = None, db_path: Optional[str] = None):
+        self.csv_path = csv_path or os.environ.get("MARKET_DATA_CSV", DEFAULT_CSV_PATH)
+        self.db_path = db_path or os.environ.get("MARKET_DATA_DB", DEFAULT_DB_PATH)
+        self._fingerprint = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def fingerprint(self) -> str:
+        """Identifies the loaded dataset; loads it on first use"""
+        self._ensure_loaded()
+        return self._fingerprint
+
+    def import_csv(self, csv_path: Optional[str] = None) -> int:
+        """Bulk import a CSV, atomically replacing the current file.
+
+        Returns the number of markets imported.
+        """
+        with self._lock:
+            if csv_path:
+                self.csv_path = csv_path
+            fingerprint = self._source_fingerprint()
+            count = self._build(fingerprint)
+            self._fingerprint = fingerprint
+            self._generation += 1
+            return count
+
+    def count(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM markets").fetchone()[0]
+
+    def get_markets(self, names: Iterable[str]) -> Dict[str, Dict]:
+        """Markets by name (case-insensitive), keyed by the name as given"""
+        wanted = {str(name).lower(): name for name in names if name}
+        found = {}
+        connection = self._connection()
+        for chunk in _chunks(list(wanted)):
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                f"SELECT id, {_MARKET_COLUMNS} FROM markets WHERE name IN ({placeholders})", chunk
+            )
+            for row in rows:
+                found[wanted[row[1].lower()]] = self._record(row)
+        return found
+
+    def match_keywords(self, keywords: Iterable[str]) -> Dict[str, List[Tuple[int, int]]]:
+        """(market id, market size) pairs indexed under each keyword that has any"""
+        matches: Dict[str, List[Tuple[int, int]]] = {}
+        connection = self._connection()
+        for chunk in _chunks(sorted(set(keywords))):
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                "SELECT keyword, market_id, market_size FROM market_keywords "
+                f"JOIN markets ON markets.id = market_id WHERE keyword IN ({placeholders})",
+                chunk,
+            )
+            for keyword, market_id, market_size in rows:
+                matches.setdefault(keyword, []).append((market_id, market_size))
+        return matches
+
+    def get_markets_by_id(self, market_ids: Iterable[int]) -> Dict[int, Dict]:
+        found = {}
+        connection = self._connection()
+        for chunk in _chunks(sorted(set(market_ids))):
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                f"SELECT id, {_MARKET_COLUMNS} FROM markets WHERE id IN ({placeholders})", chunk
+            )
+            for row in rows:
+                found[row[0]] = self._record(row)
+        return found
+
+    def resolve_markets(self, ideas: Sequence[str], target_markets: Sequence[str]) -> Dict[str, Optional[Dict]]:
+        """Pick the market each idea belongs to, in three queries in total.
+
+        Declared target markets win when the dataset knows them, the one
+        sharing most keywords with the idea first; otherwise the market
+        sharing most keywords with the idea, larger markets breaking ties.
+        """
+        idea_tokens = {idea: set(tokenize(idea)) for idea in ideas}
+        all_tokens = set().union(*idea_tokens.values()) if idea_tokens else set()
+        keyword_hits = self.match_keywords(all_tokens)
+        known_targets = self.get_markets(target_markets)
+        targets = list({name: known_targets[name] for name in target_markets if name in known_targets}.values())
+
+        chosen = {}
+        for idea, tokens in idea_tokens.items():
+            hits: Dict[int, List[int]] = {}
+            for token in tokens:
+                for market_id, market_size in keyword_hits.get(token, ()):
+                    hits.setdefault(market_id, [0, market_size])[0] += 1
+            if targets:
+                # max() keeps the first of equally matched targets
+                chosen[idea] = max(targets, key=lambda market: hits.get(market["id"], (0,))[0])["id"]
+            elif hits:
+                chosen[idea] = max(hits, key=lambda market_id: tuple(hits[market_id]))
+            else:
+                chosen[idea] = None
+
+        markets = self.get_markets_by_id(set(chosen.values()) - {None} - {market["id"] for market in targets})
+        markets.update((market["id"], market) for market in targets)
+        return {idea: markets.get(market_id) for idea, market_id in chosen.items()}
+
+    def _record(self, row) -> Dict:
+        (market_id, name, market_size, growth_rate, competition_level, leader_share, search_volume,
+         willingness_to_pay, pain_point_severity, current_solutions, trends) = row
+        return {
+            "id": market_id,
+            "name": name,
+            "market_size": market_size,
+            "growth_rate": growth_rate,
+            "competition_level": competition_level,
+            "leader_share": leader_share,
+            "search_volume": search_volume,
+            "willingness_to_pay": willingness_to_pay,
+            "pain_point_severity": pain_point_severity,
+            "current_solutions": current_solutions,
+            "trends": json.loads(trends),
+        }
+
+    def _connection(self) -> sqlite3.Connection:
+        self._ensure_loaded()
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            if getattr(local, "connection", None) is not None:
+                local.connection.close()
+            connection = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            connection.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+            local.connection = connection
+            local.generation = self._generation
+        return local.connection
+
+    def _ensure_loaded(self) -> None:
+        if self._fingerprint is not None:
+            return
+        with self._lock:
+            if self._fingerprint is not None:
+                return
+            fingerprint = self._source_fingerprint()
+            if self._stored_fingerprint() != fingerprint:
+                self._build(fingerprint)
+            self._generation += 1
+            self._fingerprint = fingerprint
+
+    def _source_fingerprint(self) -> str:
+        stat = os.stat(self.csv_path)
+        return f"{SCHEMA_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _stored_fingerprint(self) -> Optional[str]:
+        if not os.path.exists(self.db_path):
+            return None
+        try:
+            with sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True) as connection:
+                row = connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        except sqlite3.DatabaseError:
+            return None
+        return row[0] if row else None
+
+    def _build(self, fingerprint: str) -> int:
+        # Build next to the target and swap it in so readers never see a
+        # half-written file, even from other processes
+        tmp_path = f"{self.db_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+
+        connection = sqlite3.connect(tmp_path)
+        try:
+            connection.executescript(_SCHEMA)
+            markets, keywords = [], []
+            with open(self.csv_path, newline="", encoding="utf-8") as handle:
+                for market_id, row in enumerate(csv.DictReader(handle), start=1):
+                    markets.append((
+                        market_id,
+                        row["name"].strip(),
+                        int(float(row["market_size"])),
+                        float(row["growth_rate"]),
+                        row["competition_level"].strip(),
+                        int(float(row.get("leader_share") or 30)),
+                        int(float(row.get("search_volume") or 0)),
+                        (row.get("willingness_to_pay") or "Medium").strip(),
+                        (row.get("pain_point_severity") or "Medium").strip(),
+                        (row.get("current_solutions") or "Limited").strip(),
+                        json.dumps(_split_list(row.get("trends"))),
+                    ))
+                    keywords.extend(
+                        (keyword, market_id)
+                        for keyword in {token for item in _split_list(row.get("keywords")) for token in tokenize(item)}
+                    )
+            connection.executemany(f"INSERT INTO markets (id, {_MARKET_COLUMNS}) VALUES (?,?,?,?,?,?,?,?,?,?,?)", markets)
+            connection.executemany("INSERT INTO market_keywords (keyword, market_id) VALUES (?, ?)", keywords)
+            connection.execute("INSERT INTO meta (key, value) VALUES ('fingerprint', ?)", (fingerprint,))
+            connection.commit()
+        except Exception:
+            connection.close()
+            os.remove(tmp_path)
+            raise
+        connection.close()
+        os.replace(tmp_path, self.db_path)
+        return len(markets)
+
+
+market_data_store = MarketDataStore()
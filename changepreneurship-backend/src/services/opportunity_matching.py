@@ -0,0 +1,122 @@
+"""
+Opportunity Matching - hashed feature vectors for passion x skill matching
+"""
+import re
+import zlib
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_FEATURE_DIM = 512
+DEFAULT_TOP_K = 3
+DEFAULT_MIN_SCORE = 0.2
+
+# Category features outweigh the individual words of a name
+CATEGORY_WEIGHT = 2.0
+
+STOP_WORDS = frozenset({"a", "an", "and", "for", "of", "the", "skills"})
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def feature_tokens(text: str) -> List[str]:
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def opportunity_features(passion: str, skill: str, name: str = "") -> Dict[str, float]:
+    """Weighted features shared by catalog entries and passion x skill queries"""
+    features = {f"passion:{passion}": CATEGORY_WEIGHT, f"skill:{skill}": CATEGORY_WEIGHT}
+    for token in feature_tokens(f"{passion} {skill} {name}"):
+        features[token] = features.get(token, 0.0) + 1.0
+    return features
+
+
+def hash_features(rows: Sequence[Mapping[str, float]], dim: int = DEFAULT_FEATURE_DIM) -> np.ndarray:
+    """L2-normalised signed feature-hashing matrix, one row per feature map.
+
+    crc32 keeps bucket assignment stable across processes; its top bit
+    picks the sign so colliding features tend to cancel rather than add up.
+    """
+    row_index, column_index, values = [], [], []
+    for row, features in enumerate(rows):
+        for feature, weight in features.items():
+            digest = zlib.crc32(feature.encode())
+            row_index.append(row)
+            column_index.append(digest % dim)
+            values.append(-weight if digest >> 31 else weight)
+
+    matrix = np.zeros((len(rows), dim), dtype=np.float32)
+    np.add.at(matrix, (np.asarray(row_index, dtype=np.intp), np.asarray(column_index, dtype=np.intp)), values)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.maximum(norms, 1e-12)
+    return matrix
+
+
+class OpportunityMatcher:
+    """Opportunity catalog precomputed into a hashed feature matrix.
+
+    ``entries`` are ``(passion, skill, name)`` triples. Queries are scored
+    against the whole catalog with one matrix multiply. The matrix is kept
+    feature-major so that multiply only reads the handful of feature rows
+    the queries actually use, which keeps catalogs of tens of thousands of
+    entries in the millisecond range.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]], dim: int = DEFAULT_FEATURE_DIM):
+        self.entries = tuple(entries)
+        self.dim = dim
+        features = hash_features([opportunity_features(*entry) for entry in self.entries], dim)
+        self.matrix = np.ascontiguousarray(features.T)
+
+    @classmethod
+    def from_pairs(cls, opportunity_map: Mapping[Tuple[str, str], Iterable[str]], dim: int = DEFAULT_FEATURE_DIM):
+        """Build from a ``{(passion, skill): [opportunity, ...]}`` mapping"""
+        return cls(
+            ((passion, skill, name) for (passion, skill), names in opportunity_map.items() for name in names),
+            dim,
+        )
+
+    def match(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        top_k: int = DEFAULT_TOP_K,
+        min_score: float = DEFAULT_MIN_SCORE,
+    ) -> List[List[Dict]]:
+        """Best catalog entries for each ``(passion, skill)`` pair.
+
+        Returns, per pair, up to ``top_k`` matches scoring at least
+        ``min_score`` (cosine similarity), best first. ``match_type`` is
+        ``exact`` when the entry was catalogued under that very pair and
+        ``partial`` otherwise.
+        """
+        if not pairs or not self.entries or top_k < 1:
+            return [[] for _ in pairs]
+
+        queries = hash_features([opportunity_features(passion, skill) for passion, skill in pairs], self.dim)
+        active = np.flatnonzero(queries.any(axis=0))
+        scores = queries[:, active] @ self.matrix[active]
+
+        k = min(top_k, scores.shape[1])
+        if k < scores.shape[1]:
+            candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(k), (len(pairs), k))
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        candidates = np.take_along_axis(candidates, order, axis=1)
+        candidate_scores = np.take_along_axis(candidate_scores, order, axis=1)
+
+        results = []
+        for (passion, skill), indices, row_scores in zip(pairs, candidates.tolist(), candidate_scores.tolist()):
+            matches = []
+            for index, score in zip(indices, row_scores):
+                if score < min_score:
+                    break
+                entry_passion, entry_skill, name = self.entries[index]
+                matches.append({
+                    "name": name,
+                    "score": round(score, 4),
+                    "match_type": "exact" if (entry_passion, entry_skill) == (passion, skill) else "partial",
+                })
+            results.append(matches)
+        return results
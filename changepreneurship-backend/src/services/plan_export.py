@@ -0,0 +1,106 @@
+"""
+Plan Export - streamed business plan rendering with a per-section cache
+"""
+import json
+import threading
+from collections import OrderedDict
+from html import escape
+from typing import Dict, Hashable, Iterable, List, Optional
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "markdown": "text/markdown; charset=utf-8",
+    "html": "text/html; charset=utf-8",
+}
+
+DEFAULT_CACHE_ENTRIES = 2048
+
+
+class SectionCache:
+    """Thread-safe LRU of rendered plan sections.
+
+    Keys carry the revisions of the nodes a section was rendered from, so an
+    edit makes the affected sections miss and leaves the rest cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            chunk = self._entries.get(key)
+            if chunk is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return chunk
+
+    def put(self, key: Hashable, chunk: str) -> None:
+        with self._lock:
+            self._entries[key] = chunk
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+section_cache = SectionCache()
+
+
+def render_header(fmt: str, plan: Dict) -> str:
+    """Opening chunk of the document; ``plan`` holds id, business idea and revision"""
+    if fmt == "ndjson":
+        return json.dumps({"type": "plan", **plan}) + "\n"
+    title = f"Business Plan: {plan.get('business_idea') or 'Untitled'}"
+    if fmt == "markdown":
+        return f"# {title}\n\n"
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        f"<title>{escape(title)}</title></head><body>\n<h1>{escape(title)}</h1>\n"
+    )
+
+
+def render_footer(fmt: str) -> str:
+    return "</body></html>\n" if fmt == "html" else ""
+
+
+def render_section(fmt: str, key: str, title: str, section: Dict, answers: Iterable[Dict]) -> str:
+    """Render one section with the answered mind map elements it draws on"""
+    answers = list(answers)
+    if fmt == "ndjson":
+        return json.dumps({"type": "section", "key": key, "title": title, **section, "answers": answers}) + "\n"
+
+    items: List[str] = list(section.get("sections", section.get("key_points", [])))
+    if fmt == "markdown":
+        lines = [f"## {title}", "", section.get("content", ""), ""]
+        lines.extend(f"- {item}" for item in items)
+        if answers:
+            lines.extend(["", "### From your mind map", ""])
+            lines.extend(f"- **{answer['label']}:** {answer['answer']}" for answer in answers)
+        return "\n".join(lines) + "\n\n"
+
+    parts = [
+        f"<section id=\"{escape(key)}\"><h2>{escape(title)}</h2>",
+        f"<p>{escape(section.get('content', ''))}</p>",
+    ]
+    if items:
+        parts.append("<ul>" + "".join(f"<li>{escape(item)}</li>" for item in items) + "</ul>")
+    if answers:
+        parts.append("<dl>" + "".join(
+            f"<dt>{escape(answer['label'])}</dt><dd>{escape(answer['answer'])}</dd>" for answer in answers
+        ) + "</dl>")
+    parts.append("</section>\n")
+    return "".join(parts)
@@ -0,0 +1,387 @@
+"""
+Roadmap Planning - phase packing and dependency scheduling for AI initiatives
+"""
+import heapq
+import math
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_PHASE_BUDGET = 50000
+DEFAULT_MAX_PER_PHASE = 3
+DEFAULT_TIME_LIMIT_MS = 50
+# Ceiling on a caller-supplied time limit; the search runs inside a request
+MAX_TIME_LIMIT_MS = 200
+
+# Above this many initiatives the exact search is skipped for greedy packing
+EXACT_SEARCH_LIMIT = 60
+
+# Weight of each later phase when front-loading value
+PHASE_DISCOUNT = 0.8
+
+
+class _StopSearch(Exception):
+    pass
+
+
+def pack_phases(
+    costs: Sequence[float],
+    values: Sequence[float],
+    phase_budgets: Sequence[float] = (DEFAULT_PHASE_BUDGET,),
+    max_per_phase: int = DEFAULT_MAX_PER_PHASE,
+    time_limit_ms: float = DEFAULT_TIME_LIMIT_MS,
+) -> Dict:
+    """Pack initiatives into as few phases as possible, highest value first.
+
+    Phase ``i`` may spend ``phase_budgets[i]`` (the last budget repeats) and
+    hold ``max_per_phase`` initiatives. The phase count is minimised with a
+    branch-and-bound search seeded by first-fit decreasing; it stops at the
+    time limit with the best packing found, and is skipped entirely above
+    ``EXACT_SEARCH_LIMIT`` initiatives. Within that phase count, moves and
+    swaps then shift value toward earlier phases. An initiative that no
+    phase has budget left for gets an over-budget phase of its own at the
+    end, as the greedy planner did.
+
+    Returns ``phases`` as lists of initiative indices plus how they were
+    found: ``method``, whether the phase count is proven ``optimal``, and
+    the ``lower_bound`` it was checked against. ``time_limit_ms`` is capped
+    at ``MAX_TIME_LIMIT_MS``.
+    """
+    try:
+        time_limit_ms = float(time_limit_ms)
+    except (TypeError, ValueError):
+        raise ValueError("time_limit_ms must be a number") from None
+    if not math.isfinite(time_limit_ms):
+        raise ValueError("time_limit_ms must be finite")
+    time_limit_ms = min(max(time_limit_ms, 0.0), MAX_TIME_LIMIT_MS)
+    budgets = [float(budget) for budget in phase_budgets] or [float(DEFAULT_PHASE_BUDGET)]
+    max_per_phase = max(int(max_per_phase), 1)
+    started = time.perf_counter()
+    # Most of the budget goes to the search; front-loading gets the rest
+    search_deadline = started + time_limit_ms * 0.8 / 1000
+    deadline = started + time_limit_ms / 1000
+
+    def budget(phase):
+        return budgets[min(phase, len(budgets) - 1)]
+
+    # Initiatives dearer than every budget always end up alone in an
+    # over-budget phase; the bound and the search only cover the rest
+    largest = max(budgets)
+    unpackable = [i for i in range(len(costs)) if costs[i] > largest]
+    order = sorted((i for i in range(len(costs)) if costs[i] <= largest), key=lambda i: (-costs[i], -values[i]))
+    lower_bound = _phase_lower_bound([costs[i] for i in order], budget, len(budgets), max_per_phase)
+    phases, over_budget = _first_fit(order, costs, budget, max_per_phase)
+    method = "greedy"
+    optimal = not over_budget and len(phases) <= lower_bound
+
+    if not optimal and len(order) <= EXACT_SEARCH_LIMIT:
+        method = "branch_and_bound"
+        search = _BranchAndBound(order, costs, budget, max_per_phase, search_deadline, lower_bound)
+        better = search.run(len(phases) + len(over_budget))
+        if better is not None:
+            phases, over_budget = better, []
+        # An exhausted search proves nothing about a packing that breaks a budget
+        optimal = not over_budget and (search.completed or len(phases) <= lower_bound)
+
+    phases = _front_load(phases, costs, values, budget, max_per_phase, deadline)
+    phases.extend([i] for i in sorted(over_budget + unpackable, key=lambda i: -values[i]))
+    return {
+        "phases": phases,
+        "method": method,
+        "optimal": optimal,
+        "lower_bound": lower_bound + len(unpackable),
+    }
+
+
+def _phase_lower_bound(costs: List[float], budget, budget_count: int, max_per_phase: int) -> int:
+    """Fewest phases whose combined budget and capacity could hold everything"""
+    if not costs:
+        return 0
+    by_count = -(-len(costs) // max_per_phase)
+    total, capacity, phases = sum(costs), 0.0, 0
+    while capacity < total or phases < by_count:
+        if phases >= budget_count and budget(phases) <= 0:
+            # The repeating last budget adds nothing; no count of phases suffices
+            return max(phases, by_count)
+        capacity += budget(phases)
+        phases += 1
+    return phases
+
+
+def _first_fit(order, costs, budget, max_per_phase):
+    """First-fit decreasing; returns the phases and initiatives no phase can take"""
+    phases, free = [], []
+    # Phases that still have a slot and room for the cheapest initiative
+    open_phases = []
+    cheapest = min((costs[i] for i in order), default=0)
+
+    def place(i):
+        for position, phase in enumerate(open_phases):
+            if costs[i] <= free[phase]:
+                break
+        else:
+            if costs[i] > budget(len(phases)):
+                return False
+            phase = len(phases)
+            phases.append([])
+            free.append(budget(phase))
+            open_phases.append(phase)
+            position = len(open_phases) - 1
+        phases[phase].append(i)
+        free[phase] -= costs[i]
+        if len(phases[phase]) >= max_per_phase or free[phase] < cheapest:
+            del open_phases[position]
+        return True
+
+    unplaced = [i for i in order if not place(i)]
+    # Phases opened since may have budget to spare for them
+    return phases, [i for i in unplaced if not place(i)]
+
+
+class _BranchAndBound:
+    """Depth-first search over phase assignments, largest initiatives first"""
+
+    def __init__(self, order, costs, budget, max_per_phase, deadline, lower_bound):
+        self.order = order
+        self.costs = [costs[i] for i in order]
+        self.suffix_cost = [0.0] * (len(order) + 1)
+        for k in range(len(order) - 1, -1, -1):
+            self.suffix_cost[k] = self.suffix_cost[k + 1] + self.costs[k]
+        self.budget = budget
+        self.max_per_phase = max_per_phase
+        self.deadline = deadline
+        self.lower_bound = lower_bound
+        self.nodes = 0
+        self.completed = False
+
+    def run(self, incumbent: int) -> Optional[List[List[int]]]:
+        self.best = incumbent
+        self.best_assignment = None
+        self.assignment = [0] * len(self.order)
+        try:
+            self._search(0, [], [])
+            self.completed = True
+        except _StopSearch:
+            pass
+        if self.best_assignment is None:
+            return None
+        phases = [[] for _ in range(self.best)]
+        for k, phase in enumerate(self.best_assignment):
+            phases[phase].append(self.order[k])
+        return [phase for phase in phases if phase]
+
+    def _search(self, k, loads, counts):
+        self.nodes += 1
+        if not self.nodes & 127 and time.perf_counter() > self.deadline:
+            raise _StopSearch
+        if k == len(self.order):
+            self.best = len(loads)
+            self.best_assignment = list(self.assignment)
+            if self.best <= self.lower_bound:
+                raise _StopSearch  # matches the lower bound; nothing better exists
+            return
+
+        open_phases = len(loads)
+        free = sum(
+            self.budget(phase) - load
+            for phase, load in enumerate(loads) if counts[phase] < self.max_per_phase
+        )
+        if open_phases >= self.best or (
+            self.suffix_cost[k] > free and open_phases + 1 >= self.best
+        ):
+            return
+
+        cost = self.costs[k]
+        tried = set()
+        for phase in range(open_phases):
+            state = (loads[phase], counts[phase], self.budget(phase))
+            if state in tried or counts[phase] >= self.max_per_phase:
+                continue
+            if loads[phase] + cost > self.budget(phase):
+                continue
+            tried.add(state)
+            loads[phase] += cost
+            counts[phase] += 1
+            self.assignment[k] = phase
+            self._search(k + 1, loads, counts)
+            loads[phase] -= cost
+            counts[phase] -= 1
+
+        if open_phases + 1 < self.best and cost <= self.budget(open_phases):
+            loads.append(cost)
+            counts.append(1)
+            self.assignment[k] = open_phases
+            self._search(k + 1, loads, counts)
+            loads.pop()
+            counts.pop()
+
+
+def _front_load(phases, costs, values, budget, max_per_phase, deadline) -> List[List[int]]:
+    """Shift value into earlier phases without adding phases or breaking budgets"""
+    phases = [list(phase) for phase in phases]
+
+    def load(phase):
+        return sum(costs[i] for i in phases[phase])
+
+    def value(phase):
+        return sum(values[i] for i in phases[phase])
+
+    improved = True
+    while improved:
+        improved = False
+        # Reorder whole phases by value where each fits the other's budget
+        for phase in range(len(phases) - 1):
+            later = phase + 1
+            if value(later) > value(phase) and load(later) <= budget(phase) and load(phase) <= budget(later):
+                phases[phase], phases[later] = phases[later], phases[phase]
+                improved = True
+
+        for early in range(len(phases)):
+            if time.perf_counter() >= deadline:
+                return _sorted_phases(phases, values)
+            for late in range(early + 1, len(phases)):
+                early_load, late_load = load(early), load(late)
+                for b in sorted(phases[late], key=lambda i: -values[i]):
+                    # Pull forward into spare capacity, else swap for a lower-value initiative
+                    if len(phases[early]) < max_per_phase and len(phases[late]) > 1 \
+                            and early_load + costs[b] <= budget(early):
+                        phases[late].remove(b)
+                        phases[early].append(b)
+                        early_load += costs[b]
+                        late_load -= costs[b]
+                        improved = True
+                        continue
+                    for a in phases[early]:
+                        if values[b] <= values[a]:
+                            continue
+                        if early_load - costs[a] + costs[b] <= budget(early) \
+                                and late_load - costs[b] + costs[a] <= budget(late):
+                            phases[early][phases[early].index(a)] = b
+                            phases[late][phases[late].index(b)] = a
+                            early_load += costs[b] - costs[a]
+                            late_load += costs[a] - costs[b]
+                            improved = True
+                            break
+
+    return _sorted_phases(phases, values)
+
+
+def _sorted_phases(phases, values):
+    for phase in phases:
+        phase.sort(key=lambda i: -values[i])
+    return phases
+
+
+def discounted_value(phases: Sequence[Sequence[int]], values: Sequence[float]) -> float:
+    """Impact-weighted value with each later phase discounted by PHASE_DISCOUNT"""
+    return sum(
+        PHASE_DISCOUNT ** phase * sum(values[i] for i in members)
+        for phase, members in enumerate(phases)
+    )
+
+
+def schedule_initiatives(
+    durations: Sequence[float],
+    dependencies: Sequence[Tuple[int, int]] = (),
+    max_parallel: Optional[int] = None,
+) -> Dict:
+    """Critical-path schedule for initiatives linked by ``(before, after)`` edges.
+
+    Runs in O(V + E): a Kahn topological sort, a forward pass for earliest
+    starts and a backward pass for latest starts, whose difference is each
+    initiative's slack. With ``max_parallel`` the starts are then levelled
+    by list scheduling, O((V + E) log V): ready initiatives start in order
+    of least slack whenever a slot frees up. Zero-duration initiatives
+    (milestones) never take a slot.
+
+    Returns ``start``/``end`` per initiative, ``slack``, the unconstrained
+    ``critical_path`` and the ``makespan``. Raises ValueError on a cycle.
+    """
+    count = len(durations)
+    successors = [[] for _ in range(count)]
+    in_degree = [0] * count
+    for before, after in dependencies:
+        successors[before].append(after)
+        in_degree[after] += 1
+
+    remaining = list(in_degree)
+    order = [i for i in range(count) if not remaining[i]]
+    for node in order:
+        for successor in successors[node]:
+            remaining[successor] -= 1
+            if not remaining[successor]:
+                order.append(successor)
+    if len(order) < count:
+        raise ValueError("Initiative dependencies contain a cycle")
+
+    earliest = [0] * count
+    for node in order:
+        finish = earliest[node] + durations[node]
+        for successor in successors[node]:
+            earliest[successor] = max(earliest[successor], finish)
+    critical_length = max((earliest[i] + durations[i] for i in range(count)), default=0)
+
+    latest = [0] * count
+    for node in reversed(order):
+        finish = min((latest[successor] for successor in successors[node]), default=critical_length)
+        latest[node] = finish - durations[node]
+    slack = [latest[i] - earliest[i] for i in range(count)]
+
+    if max_parallel:
+        start = _level_resources(durations, successors, in_degree, latest, int(max_parallel))
+    else:
+        start = earliest
+    end = [start[i] + durations[i] for i in range(count)]
+
+    return {
+        "start": start,
+        "end": end,
+        "slack": slack,
+        "critical_path": _critical_path(order, successors, earliest, durations, slack),
+        "makespan": max(end, default=0),
+    }
+
+
+def _level_resources(durations, successors, in_degree, latest, max_parallel):
+    remaining = list(in_degree)
+    ready = [(latest[i], i) for i in range(len(durations)) if not remaining[i]]
+    heapq.heapify(ready)
+    running = []
+    start = [0] * len(durations)
+    now = 0
+
+    def finish(node):
+        for successor in successors[node]:
+            remaining[successor] -= 1
+            if not remaining[successor]:
+                heapq.heappush(ready, (latest[successor], successor))
+
+    while ready or running:
+        while ready and (len(running) < max_parallel or durations[ready[0][1]] == 0):
+            _, node = heapq.heappop(ready)
+            start[node] = now
+            if durations[node] == 0:
+                finish(node)
+            else:
+                heapq.heappush(running, (now + durations[node], node))
+        if not running:
+            continue
+        now, node = heapq.heappop(running)
+        finish(node)
+        while running and running[0][0] == now:
+            finish(heapq.heappop(running)[1])
+    return start
+
+
+def _critical_path(order, successors, earliest, durations, slack):
+    """Follow zero-slack initiatives from the first one through to the end"""
+    path = []
+    node = next((i for i in order if abs(slack[i]) < 1e-9 and earliest[i] == 0), None)
+    while node is not None:
+        path.append(node)
+        finish = earliest[node] + durations[node]
+        node = next(
+            (successor for successor in successors[node]
+             if abs(slack[successor]) < 1e-9 and abs(earliest[successor] - finish) < 1e-9),
+            None,
+        )
+    return path
@@ -0,0 +1,236 @@
+"""
+Scenario Simulation - Monte Carlo projections for mind map scenarios
+"""
+from typing import Dict, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+# Market baseline used by MindMappingTool._calculate_projections
+BASE_REVENUE = 100000
+BASE_CUSTOMERS = 1000
+
+DEFAULT_PATHS = 10000
+DEFAULT_YEARS = 10
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+MAX_PATHS = 100000
+MAX_YEARS = 30
+MAX_GRID_CELLS = 500000
+DEFAULT_GRID_YEARS = (1, 3, 5)
+
+# Relative spread applied to template parameters when no distribution is given
+RISK_VOLATILITY = {"low": 0.25, "medium": 0.5, "high": 0.75}
+
+DistributionSpec = Union[float, int, Mapping]
+
+
+def sample_distribution(spec: DistributionSpec, size, rng: np.random.Generator) -> np.ndarray:
+    """Draw ``size`` samples from a distribution spec.
+
+    A bare number is treated as a constant. Mappings name a ``distribution``:
+    ``constant`` (value), ``normal`` (mean, std), ``lognormal`` (mean, sigma of
+    the underlying normal), ``uniform`` (low, high), ``triangular`` (low, mode,
+    high) or ``beta`` (alpha, beta).
+    """
+    if isinstance(spec, (int, float)):
+        return np.full(size, float(spec))
+    if not isinstance(spec, Mapping):
+        raise ValueError(f"Invalid distribution spec: {spec!r}")
+
+    kind = spec.get("distribution", "constant")
+    if kind == "constant":
+        return np.full(size, float(spec.get("value", 0.0)))
+    if kind == "normal":
+        return rng.normal(float(spec.get("mean", 0.0)), float(spec.get("std", 0.0)), size)
+    if kind == "lognormal":
+        return rng.lognormal(float(spec.get("mean", 0.0)), float(spec.get("sigma", 0.0)), size)
+    if kind == "uniform":
+        return rng.uniform(float(spec["low"]), float(spec["high"]), size)
+    if kind == "triangular":
+        low, mode, high = float(spec["low"]), float(spec["mode"]), float(spec["high"])
+        if low == high:
+            return np.full(size, low)
+        return rng.triangular(low, mode, high, size)
+    if kind == "beta":
+        return rng.beta(float(spec["alpha"]), float(spec["beta"]), size)
+    raise ValueError(f"Unknown distribution: {kind}")
+
+
+def template_distributions(template: Mapping) -> Dict[str, DistributionSpec]:
+    """Derive default distributions from a deterministic scenario template"""
+    volatility = RISK_VOLATILITY.get(template.get("risk_level"), RISK_VOLATILITY["medium"])
+    growth_rate = template["growth_rate"]
+    penetration = template["market_penetration"]
+    return {
+        "growth_rate": {"distribution": "normal", "mean": growth_rate, "std": growth_rate * volatility},
+        "churn_rate": 0.0,
+        "market_penetration": {
+            "distribution": "triangular",
+            "low": penetration * (1 - volatility),
+            "mode": penetration,
+            "high": penetration * (1 + volatility),
+        },
+    }
+
+
+def simulate_scenario(
+    growth_rate: DistributionSpec,
+    market_penetration: DistributionSpec,
+    churn_rate: DistributionSpec = 0.0,
+    years: int = DEFAULT_YEARS,
+    paths: int = DEFAULT_PATHS,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    base_revenue: float = BASE_REVENUE,
+    base_customers: float = BASE_CUSTOMERS,
+    seed: Optional[int] = None,
+) -> Dict:
+    """Simulate revenue, customer and market share paths.
+
+    Year 1 starts at the sampled market penetration; every later year
+    compounds that year's growth and churn draw. Penetration is drawn once
+    per path, growth and churn once per path and year. Market share is
+    clipped to [0, 1] and revenue and customers scale with it.
+    """
+    years = int(years)
+    paths = int(paths)
+    if not 1 <= years <= MAX_YEARS:
+        raise ValueError(f"years must be between 1 and {MAX_YEARS}")
+    if not 1 <= paths <= MAX_PATHS:
+        raise ValueError(f"paths must be between 1 and {MAX_PATHS}")
+    percentiles = [float(p) for p in percentiles]
+    if any(p < 0 or p > 100 for p in percentiles):
+        raise ValueError("percentiles must be between 0 and 100")
+
+    rng = np.random.default_rng(seed)
+    start_share = sample_distribution(market_penetration, (paths, 1), rng)
+    growth = sample_distribution(growth_rate, (paths, years - 1), rng)
+    churn = np.clip(sample_distribution(churn_rate, (paths, years - 1), rng), 0.0, 1.0)
+
+    factors = np.maximum((1.0 + growth) * (1.0 - churn), 0.0)
+    share = np.empty((paths, years))
+    share[:, :1] = start_share
+    np.cumprod(factors, axis=1, out=share[:, 1:])
+    share[:, 1:] *= start_share
+    np.clip(share, 0.0, 1.0, out=share)
+
+    # Revenue and customers are monotone in share, so their bands are the
+    # share bands rescaled rather than separate percentile passes.
+    share_bands = np.percentile(share, percentiles, axis=0)
+    share_mean = share.mean(axis=0)
+
+    def bands(scale):
+        result = {_band_label(p): (row * scale).round(6).tolist() for p, row in zip(percentiles, share_bands)}
+        result["mean"] = (share_mean * scale).round(6).tolist()
+        return result
+
+    return {
+        "paths": paths,
+        "years": list(range(1, years + 1)),
+        "percentiles": percentiles,
+        "revenue": bands(base_revenue),
+        "customers": bands(base_customers),
+        "market_share": bands(1.0),
+    }
+
+
+def parameter_axis(spec, name: str) -> np.ndarray:
+    """Expand a grid axis given as a number, a list, or a start/stop range.
+
+    Ranges take ``num`` (inclusive linspace) or ``step`` (arange, stop
+    inclusive within rounding). No axis may be longer than MAX_GRID_CELLS;
+    that is checked before anything is allocated.
+    """
+    if isinstance(spec, (int, float)):
+        values = np.array([float(spec)])
+    elif isinstance(spec, Mapping):
+        start, stop = float(spec["start"]), float(spec["stop"])
+        if not (np.isfinite(start) and np.isfinite(stop)):
+            raise ValueError(f"{name} range must be finite")
+        if "num" in spec:
+            num = float(spec["num"])
+            if not 1 <= num <= MAX_GRID_CELLS:
+                raise ValueError(f"{name} num must be between 1 and {MAX_GRID_CELLS}")
+            values = np.linspace(start, stop, int(num))
+        elif "step" in spec:
+            step = float(spec["step"])
+            if not (np.isfinite(step) and step > 0):
+                raise ValueError(f"{name} step must be positive")
+            if (stop - start) / step >= MAX_GRID_CELLS:
+                raise ValueError(f"{name} range has more than {MAX_GRID_CELLS} steps")
+            values = np.arange(start, stop + step / 2, step)
+        else:
+            raise ValueError(f"{name} range needs 'num' or 'step'")
+    else:
+        spec = list(spec)
+        if len(spec) > MAX_GRID_CELLS:
+            raise ValueError(f"{name} has more than {MAX_GRID_CELLS} values")
+        values = np.asarray(spec, dtype=float)
+    if values.ndim != 1 or values.size == 0:
+        raise ValueError(f"{name} must contain at least one value")
+    if not np.isfinite(values).all():
+        raise ValueError(f"{name} values must be finite")
+    return values
+
+
+def evaluate_projection_grid(
+    growth_rates,
+    market_penetrations,
+    years=DEFAULT_GRID_YEARS,
+    paired: bool = False,
+    base_revenue: float = BASE_REVENUE,
+    base_customers: float = BASE_CUSTOMERS,
+) -> Dict:
+    """Evaluate deterministic projections over a whole parameter grid at once.
+
+    Follows MindMappingTool._calculate_projections: year 1 is the launch
+    baseline and later years compound growth over ``year`` years. By default
+    the grid is the Cartesian product growth x penetration x year; with
+    ``paired`` the two rate axes are zipped, one row per scenario.
+    Metrics come back as flat C-ordered columns alongside the axes and shape.
+    """
+    growth = parameter_axis(growth_rates, "growth_rate")
+    penetration = parameter_axis(market_penetrations, "market_penetration")
+    year_axis = parameter_axis(years, "years").astype(int)
+    if year_axis.min() < 1 or year_axis.max() > MAX_YEARS:
+        raise ValueError(f"years must be between 1 and {MAX_YEARS}")
+    if paired and growth.size != penetration.size:
+        raise ValueError("paired grids need as many growth rates as penetrations")
+
+    # Checked on the axis sizes, before the grid itself is allocated
+    shape = (growth.size, year_axis.size) if paired else (growth.size, penetration.size, year_axis.size)
+    cells = int(np.prod(shape, dtype=object))
+    if cells > MAX_GRID_CELLS:
+        raise ValueError(f"Grid has {cells} cells; the limit is {MAX_GRID_CELLS}")
+
+    exponents = np.where(year_axis == 1, 0, year_axis)
+    # Overflow is reported below rather than warned about cell by cell
+    with np.errstate(over="ignore", invalid="ignore"):
+        if paired:
+            share = penetration[:, None] * (1.0 + growth[:, None]) ** exponents[None, :]
+        else:
+            share = penetration[None, :, None] * (1.0 + growth[:, None, None]) ** exponents[None, None, :]
+        share = share.ravel()
+        columns = {"revenue": share * base_revenue, "customers": share * base_customers, "market_share": share}
+    if not all(np.isfinite(column).all() for column in columns.values()):
+        # JSON has no infinity; these would otherwise go out as nulls
+        raise ValueError("Projection overflows for these growth rates and years")
+
+    if paired:
+        axes = {
+            "scenario": list(range(growth.size)),
+            "growth_rate": growth.tolist(),
+            "market_penetration": penetration.tolist(),
+            "year": year_axis.tolist(),
+        }
+    else:
+        axes = {"growth_rate": growth.tolist(), "market_penetration": penetration.tolist(), "year": year_axis.tolist()}
+
+    return {
+        "shape": list(shape),
+        "cells": cells,
+        "axes": axes,
+        "columns": {key: column.tolist() for key, column in columns.items()},
+    }
+
+
+def _band_label(percentile: float) -> str:
+    return f"p{percentile:g}"
@@ -0,0 +1,98 @@
+"""
+Transparent compression for large JSON text columns.
+
+Values at or above BLOB_COMPRESSION_THRESHOLD bytes are stored as a BLOB:
+a format marker naming the codec followed by the compressed UTF-8 text.
+Anything else, including every row written before compression existed,
+stays plain JSON text, so readers accept both.
+"""
+import os
+import zlib
+from typing import Optional, Union
+
+from sqlalchemy import LargeBinary, Text
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import zstandard
+except ImportError:  # optional; zlib is always available
+    zstandard = None
+
+DEFAULT_THRESHOLD = 1024
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# JSON text never starts with NUL, so the marker cannot clash with it
+MARKER = b"\x00CJ"
+ZLIB = b"z"
+ZSTD = b"s"
+
+COMPRESSION_THRESHOLD = int(os.environ.get("BLOB_COMPRESSION_THRESHOLD", DEFAULT_THRESHOLD))
+COMPRESSION_CODEC = os.environ.get("BLOB_COMPRESSION", "zlib").lower()
+
+
+def is_packed(value) -> bool:
+    return isinstance(value, (bytes, bytearray, memoryview)) and bytes(value[:len(MARKER)]) == MARKER
+
+
+def pack_json_text(text: Optional[str], threshold: Optional[int] = None, codec: Optional[str] = None) -> Union[str, bytes, None]:
+    """Compress ``text`` when it is large enough for that to pay off"""
+    if text is None:
+        return None
+    threshold = COMPRESSION_THRESHOLD if threshold is None else threshold
+    raw = text.encode()
+    if threshold <= 0 or len(raw) < threshold:
+        return text
+    codec = codec or COMPRESSION_CODEC
+    if codec == "zstd" and zstandard is not None:
+        packed = MARKER + ZSTD + zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    else:
+        packed = MARKER + ZLIB + zlib.compress(raw, ZLIB_LEVEL)
+    return packed if len(packed) < len(raw) else text
+
+
+def unpack_json_text(value) -> Optional[str]:
+    """JSON text back from whatever the column holds"""
+    if value is None or isinstance(value, str):
+        return value
+    value = bytes(value)
+    if not value.startswith(MARKER):
+        return value.decode()
+    codec, payload = value[len(MARKER):len(MARKER) + 1], value[len(MARKER) + 1:]
+    if codec == ZLIB:
+        return zlib.decompress(payload).decode()
+    if codec == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd-compressed value found but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload).decode()
+    raise ValueError(f"Unknown blob codec: {codec!r}")
+
+
+class JSONBlob(TypeDecorator):
+    """JSON text column that may also hold packed bytes.
+
+    SQLite keeps text and BLOB values side by side in the same column.
+    Postgres needs bytea for that, so plain text is sent UTF-8 encoded and
+    decoded again on the way out. Packed values are returned as bytes and
+    only decompressed when a model getter asks for them.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(LargeBinary())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if dialect.name == "postgresql" and isinstance(value, str):
+            return value.encode()
+        return value
+
+    def process_result_value(self, value, dialect):
+        if isinstance(value, memoryview):
+            value = bytes(value)
+        if isinstance(value, bytes) and not is_packed(value):
+            return value.decode()
+        return value
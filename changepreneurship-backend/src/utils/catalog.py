@@ -0,0 +1,15 @@
+"""
+Helpers for static engine configuration that is loaded once per process
+and shared read-only across requests.
+"""
+from types import MappingProxyType
+
+
+def freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
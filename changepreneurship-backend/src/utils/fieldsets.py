@@ -0,0 +1,20 @@
+"""
+Sparse fieldsets: ?fields=a,b and ?fields[<resource>]=a,b query parameters.
+"""
+from typing import Optional, Set
+
+from flask import request
+
+
+def requested_fields(resource: str, primary: bool = False) -> Optional[Set[str]]:
+    """Field names asked for on ``resource``, or None to return every field.
+
+    ``fields[<resource>]`` always applies; a bare ``fields`` applies to the
+    endpoint's primary resource. Unknown names are ignored.
+    """
+    value = request.args.get(f"fields[{resource}]")
+    if value is None and primary:
+        value = request.args.get("fields")
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
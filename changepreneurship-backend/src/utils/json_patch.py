@@ -0,0 +1,169 @@
+"""
+JSON merge-patch (RFC 7396) and JSON Patch (RFC 6902) for stored JSON documents.
+"""
+import copy
+from typing import Any, List, Mapping, Sequence
+
+MERGE_PATCH_MIMETYPE = "application/merge-patch+json"
+JSON_PATCH_MIMETYPE = "application/json-patch+json"
+
+
+class JsonPatchError(ValueError):
+    """The patch document is malformed or cannot be applied"""
+
+
+class JsonPatchTestFailed(JsonPatchError):
+    """A ``test`` operation did not match; the document was left unchanged"""
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """Apply an RFC 7396 merge patch, returning the patched document.
+
+    ``target`` is not modified. Object members set to null in the patch are
+    removed; any non-object patch replaces the target outright.
+    """
+    if not isinstance(patch, Mapping):
+        return copy.deepcopy(patch)
+    result = dict(target) if isinstance(target, Mapping) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Split an RFC 6901 JSON Pointer into unescaped reference tokens"""
+    if not isinstance(pointer, str):
+        raise JsonPatchError("JSON Pointer must be a string")
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON Pointer: {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, Mapping):
+        return "object"
+    if isinstance(value, (list, tuple)):
+        return "array"
+    return type(value).__name__
+
+
+def json_equal(a: Any, b: Any) -> bool:
+    """Equality as RFC 6902 ``test`` defines it.
+
+    Values must have the same JSON type, so ``true`` never equals ``1``;
+    numbers compare numerically (``1`` equals ``1.0``), objects by members
+    and arrays element by element.
+    """
+    kind = _json_type(a)
+    if kind != _json_type(b):
+        return False
+    if kind == "object":
+        return a.keys() == b.keys() and all(json_equal(a[key], b[key]) for key in a)
+    if kind == "array":
+        return len(a) == len(b) and all(json_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _array_index(container: list, token: str, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JsonPatchError(f"Array index out of range: {token}")
+    return index
+
+
+def _resolve(document: Any, tokens: Sequence[str]) -> Any:
+    for token in tokens:
+        if isinstance(document, dict):
+            if token not in document:
+                raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+            document = document[token]
+        elif isinstance(document, list):
+            document = document[_array_index(document, token, allow_end=False)]
+        else:
+            raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+    return document
+
+
+def _add(document: Any, tokens: Sequence[str], value: Any) -> Any:
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    elif isinstance(parent, list):
+        parent.insert(_array_index(parent, tokens[-1], allow_end=True), value)
+    else:
+        raise JsonPatchError("Cannot add to a scalar value")
+    return document
+
+
+def _remove(document: Any, tokens: Sequence[str]) -> Any:
+    if not tokens:
+        raise JsonPatchError("Cannot remove the whole document")
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, dict):
+        if tokens[-1] not in parent:
+            raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+        return parent.pop(tokens[-1])
+    if isinstance(parent, list):
+        return parent.pop(_array_index(parent, tokens[-1], allow_end=False))
+    raise JsonPatchError("Cannot remove from a scalar value")
+
+
+def apply_json_patch(document: Any, operations: Sequence[Mapping]) -> Any:
+    """Apply an RFC 6902 JSON Patch, returning the patched document.
+
+    Operations are applied to a copy in order; if any fails, the error is
+    raised and ``document`` is left as it was.
+    """
+    if not isinstance(operations, list):
+        raise JsonPatchError("JSON Patch must be an array of operations")
+    result = copy.deepcopy(document)
+    for operation in operations:
+        if not isinstance(operation, Mapping) or "path" not in operation:
+            raise JsonPatchError("Each operation needs an 'op' and a 'path'")
+        op = operation.get("op")
+        path = parse_pointer(operation["path"])
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise JsonPatchError(f"'{op}' requires a value")
+
+        if op == "add":
+            result = _add(result, path, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            _remove(result, path)
+        elif op == "replace":
+            if path:
+                _remove(result, path)
+            result = _add(result, path, copy.deepcopy(operation["value"]))
+        elif op in ("move", "copy"):
+            source = parse_pointer(operation.get("from"))
+            if op == "move":
+                if path[:len(source)] == source and path != source:
+                    raise JsonPatchError("Cannot move a value into one of its children")
+                value = _remove(result, source)
+            else:
+                value = copy.deepcopy(_resolve(result, source))
+            result = _add(result, path, value)
+        elif op == "test":
+            if not json_equal(_resolve(result, path), operation["value"]):
+                raise JsonPatchTestFailed(f"Test failed at {operation['path']}")
+        else:
+            raise JsonPatchError(f"Unknown operation: {op!r}")
+    return result
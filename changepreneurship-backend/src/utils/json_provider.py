@@ -0,0 +1,140 @@
+"""
+JSON providers: orjson when installed, the stdlib encoder otherwise, and
+both able to splice already-encoded JSON text into responses.
+"""
+import re
+import secrets
+from datetime import date, time
+from typing import Any, Union
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is always available
+    orjson = None
+
+# orjson.Fragment (orjson >= 3.9) embeds raw JSON without placeholders
+ORJSON_FRAGMENT = getattr(orjson, "Fragment", None)
+
+
+class RawJSON:
+    """Valid JSON text emitted verbatim instead of being decoded and re-encoded"""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __repr__(self):
+        return f"RawJSON({self.text[:40]!r})"
+
+
+def json_default(value: Any) -> Any:
+    """Encode values JSON has no type for the way orjson does.
+
+    Dates are ISO 8601 rather than HTTP dates, and numpy scalars and
+    arrays become plain numbers and lists.
+    """
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if hasattr(value, "tolist"):  # numpy scalars and arrays
+        return value.tolist()
+    return DefaultJSONProvider.default(value)
+
+
+class _Splicer:
+    """Stands in for RawJSON values while encoding, then swaps the text back.
+
+    Each value is encoded as a placeholder string tagged with a per-call
+    nonce; one pass over the output replaces the placeholders.
+    """
+
+    def __init__(self):
+        self.fragments = []
+        self.nonce = secrets.token_hex(8)
+
+    def placeholder(self, raw: RawJSON) -> str:
+        self.fragments.append(raw.text)
+        return f"\x00{self.nonce}:{len(self.fragments) - 1}\x00"
+
+    def splice(self, text: str) -> str:
+        if not self.fragments:
+            return text
+        pattern = re.compile(r'"\\u0000' + self.nonce + r':(\d+)\\u0000"')
+        return pattern.sub(lambda match: self.fragments[int(match.group(1))], text)
+
+
+class SplicingJSONProvider(DefaultJSONProvider):
+    """Flask's stdlib JSON provider, plus :class:`RawJSON` pass-through"""
+
+    default = staticmethod(json_default)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        splicer = _Splicer()
+        fallback = kwargs.pop("default", self.default)
+
+        def default(value):
+            if isinstance(value, RawJSON):
+                return splicer.placeholder(value)
+            return fallback(value)
+
+        return splicer.splice(super().dumps(obj, default=default, **kwargs))
+
+
+class FastJSONProvider(SplicingJSONProvider):
+    """orjson-backed provider for every API response.
+
+    Datetimes, dates, UUIDs, dataclasses and numpy values are encoded
+    natively. Without orjson, or for values orjson rejects (e.g. integers
+    beyond 64 bits) or stdlib-only keyword arguments, this falls back to
+    :class:`SplicingJSONProvider`, which encodes those same types. The one
+    difference is non-finite floats: orjson writes them as ``null``, the
+    stdlib encoder as ``NaN``/``Infinity``.
+    """
+
+    def _options(self) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if self.compact is False or (self.compact is None and self._app.debug):
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def _encode(self, obj: Any) -> bytes:
+        splicer = _Splicer()
+
+        def default(value):
+            if isinstance(value, RawJSON):
+                if ORJSON_FRAGMENT is not None:
+                    return ORJSON_FRAGMENT(value.text)
+                return splicer.placeholder(value)
+            return json_default(value)
+
+        body = orjson.dumps(obj, default=default, option=self._options())
+        if splicer.fragments:
+            body = splicer.splice(body.decode()).encode()
+        return body
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return self._encode(obj).decode()
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = self._encode(obj)
+        except TypeError:
+            body = super().dumps(obj).encode()
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
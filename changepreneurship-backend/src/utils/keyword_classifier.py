@@ -0,0 +1,62 @@
+"""
+Multi-pattern keyword matching shared by the text-analysis engines.
+
+Each keyword table is compiled once into a single alternation regex, so a
+text is scanned once regardless of how many keywords the table holds.
+"""
+import re
+
+
+class KeywordClassifier:
+    """Match a ``{category: [keywords]}`` table against text in one pass.
+
+    Matching keeps the substring semantics the engines used before
+    (``keyword in text.lower()``): a keyword counts once per text however
+    often it occurs, and keywords may overlap or contain each other.
+    """
+
+    def __init__(self, table):
+        self.categories = tuple(table)
+        keyword_categories = {}
+        for category, keywords in table.items():
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword.lower(), []).append(category)
+        self._keyword_categories = {
+            keyword: tuple(categories) for keyword, categories in keyword_categories.items()
+        }
+
+        keywords = sorted(self._keyword_categories, key=len, reverse=True)
+        self._pattern = None
+        if keywords:
+            # The lookahead reports the longest keyword starting at every
+            # position, so overlapping keywords are all seen in one scan.
+            alternation = "|".join(re.escape(keyword) for keyword in keywords)
+            self._pattern = re.compile(f"(?=({alternation}))")
+        # A shorter keyword starting where a longer one matched is shadowed by
+        # it, so each keyword also implies every keyword it contains.
+        self._implied = {
+            keyword: tuple(other for other in keywords if other in keyword)
+            for keyword in keywords
+        }
+
+    def matched_keywords(self, text):
+        """Return the set of keywords that occur in ``text``"""
+        if not self._pattern or not text:
+            return set()
+        found = set()
+        for longest in set(self._pattern.findall(text.lower())):
+            found.update(self._implied[longest])
+        return found
+
+    def category_hits(self, text):
+        """Return ``{category: number of distinct keywords found}``"""
+        hits = dict.fromkeys(self.categories, 0)
+        for keyword in self.matched_keywords(text):
+            for category in self._keyword_categories[keyword]:
+                hits[category] += 1
+        return hits
+
+    def categories_present(self, text):
+        """Return the categories with at least one keyword hit, in table order"""
+        hits = self.category_hits(text)
+        return [category for category in self.categories if hits[category]]
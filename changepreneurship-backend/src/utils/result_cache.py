@@ -0,0 +1,100 @@
+"""
+Content-addressed memoization for deterministic analysis endpoints.
+
+Results are keyed by a SHA-256 of the endpoint name, the engine version and
+the canonical JSON of the arguments, so resubmitting the same answers is a
+lookup instead of a recomputation. Bump an engine's version whenever its
+output for the same input changes.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def canonical_key(namespace: str, version: str, payload: Any) -> str:
+    """Hash a JSON payload independently of key order and whitespace"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    digest = hashlib.sha256()
+    digest.update(f"{namespace}\0{version}\0".encode())
+    digest.update(canonical.encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU bounded by entry count and by approximate JSON size.
+
+    Cached results are shared between requests, so callers must treat what
+    they get back as read-only.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, namespace: str, version: str, payload: Any, compute: Callable[[], Any]) -> Any:
+        key = canonical_key(namespace, version, payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Computed outside the lock; concurrent misses on one key just race
+        result = compute()
+        self.put(key, result)
+        return result
+
+    def put(self, key: Hashable, result: Any) -> None:
+        size = len(json.dumps(result, separators=(",", ":"), default=str))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+analysis_cache = ResultCache(
+    max_entries=int(os.environ.get("RESULT_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+    max_bytes=int(os.environ.get("RESULT_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+)
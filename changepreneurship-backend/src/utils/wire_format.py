@@ -0,0 +1,98 @@
+"""
+Content negotiation between JSON and MessagePack for API requests and responses.
+"""
+from typing import Any
+
+import flask
+from flask import has_request_context, request
+
+from src.utils.json_provider import FastJSONProvider, RawJSON, json_default
+
+try:
+    import msgpack
+except ImportError:  # optional; every endpoint keeps speaking JSON without it
+    msgpack = None
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPE = "application/msgpack"
+MSGPACK_MIMETYPES = (MSGPACK_MIMETYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+
+def wants_msgpack() -> bool:
+    """Whether the current request's Accept header prefers MessagePack over JSON.
+
+    JSON is listed first, so it wins ties such as ``*/*`` or no Accept header.
+    """
+    if msgpack is None or not has_request_context():
+        return False
+    return request.accept_mimetypes.best_match((JSON_MIMETYPE, *MSGPACK_MIMETYPES)) in MSGPACK_MIMETYPES
+
+
+class _MessagePackModule:
+    """Stands in for flask.json when parsing a MessagePack request body"""
+
+    @staticmethod
+    def loads(data: bytes, **kwargs: Any) -> Any:
+        try:
+            return msgpack.unpackb(data, raw=False, strict_map_key=False)
+        except (ValueError, msgpack.UnpackException) as e:
+            # get_json() turns ValueError into a 400 response
+            raise ValueError(f"Invalid MessagePack body: {e}") from e
+
+
+class WireFormatRequest(flask.Request):
+    """Request whose get_json() also reads MessagePack bodies.
+
+    Write endpoints keep calling ``request.get_json()``; a body sent as
+    ``Content-Type: application/msgpack`` decodes to the same objects.
+    """
+
+    @property
+    def is_msgpack(self) -> bool:
+        return msgpack is not None and self.mimetype in MSGPACK_MIMETYPES
+
+    _json_module = flask.json
+
+    @property
+    def json_module(self):
+        return _MessagePackModule if self.is_msgpack else self._json_module
+
+    @json_module.setter
+    def json_module(self, module):
+        # Flask assigns app.json here for every request
+        self._json_module = module
+
+    def get_json(self, force: bool = False, silent: bool = False, cache: bool = True) -> Any:
+        return super().get_json(force=force or self.is_msgpack, silent=silent, cache=cache)
+
+
+class WireFormatProvider(FastJSONProvider):
+    """FastJSONProvider whose responses follow the request's Accept header.
+
+    Every ``jsonify()`` response is MessagePack when the client prefers it
+    and JSON otherwise, with ``Vary: Accept`` so caches keep them apart.
+    Values MessagePack has no type for are encoded as in JSON; RawJSON
+    fragments are decoded, since they cannot be spliced into MessagePack.
+    """
+
+    def _msgpack_default(self, value: Any) -> Any:
+        if isinstance(value, RawJSON):
+            return self.loads(value.text)
+        return json_default(value)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if msgpack is None or not has_request_context():
+            return super().response(*args, **kwargs)
+        response = None
+        if wants_msgpack():
+            obj = self._prepare_response_obj(args, kwargs)
+            try:
+                body = msgpack.packb(obj, default=self._msgpack_default, use_bin_type=True, datetime=False)
+            except (TypeError, ValueError, OverflowError):
+                pass  # e.g. integers beyond 64 bits; JSON can still carry them
+            else:
+                response = self._app.response_class(body, mimetype=MSGPACK_MIMETYPE)
+        if response is None:
+            response = super().response(*args, **kwargs)
+        response.vary.add("Accept")
+        return response
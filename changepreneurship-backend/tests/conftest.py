@@ -12,13 +12,20 @@ if SRC_PATH not in sys.path:
 
 
 from src.models.assessment import db
+from src.routes.admin import admin_bp
+from src.routes.ai_adoption_roadmap import ai_adoption_bp
 from src.routes.auth import auth_bp
 from src.routes.assessment import assessment_bp
+from src.routes.enhanced_assessment import enhanced_assessment_bp
+from src.routes.mind_mapping import mind_mapping_bp
+from src.utils.wire_format import WireFormatProvider, WireFormatRequest
 
 
 @pytest.fixture
 def app():
     app = Flask(__name__)
+    app.json = WireFormatProvider(app)
+    app.request_class = WireFormatRequest
     app.config.update(
         TESTING=True,
         SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
@@ -29,6 +36,10 @@ def app():
     db.init_app(app)
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     app.register_blueprint(assessment_bp, url_prefix="/api/assessment")
+    app.register_blueprint(enhanced_assessment_bp, url_prefix="/api/enhanced-assessment")
+    app.register_blueprint(mind_mapping_bp, url_prefix="/api/mind-mapping")
+    app.register_blueprint(ai_adoption_bp, url_prefix="/api/ai-adoption")
+    app.register_blueprint(admin_bp, url_prefix="/api/admin")
 
     with app.app_context():
         db.create_all()
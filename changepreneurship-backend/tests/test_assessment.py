@@ -1,8 +1,17 @@
+import json
 from datetime import datetime, timedelta
 
+import msgpack
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
 from src.models.assessment import (
     Assessment,
     AssessmentResponse,
+    EntrepreneurProfile,
+    Question,
+    QuestionVersion,
     User,
     UserSession,
     db,
@@ -11,7 +20,7 @@ from src.models.assessment import (
 
 def create_assessment_with_session(app, session_token):
     with app.app_context():
-        user = User(username="tester", email=f"{session_token}@example.com", password_hash="hashed")
+        user = User(username=session_token, email=f"{session_token}@example.com", password_hash="hashed")
         db.session.add(user)
         db.session.flush()
 
@@ -59,13 +68,9 @@ def test_save_response_updates_existing_response(app, client):
         db.session.add(assessment)
         db.session.flush()
 
-        existing_response = AssessmentResponse(
-            assessment_id=assessment.id,
-            section_id="section-1",
-            question_id="q1",
-            question_text="Original question",
-            response_type="text",
-        )
+        question = Question(phase_id=assessment.phase_id, section_id="section-1", question_id="q1")
+        wording = QuestionVersion(question=question, question_text="Original question", response_type="text")
+        existing_response = AssessmentResponse(assessment_id=assessment.id, question=question, wording=wording)
         existing_response.set_response_value("Original answer")
         db.session.add(existing_response)
         db.session.commit()
@@ -156,3 +161,346 @@ def test_update_progress_clamps_out_of_range_value(app, client):
     with app.app_context():
         assessment = Assessment.query.get(assessment_id)
         assert assessment.progress_percentage == 100.0
+
+
+def test_autosave_through_group_commit_writer(app, client):
+    app.config["GROUP_COMMIT_ENABLED"] = True
+    assessment_id = create_assessment_with_session(app, "token-group-commit")
+    headers = {"Authorization": "Bearer token-group-commit"}
+
+    for answer in ("first draft", {"answer": "final"}):
+        response = client.post(
+            f"/api/assessment/{assessment_id}/response",
+            json={
+                "section_id": "section-1",
+                "question_id": "q1",
+                "question_text": "Question",
+                "response_type": "text",
+                "response_value": answer,
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+
+    response = client.put(
+        f"/api/assessment/{assessment_id}/progress",
+        json={"progress_percentage": 60, "assessment_data": {"step": 3}},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.get_json()["assessment"]["progress_percentage"] == 60.0
+    assert response.get_json()["assessment"]["assessment_data"] == {"step": 3}
+
+    writer = app.extensions["group_commit_writer"]
+    writer.close()
+    assert writer.stats()["operations"] == 3
+
+    with app.app_context():
+        stored = AssessmentResponse.query.filter_by(assessment_id=assessment_id).one()
+        assert stored.get_response_value() == {"answer": "final"}
+        assert stored.created_at is not None
+
+
+def test_unchanged_autosaves_are_noops(app, client):
+    assessment_id = create_assessment_with_session(app, "token-noop")
+    headers = {"Authorization": "Bearer token-noop"}
+    payload = {
+        "section_id": "section-1",
+        "question_id": "q1",
+        "question_text": "Question",
+        "response_type": "json",
+        "response_value": {"answer": ["A", "B"]},
+    }
+
+    first = client.post(f"/api/assessment/{assessment_id}/response", json=payload, headers=headers)
+    assert first.get_json()["noop"] is False
+    with app.app_context():
+        saved_at = AssessmentResponse.query.filter_by(assessment_id=assessment_id).one().updated_at
+
+    again = client.post(f"/api/assessment/{assessment_id}/response", json=payload, headers=headers)
+    assert again.status_code == 200
+    assert again.get_json()["noop"] is True
+    with app.app_context():
+        assert AssessmentResponse.query.filter_by(assessment_id=assessment_id).one().updated_at == saved_at
+
+    progress = {"progress_percentage": 40, "assessment_data": {"step": 2}}
+    assert client.put(f"/api/assessment/{assessment_id}/progress", json=progress, headers=headers).get_json()["noop"] is False
+    repeated = client.put(f"/api/assessment/{assessment_id}/progress", json=progress, headers=headers)
+    assert repeated.get_json()["noop"] is True
+    assert repeated.get_json()["assessment"]["assessment_data"] == {"step": 2}
+
+    changed = {"progress_percentage": 40, "assessment_data": {"step": 3}}
+    assert client.put(f"/api/assessment/{assessment_id}/progress", json=changed, headers=headers).get_json()["noop"] is False
+    with app.app_context():
+        assert Assessment.query.get(assessment_id).get_assessment_data() == {"step": 3}
+
+
+def test_patch_assessment_data_with_merge_and_json_patch(app, client):
+    assessment_id = create_assessment_with_session(app, "token-patch")
+    headers = {"Authorization": "Bearer token-patch"}
+    client.put(
+        f"/api/assessment/{assessment_id}/progress",
+        json={"assessment_data": {"answers": {"q1": "a", "q2": "b"}, "step": 1}},
+        headers=headers,
+    )
+
+    def patch(body, content_type):
+        return client.patch(
+            f"/api/assessment/{assessment_id}/data",
+            json=body,
+            headers={**headers, "Content-Type": content_type},
+        )
+
+    merged = patch({"answers": {"q2": None, "q3": "c"}, "step": 2}, "application/merge-patch+json")
+    assert merged.status_code == 200
+    assert merged.get_json()["noop"] is False
+    assert patch({"step": 2}, "application/merge-patch+json").get_json()["noop"] is True
+
+    operations = [{"op": "test", "path": "/step", "value": 2}, {"op": "add", "path": "/answers/q4", "value": "d"}]
+    assert patch(operations, "application/json-patch+json").status_code == 200
+    assert patch([{"op": "test", "path": "/step", "value": 9}], "application/json-patch+json").status_code == 409
+    assert patch({"step": 3}, "application/json").status_code == 415
+    assert patch([{"op": "replace", "path": "", "value": [1]}], "application/json-patch+json").status_code == 400
+    assert patch(["not", "an", "object"], "application/merge-patch+json").status_code == 400
+
+    with app.app_context():
+        assessment = Assessment.query.get(assessment_id)
+        assert assessment.get_assessment_data() == {"answers": {"q1": "a", "q3": "c", "q4": "d"}, "step": 2}
+
+
+def test_put_after_merge_patch_with_same_document_is_noop(app, client):
+    assessment_id = create_assessment_with_session(app, "token-patch-put")
+    headers = {"Authorization": "Bearer token-patch-put"}
+    client.put(
+        f"/api/assessment/{assessment_id}/progress",
+        json={"assessment_data": {"answers": {"q1": "café"}, "scores": [1, 2.5]}},
+        headers=headers,
+    )
+    merged = client.patch(
+        f"/api/assessment/{assessment_id}/data",
+        json={"answers": {"q2": "b"}, "step": 2},
+        headers={**headers, "Content-Type": "application/merge-patch+json"},
+    )
+    assert merged.get_json()["noop"] is False
+
+    document = {"answers": {"q1": "café", "q2": "b"}, "scores": [1, 2.5], "step": 2}
+    again = client.put(f"/api/assessment/{assessment_id}/progress", json={"assessment_data": document}, headers=headers)
+    assert again.get_json()["noop"] is True
+
+
+def test_patch_profile_fields(app, client):
+    create_assessment_with_session(app, "token-profile-patch")
+    headers = {"Authorization": "Bearer token-profile-patch"}
+    client.put(
+        "/api/assessment/profile/update",
+        json={"market_analysis": {"size": 10, "segments": ["smb"]}, "risk_tolerance": 0.4},
+        headers=headers,
+    )
+
+    merged = client.patch(
+        "/api/assessment/profile",
+        json={"market_analysis": {"size": 12}, "risk_tolerance": 0.6},
+        headers={**headers, "Content-Type": "application/merge-patch+json"},
+    )
+    assert merged.status_code == 200
+    profile = merged.get_json()["profile"]
+    assert profile["risk_tolerance"] == 0.6
+
+    patched = client.patch(
+        "/api/assessment/profile",
+        json=[{"op": "add", "path": "/market_analysis/segments/-", "value": "enterprise"}],
+        headers={**headers, "Content-Type": "application/json-patch+json"},
+    )
+    assert patched.status_code == 200
+
+    unknown = client.patch(
+        "/api/assessment/profile",
+        json={"password_hash": "x"},
+        headers={**headers, "Content-Type": "application/merge-patch+json"},
+    )
+    assert unknown.status_code == 400
+
+    whole = client.patch(
+        "/api/assessment/profile",
+        json=[{"op": "replace", "path": "", "value": {"risk_tolerance": 0.9}}],
+        headers={**headers, "Content-Type": "application/json-patch+json"},
+    )
+    assert whole.status_code == 400
+
+    with app.app_context():
+        profile = EntrepreneurProfile.query.one()
+        assert profile.risk_tolerance != 0.9
+        assert profile.get_json_field("market_analysis") == {"size": 12, "segments": ["smb", "enterprise"]}
+
+
+def test_responses_share_one_catalog_question(app, client):
+    first_id = create_assessment_with_session(app, "token-catalog-1")
+    second_id = create_assessment_with_session(app, "token-catalog-2")
+    payload = {
+        "section_id": "core_motivation",
+        "question_id": "q1",
+        "question_text": "What drives you?",
+        "response_type": "text",
+    }
+
+    for assessment_id, token, answer in ((first_id, "token-catalog-1", "impact"), (second_id, "token-catalog-2", "freedom")):
+        response = client.post(
+            f"/api/assessment/{assessment_id}/response",
+            json={**payload, "response_value": answer},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+
+    reworded = client.post(
+        f"/api/assessment/{first_id}/response",
+        json={**payload, "question_text": "What drives you most?", "response_value": "impact"},
+        headers={"Authorization": "Bearer token-catalog-1"},
+    )
+    assert reworded.get_json()["noop"] is False
+
+    again = client.post(
+        f"/api/assessment/{first_id}/response",
+        json={**payload, "question_text": "What drives you most?", "response_value": "impact"},
+        headers={"Authorization": "Bearer token-catalog-1"},
+    )
+    assert again.get_json()["noop"] is True
+
+    with app.app_context():
+        assert Question.query.count() == 1
+        versions = QuestionVersion.query.order_by(QuestionVersion.version).all()
+        assert [(v.version, v.question_text) for v in versions] == [(1, "What drives you?"), (2, "What drives you most?")]
+        responses = AssessmentResponse.query.order_by(AssessmentResponse.assessment_id).all()
+        assert [r.get_response_value() for r in responses] == ["impact", "freedom"]
+        # The rewording reached only the assessment that sent it
+        assert [r.question_text for r in responses] == ["What drives you most?", "What drives you?"]
+        assert responses[1].to_dict()["section_id"] == "core_motivation"
+
+        with pytest.raises(AttributeError):
+            responses[1].question_text = "Overwritten for everyone"
+        with pytest.raises(AttributeError):
+            AssessmentResponse(assessment_id=first_id, question_text="No catalog row")
+
+        # One answer per question and assessment, whatever the wording
+        duplicate = insert(AssessmentResponse.__table__).values(
+            assessment_id=second_id, question_ref_id=versions[1].question_ref_id, question_version_id=versions[1].id
+        )
+        with pytest.raises(IntegrityError):
+            db.session.execute(duplicate)
+        db.session.rollback()
+
+
+def test_response_id_survives_rewording(app, client):
+    assessment_id = create_assessment_with_session(app, "token-response-id")
+    headers = {"Authorization": "Bearer token-response-id"}
+    payload = {"section_id": "core_motivation", "question_id": "q1", "response_type": "text", "response_value": "impact"}
+
+    ids = []
+    for wording in ("What drives you?", "What drives you most?"):
+        client.post(f"/api/assessment/{assessment_id}/response", json={**payload, "question_text": wording}, headers=headers)
+        responses = client.get(f"/api/assessment/{assessment_id}/responses", headers=headers).get_json()["responses"]
+        assert len(responses) == 1
+        ids.append(responses[0]["id"])
+
+    assert ids == [f"{assessment_id}/core_motivation/q1"] * 2
+
+
+def test_large_json_blobs_are_stored_compressed(app, client):
+    assessment_id = create_assessment_with_session(app, "token-blob")
+    headers = {"Authorization": "Bearer token-blob"}
+    answers = {f"q{i}": f"answer number {i}" for i in range(300)}
+    client.put(f"/api/assessment/{assessment_id}/progress", json={"assessment_data": {"answers": answers}}, headers=headers)
+    client.put("/api/assessment/profile/update", json={"market_analysis": {"notes": answers}}, headers=headers)
+
+    merged = client.patch(
+        f"/api/assessment/{assessment_id}/data",
+        json={"step": 2},
+        headers={**headers, "Content-Type": "application/merge-patch+json"},
+    )
+    assert merged.get_json()["noop"] is False
+
+    with app.app_context():
+        raw = db.session.execute(
+            db.text("SELECT typeof(assessment_data), length(assessment_data) FROM assessment WHERE id = :id"),
+            {"id": assessment_id},
+        ).one()
+        assert raw[0] == "blob"
+        assert raw[1] < len(json.dumps({"answers": answers})) / 2
+        assert Assessment.query.get(assessment_id).get_assessment_data() == {"answers": answers, "step": 2}
+
+        profile = EntrepreneurProfile.query.first()
+        assert isinstance(profile.market_analysis, bytes)
+        assert profile.get_json_field("market_analysis") == {"notes": answers}
+
+        # Rows written as plain text before compression stay readable
+        db.session.execute(
+            db.text("UPDATE assessment SET assessment_data = :data, assessment_data_hash = NULL WHERE id = :id"),
+            {"data": json.dumps({"legacy": True}), "id": assessment_id},
+        )
+        db.session.commit()
+        db.session.expire_all()
+        assert Assessment.query.get(assessment_id).get_assessment_data() == {"legacy": True}
+
+
+def test_sparse_fieldsets_and_raw_json(app, client):
+    assessment_id = create_assessment_with_session(app, "token-fields")
+    headers = {"Authorization": "Bearer token-fields"}
+    client.put(
+        f"/api/assessment/{assessment_id}/progress",
+        json={"assessment_data": {"answers": {"q1": "a"}}, "progress_percentage": 40},
+        headers=headers,
+    )
+    client.put("/api/assessment/profile/update", json={"market_analysis": {"size": 10}}, headers=headers)
+    client.post(
+        f"/api/assessment/{assessment_id}/response",
+        json={"section_id": "s1", "question_id": "q1", "question_text": "Q", "response_type": "text", "response_value": "a"},
+        headers=headers,
+    )
+
+    profile = client.get("/api/auth/profile?fields=market_analysis,risk_tolerance", headers=headers).get_json()
+    assert profile["profile"] == {"market_analysis": {"size": 10}, "risk_tolerance": None}
+    assert "username" in profile["user"]
+
+    started = client.post("/api/assessment/start/self_discovery?fields=id,progress_percentage", headers=headers)
+    assert started.get_json()["assessment"] == {"id": assessment_id, "progress_percentage": 40.0}
+
+    full = client.get(f"/api/assessment/{assessment_id}/responses", headers=headers).get_json()
+    assert full["assessment"]["assessment_data"] == {"answers": {"q1": "a"}}
+
+    sparse = client.get(
+        f"/api/assessment/{assessment_id}/responses?fields=question_id,response_value&fields[assessment]=assessment_data",
+        headers=headers,
+    ).get_json()
+    assert sparse["assessment"] == {"assessment_data": {"answers": {"q1": "a"}}}
+    assert sparse["responses"] == [{"question_id": "q1", "response_value": "a"}]
+
+
+def test_msgpack_request_and_response_bodies(app, client):
+    assessment_id = create_assessment_with_session(app, "token-msgpack")
+    headers = {
+        "Authorization": "Bearer token-msgpack",
+        "Content-Type": "application/msgpack",
+        "Accept": "application/msgpack",
+    }
+    saved = client.post(
+        f"/api/assessment/{assessment_id}/response",
+        data=msgpack.packb({
+            "section_id": "s1", "question_id": "q1", "question_text": "Q",
+            "response_type": "matrix", "response_value": {"a": 1},
+        }),
+        headers=headers,
+    )
+    assert saved.status_code == 200
+    progress = client.put(
+        f"/api/assessment/{assessment_id}/progress",
+        data=msgpack.packb({"progress_percentage": 30, "assessment_data": {"step": 1}}),
+        headers=headers,
+    )
+    assert msgpack.unpackb(progress.data)["assessment"]["assessment_data"] == {"step": 1}
+
+    responses = client.get(f"/api/assessment/{assessment_id}/responses", headers=headers)
+    assert responses.mimetype == "application/msgpack"
+    body = msgpack.unpackb(responses.data)
+    assert body["responses"][0]["response_value"] == {"a": 1}
+    assert body == client.get(
+        f"/api/assessment/{assessment_id}/responses", headers={"Authorization": "Bearer token-msgpack"}
+    ).get_json()
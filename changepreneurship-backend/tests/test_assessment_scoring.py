@@ -0,0 +1,85 @@
+import json
+import random
+
+import numpy as np
+
+from src.models.assessment import db, EnhancedAssessment
+from src.routes.enhanced_assessment import enhanced_assessment_engine as engine
+from src.services.assessment_scoring import readiness_label
+
+
+def _random_phase_data(phase, rng):
+    if phase == 1:
+        return {
+            "five_whys_result": {"purpose_clarity_score": rng.uniform(0, 10)},
+            "legacy_statement": {"statement": "word " * rng.randint(0, 80)},
+            "impact_visualization": {"impact_map": {str(i): {} for i in range(rng.randint(0, 12))}},
+        }
+    if phase == 2:
+        return {
+            "passion_analysis": {"passion_intensity": rng.uniform(0, 10)},
+            "skill_analysis": {"core_skills": ["s"] * rng.randint(0, 8)},
+            "market_analysis": {str(i): {"opportunity_score": rng.randint(0, 9)} for i in range(rng.randint(0, 4))},
+        }
+    if phase == 3:
+        nodes = {str(i): {"completed": rng.random() < 0.5} for i in range(rng.randint(0, 30))}
+        return {"mind_map": {"nodes": nodes}, "scenarios": [1] * rng.randint(0, 5)}
+    if phase == 4:
+        return {"market_size": rng.choice([0, 5e7, 5e8]), "trend_analysis": {"trends": [1] * rng.randint(0, 5)}}
+    if phase == 5:
+        return {"leadership_assessment": {"overall_score": rng.uniform(0, 10)}}
+    if phase == 6:
+        return {"ai_opportunities": [1] * rng.randint(0, 12), "ai_roadmap": {"phases": [1, 2]}}
+    return {"business_plan": {str(i): "" for i in range(rng.randint(0, 9))}}
+
+
+def test_batch_scores_match_per_phase_scoring():
+    rng = random.Random(7)
+    cohort = [
+        {phase: _random_phase_data(phase, rng) for phase in range(1, 8) if rng.random() < 0.7}
+        for _ in range(300)
+    ]
+    batch = engine.score_batch(cohort)
+
+    for index, phases in enumerate(cohort):
+        results = {phase: {"score": engine._calculate_phase_score(phase, data)} for phase, data in phases.items()}
+        expected = engine.calculate_overall_assessment(results)
+        for phase in range(1, 8):
+            actual = batch["phase_scores"][index, phase - 1]
+            if phase in phases:
+                assert np.isclose(actual, results[phase]["score"])
+            else:
+                assert np.isnan(actual)
+        assert round(batch["overall_score"][index], 2) == expected["overall_score"]
+        assert abs(batch["success_probability"][index] - expected["success_probability"]) <= 0.01
+        level = readiness_label(batch["readiness_level"][index])
+        assert level == engine._determine_readiness_level(batch["overall_score"][index])
+
+
+def test_admin_rescore_rewrites_stored_scores(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_TOKEN", "secret")
+    headers = {"X-Admin-Token": "secret"}
+    phase_data = {"five_whys_result": {"purpose_clarity_score": 10}}
+    record = EnhancedAssessment(
+        id="a1",
+        phase_results=json.dumps({"1": {"phase_number": 1, "score": 1.0, "data": phase_data}}),
+        phase_scores=json.dumps({"1": 1.0}),
+        weighted_score_sum=0.2,
+        weight_total=0.2,
+        overall_score=1.0,
+    )
+    db.session.add_all([record, EnhancedAssessment(id="a2")])
+    db.session.commit()
+
+    response = client.post("/api/admin/rescore", json={"weights": {"1": 0.5}}, headers=headers)
+    assert response.status_code == 400
+
+    dry = client.post("/api/admin/rescore", json={"dry_run": True, "chunk_size": 1}, headers=headers).get_json()
+    assert dry["data"]["rescored"] == 2
+    assert db.session.get(EnhancedAssessment, "a1").overall_score == 1.0
+
+    result = client.post("/api/admin/rescore", json={}, headers=headers).get_json()["data"]
+    assert result["rescored"] == 2 and result["mean_overall_score"] == 2.0
+    stored = db.session.get(EnhancedAssessment, "a1")
+    assert stored.overall_score == 4.0 and stored.get_phase_scores() == {1: 4.0}
+    assert stored.get_phase_results()[1]["score"] == 4.0
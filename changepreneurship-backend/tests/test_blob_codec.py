@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from src.utils.blob_codec import MARKER, is_packed, pack_json_text, unpack_json_text
+
+
+def test_small_values_stay_plain_text():
+    text = json.dumps({"step": 1})
+    assert pack_json_text(text, threshold=1024) == text
+    assert pack_json_text(None) is None
+
+
+def test_large_values_round_trip_compressed():
+    text = json.dumps({"answers": {f"q{i}": "some answer text" for i in range(200)}})
+    packed = pack_json_text(text, threshold=1024)
+    assert isinstance(packed, bytes) and packed.startswith(MARKER)
+    assert len(packed) < len(text)
+    assert unpack_json_text(packed) == text
+    assert unpack_json_text(memoryview(packed)) == text
+
+
+def test_incompressible_values_are_left_alone():
+    # Too short for zlib to win back its header, so the text is kept
+    assert pack_json_text('"ab"', threshold=1) == '"ab"'
+    assert not is_packed('"ab"')
+
+
+def test_legacy_and_unknown_values():
+    assert unpack_json_text('{"a": 1}') == '{"a": 1}'
+    assert unpack_json_text(b'{"a": 1}') == '{"a": 1}'
+    with pytest.raises(ValueError):
+        unpack_json_text(MARKER + b"?payload")
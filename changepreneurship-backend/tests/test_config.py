@@ -0,0 +1,36 @@
+from flask import Flask
+from sqlalchemy import text
+
+from src.config import DEFAULT_SQLITE_PATH, configure_database, database_url, engine_options
+from src.models.assessment import db
+
+
+def test_database_url_defaults_to_sqlite_and_normalises_postgres():
+    assert database_url({}) == f"sqlite:///{DEFAULT_SQLITE_PATH}"
+    assert database_url({"DATABASE_URL": "postgres://u:p@host/app"}) == "postgresql://u:p@host/app"
+    assert database_url({"DATABASE_URL": "postgresql://u:p@host/app"}) == "postgresql://u:p@host/app"
+
+
+def test_engine_options_per_backend():
+    assert engine_options("sqlite:///app.db", {"SQLITE_BUSY_TIMEOUT_MS": "2500"}) == {
+        "connect_args": {"timeout": 2.5}
+    }
+    options = engine_options("postgresql://u:p@host/app", {"DB_POOL_SIZE": "12"})
+    assert options["pool_size"] == 12
+    assert options["max_overflow"] == 10
+    assert options["pool_pre_ping"] is True
+
+
+def test_configure_database_applies_sqlite_pragmas(tmp_path):
+    app = Flask(__name__)
+    db_file = tmp_path / "nested" / "app.db"
+    configure_database(app, db, environ={"DATABASE_URL": f"sqlite:///{db_file}", "SQLITE_CACHE_SIZE": "-4000"})
+
+    with app.app_context():
+        with db.engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert connection.execute(text("PRAGMA cache_size")).scalar() == -4000
+        db.engine.dispose()
+    assert db_file.parent.is_dir()
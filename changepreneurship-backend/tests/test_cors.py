@@ -0,0 +1,14 @@
+from src.main import ALLOWED_ORIGINS, app
+
+
+def test_patch_preflight_is_allowed():
+    client = app.test_client()
+    for path in ("/api/assessment/1/data", "/api/assessment/profile"):
+        response = client.options(path, headers={
+            "Origin": ALLOWED_ORIGINS[0],
+            "Access-Control-Request-Method": "PATCH",
+            "Access-Control-Request-Headers": "Content-Type, Authorization",
+        })
+        assert response.status_code in (200, 204)
+        assert response.headers["Access-Control-Allow-Origin"] == ALLOWED_ORIGINS[0]
+        assert "PATCH" in response.headers["Access-Control-Allow-Methods"]
@@ -0,0 +1,84 @@
+from src.models.assessment import EnhancedAssessment, db
+
+
+def start_assessment(client, user_id=1):
+    response = client.post("/api/enhanced-assessment/start", json={"user_id": user_id})
+    assert response.status_code == 200
+    return response.get_json()["data"]["id"]
+
+
+def test_complete_phase_updates_running_scores(app, client):
+    assessment_id = start_assessment(client)
+
+    for phase_number, phase_data in [
+        (1, {"five_whys_result": {"purpose_clarity_score": 10}}),
+        (4, {"market_size": 500000000}),
+    ]:
+        response = client.post(
+            "/api/enhanced-assessment/complete-phase",
+            json={"assessment_id": assessment_id, "phase_number": phase_number, "phase_data": phase_data},
+        )
+        assert response.status_code == 200
+
+    with app.app_context():
+        record = db.session.get(EnhancedAssessment, assessment_id)
+        assert record.get_phase_scores() == {1: 4.0, 4: 7}
+        assert record.weight_total == 0.35
+        assert round(record.overall_score, 4) == round((4.0 * 0.20 + 7 * 0.15) / 0.35, 4)
+
+    # Re-completing a phase replaces its contribution instead of adding to it
+    client.post(
+        "/api/enhanced-assessment/complete-phase",
+        json={"assessment_id": assessment_id, "phase_number": 4, "phase_data": {}},
+    )
+
+    with app.app_context():
+        record = db.session.get(EnhancedAssessment, assessment_id)
+        assert record.weight_total == 0.35
+        assert round(record.overall_score, 4) == round((4.0 * 0.20 + 5 * 0.15) / 0.35, 4)
+
+
+def test_final_results_and_resume_from_another_client(app, client):
+    assessment_id = start_assessment(client)
+    client.post(
+        "/api/enhanced-assessment/complete-phase",
+        json={"assessment_id": assessment_id, "phase_number": 4, "phase_data": {"market_size": 500000000}},
+    )
+
+    response = client.post("/api/enhanced-assessment/final-results", json={"assessment_id": assessment_id})
+    assert response.status_code == 200
+    final_results = response.get_json()["data"]["final_results"]
+    assert final_results["overall_score"] == 7.0
+    assert final_results["strengths"] == ["Strong enhanced market intelligence"]
+
+    other_device = app.test_client()
+    response = other_device.get(f"/api/enhanced-assessment/status?assessment_id={assessment_id}")
+    data = response.get_json()["data"]
+    assert data["completion_status"] == "completed"
+    assert data["current_phase"] == 5
+    assert data["final_results"]["overall_score"] == 7.0
+
+
+def test_complete_phase_unknown_assessment(client):
+    response = client.post(
+        "/api/enhanced-assessment/complete-phase",
+        json={"assessment_id": "missing", "phase_number": 1, "phase_data": {}},
+    )
+    assert response.status_code == 404
+
+
+def test_complete_phase_rejects_unknown_phase_numbers(app, client):
+    assessment_id = start_assessment(client)
+
+    for phase_number in (None, "three", 0, 8):
+        response = client.post(
+            "/api/enhanced-assessment/complete-phase",
+            json={"assessment_id": assessment_id, "phase_number": phase_number, "phase_data": {}},
+        )
+        assert response.status_code == 400
+
+    with app.app_context():
+        assert db.session.get(EnhancedAssessment, assessment_id).get_phase_scores() == {}
+
+    response = client.post("/api/enhanced-assessment/final-results", json={"assessment_id": assessment_id})
+    assert response.status_code == 200
@@ -0,0 +1,38 @@
+import numpy as np
+
+from src.services import graph_layout
+from src.services.graph_layout import force_directed_layout
+
+
+def tree_edges(node_count, fanout=10):
+    return [(i, i // fanout * fanout) for i in range(node_count) if i % fanout]
+
+
+def test_fixed_nodes_keep_their_positions():
+    start = np.random.default_rng(0).uniform(0, 500, (30, 2))
+    fixed = np.ones(30, dtype=bool)
+    fixed[[3, 7]] = False
+
+    positions = force_directed_layout(30, tree_edges(30), positions=start, fixed=fixed, seed=1)
+
+    assert np.allclose(positions[fixed], start[fixed], atol=0.1)
+    assert not np.allclose(positions[~fixed], start[~fixed], atol=0.1)
+
+
+def test_grid_layout_spreads_large_graphs(monkeypatch):
+    calls = []
+    grid_repulsion = graph_layout._grid_repulsion
+    monkeypatch.setattr(
+        graph_layout, "_grid_repulsion", lambda pos, k: calls.append(1) or grid_repulsion(pos, k)
+    )
+
+    positions = force_directed_layout(2000, tree_edges(2000), seed=3)
+
+    assert calls
+    assert np.isfinite(positions).all()
+    # Children settle near their category but not on top of each other
+    edges = np.array(tree_edges(2000))
+    lengths = np.hypot(*(positions[edges[:, 0]] - positions[edges[:, 1]]).T)
+    assert np.median(lengths) < 20 * graph_layout.DEFAULT_IDEAL_DISTANCE
+    cells = np.floor(positions / 10).astype(int)
+    assert len({tuple(cell) for cell in cells}) > 1900
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from src.services.group_commit import GroupCommitWriter
+
+
+def insert_value(value):
+    def operation(connection):
+        connection.execute(text("INSERT INTO saves (value) VALUES (:value)"), {"value": value})
+        return value
+
+    return operation
+
+
+def test_writer_commits_concurrent_operations_in_groups(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'saves.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE saves (value INTEGER NOT NULL)"))
+    writer = GroupCommitWriter(engine, window_ms=20)
+
+    results = []
+    threads = [threading.Thread(target=lambda v=v: results.append(writer.execute(insert_value(v)))) for v in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+    assert sorted(results) == list(range(50))
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM saves")).scalar() == 50
+    stats = writer.stats()
+    assert stats["operations"] == 50
+    assert stats["groups"] < 50
+
+
+def test_failing_operation_only_fails_its_own_caller(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'saves.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE saves (value INTEGER NOT NULL)"))
+    writer = GroupCommitWriter(engine, window_ms=50)
+
+    good = writer.submit(insert_value(1))
+    bad = writer.submit(insert_value(None))
+    other = writer.submit(insert_value(2))
+
+    assert good.result(5) == 1
+    assert other.result(5) == 2
+    with pytest.raises(Exception):
+        bad.result(5)
+    writer.close()
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT value FROM saves ORDER BY value")).scalars().all() == [1, 2]
+    with pytest.raises(RuntimeError):
+        writer.submit(insert_value(3))
+
+
+def test_writer_restores_synchronous_on_pooled_connections(tmp_path):
+    # One pooled connection, so the app gets back the one the writer used
+    engine = create_engine(f"sqlite:///{tmp_path / 'saves.db'}", pool_size=1, max_overflow=0)
+    event.listen(engine, "connect", lambda connection, _: connection.execute("PRAGMA synchronous=NORMAL"))
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE saves (value INTEGER NOT NULL)"))
+    writer = GroupCommitWriter(engine)
+
+    assert writer.execute(insert_value(1)) == 1
+    with pytest.raises(Exception):
+        writer.execute(insert_value(None))
+    writer.close()
+
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
@@ -0,0 +1,66 @@
+import pytest
+
+from src.utils.json_patch import JsonPatchError, JsonPatchTestFailed, apply_json_patch, merge_patch
+
+
+def test_merge_patch_follows_rfc_7396():
+    target = {"title": "Goodbye!", "author": {"givenName": "John", "familyName": "Doe"}, "tags": ["example", "sample"]}
+    patch = {"title": "Hello!", "phoneNumber": "+01-123-456-7890", "author": {"familyName": None}, "tags": ["example"]}
+
+    assert merge_patch(target, patch) == {
+        "title": "Hello!",
+        "author": {"givenName": "John"},
+        "tags": ["example"],
+        "phoneNumber": "+01-123-456-7890",
+    }
+    assert target["author"] == {"givenName": "John", "familyName": "Doe"}
+    assert merge_patch({"a": [{"b": "c"}]}, {"a": [1]}) == {"a": [1]}
+    assert merge_patch({"a": "foo"}, ["c"]) == ["c"]
+    assert merge_patch({"e": None}, {"a": 1}) == {"e": None, "a": 1}
+
+
+def test_json_patch_operations():
+    document = {"foo": ["bar", "baz"], "a/b": 1, "nested": {"x": 1}}
+    patched = apply_json_patch(document, [
+        {"op": "add", "path": "/foo/1", "value": "qux"},
+        {"op": "add", "path": "/foo/-", "value": "end"},
+        {"op": "remove", "path": "/a~1b"},
+        {"op": "replace", "path": "/nested/x", "value": 2},
+        {"op": "copy", "from": "/nested", "path": "/copied"},
+        {"op": "move", "from": "/foo/0", "path": "/first"},
+        {"op": "test", "path": "/copied/x", "value": 2},
+    ])
+
+    assert patched == {"foo": ["qux", "baz", "end"], "nested": {"x": 2}, "copied": {"x": 2}, "first": "bar"}
+    assert document == {"foo": ["bar", "baz"], "a/b": 1, "nested": {"x": 1}}
+
+
+def test_json_patch_rejects_invalid_operations():
+    with pytest.raises(JsonPatchTestFailed):
+        apply_json_patch({"a": 1}, [{"op": "test", "path": "/a", "value": 2}])
+    with pytest.raises(JsonPatchError):
+        apply_json_patch({"a": 1}, [{"op": "remove", "path": "/missing"}])
+    with pytest.raises(JsonPatchError):
+        apply_json_patch({"a": [1]}, [{"op": "add", "path": "/a/5", "value": 2}])
+    with pytest.raises(JsonPatchError):
+        apply_json_patch({"a": {}}, [{"op": "move", "from": "/a", "path": "/a/b"}])
+    with pytest.raises(JsonPatchError):
+        apply_json_patch({}, [{"op": "frobnicate", "path": "/a"}])
+
+
+def test_test_operation_compares_json_types():
+    document = {"flag": 1, "count": 1.0, "nested": {"on": True, "items": [0]}}
+    for path, value in (("/flag", True), ("/nested/on", 1), ("/nested", {"on": 1, "items": [0]}), ("/nested/items", [False])):
+        with pytest.raises(JsonPatchTestFailed):
+            apply_json_patch(document, [{"op": "test", "path": path, "value": value}])
+    # JSON has a single number type, so 1 and 1.0 are equal (RFC 6902 section 4.6)
+    assert apply_json_patch(document, [{"op": "test", "path": "/count", "value": 1}]) == document
+
+
+def test_whole_document_paths():
+    document = {"a": 1}
+    assert apply_json_patch(document, [{"op": "replace", "path": "", "value": {"b": 2}}]) == {"b": 2}
+    assert apply_json_patch(document, [{"op": "add", "path": "", "value": [1]}]) == [1]
+    assert apply_json_patch(document, [{"op": "test", "path": "", "value": {"a": 1}}]) == document
+    with pytest.raises(JsonPatchError):
+        apply_json_patch(document, [{"op": "remove", "path": ""}])
@@ -0,0 +1,82 @@
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+from flask import Flask
+
+from src.utils import json_provider
+from src.utils.json_provider import FastJSONProvider, RawJSON, SplicingJSONProvider
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pytest.fixture(params=[SplicingJSONProvider, FastJSONProvider, "fallback"])
+def app(request, monkeypatch):
+    app = Flask(__name__)
+    if request.param == "fallback":
+        monkeypatch.setattr(json_provider, "orjson", None)
+        app.json = FastJSONProvider(app)
+    else:
+        app.json = request.param(app)
+    return app
+
+
+@pytest.fixture
+def provider(app):
+    return app.json
+
+
+def test_raw_json_is_spliced_verbatim(provider):
+    raw = '{"b": [1, 2], "a": "\\u00e9"}'
+    text = provider.dumps({"data": RawJSON(raw), "other": [RawJSON("null"), "x"]})
+
+    assert raw in text
+    assert json.loads(text) == {"data": {"b": [1, 2], "a": "é"}, "other": [None, "x"]}
+
+
+def test_lookalike_strings_are_not_replaced(provider):
+    value = "\x00deadbeef:0\x00"
+    assert json.loads(provider.dumps({"raw": RawJSON("1"), "text": value})) == {"raw": 1, "text": value}
+
+
+def test_native_types_encode_the_same_everywhere(provider):
+    key = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    payload = {
+        "at": datetime(2026, 1, 2, 3, 4, 5, 678),
+        "on": date(2026, 1, 2),
+        "id": key,
+        "point": Point(1, 2),
+        "counts": {2: "int key"},
+        "big": 2 ** 70,
+    }
+    assert json.loads(provider.dumps(payload)) == {
+        "at": "2026-01-02T03:04:05.000678",
+        "on": "2026-01-02",
+        "id": str(key),
+        "point": {"x": 1, "y": 2},
+        "counts": {"2": "int key"},
+        "big": 2 ** 70,
+    }
+
+
+def test_response_and_loads(app, provider):
+    with app.app_context():
+        response = provider.response({"a": [1, 2]})
+    assert response.mimetype == "application/json"
+    assert provider.loads(response.get_data()) == {"a": [1, 2]}
+
+
+def test_fallback_encodes_numpy_alongside_values_orjson_rejects(app, provider):
+    payload = {"grid": np.arange(3), "rate": np.float64(0.5), "count": np.int64(7), "point": Point(1, 2), "big": 2 ** 70}
+    expected = {"grid": [0, 1, 2], "rate": 0.5, "count": 7, "point": {"x": 1, "y": 2}, "big": 2 ** 70}
+
+    assert json.loads(provider.dumps(payload)) == expected
+    with app.app_context():
+        assert json.loads(provider.response(payload).get_data()) == expected
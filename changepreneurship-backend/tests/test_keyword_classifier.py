@@ -0,0 +1,36 @@
+import random
+
+from src.routes.purpose_discovery import FOCUS_AREA_KEYWORDS, MOTIVATION_KEYWORDS
+from src.utils.keyword_classifier import KeywordClassifier
+
+
+def naive_hits(table, text):
+    text = text.lower()
+    return {
+        category: sum(1 for keyword in keywords if keyword.lower() in text)
+        for category, keywords in table.items()
+    }
+
+
+def test_overlapping_and_nested_keywords():
+    table = {"green": ["eco", "economy", "nomy"], "money": ["economy", "income", "come"]}
+    classifier = KeywordClassifier(table)
+
+    assert classifier.matched_keywords("The ECONOMY will come") == {"eco", "economy", "nomy", "come"}
+    assert classifier.category_hits("The ECONOMY will come") == {"green": 3, "money": 2}
+    assert classifier.categories_present("passive income") == ["money"]
+    assert classifier.category_hits("") == {"green": 0, "money": 0}
+
+
+def test_matches_naive_substring_counts_on_engine_tables():
+    vocabulary = [
+        word for keywords in list(MOTIVATION_KEYWORDS.values()) + list(FOCUS_AREA_KEYWORDS.values())
+        for word in keywords
+    ] + ["careful", "ecosystem", "helpful", "the", "and", "apple"]
+    rng = random.Random(7)
+
+    for table in (MOTIVATION_KEYWORDS, FOCUS_AREA_KEYWORDS):
+        classifier = KeywordClassifier(table)
+        for _ in range(200):
+            text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 12)))
+            assert classifier.category_hits(text) == naive_hits(table, text)
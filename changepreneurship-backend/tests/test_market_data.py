@@ -0,0 +1,56 @@
+import os
+
+from src.routes.value_zone_validator import ValueZoneValidator
+from src.services.market_data import MarketDataStore
+
+HEADER = "name,keywords,market_size,growth_rate,competition_level,leader_share,trends\n"
+
+
+def _store(tmp_path, rows):
+    csv_path = tmp_path / "markets.csv"
+    csv_path.write_text(HEADER + "".join(rows))
+    return MarketDataStore(csv_path=str(csv_path), db_path=str(tmp_path / "markets.db"))
+
+
+def test_store_builds_lazily_and_resolves_ideas_in_batches(tmp_path):
+    store = _store(tmp_path, [
+        "Pet Care,pet;dog;grooming,1200000000,0.10,Medium,20,Pet Telehealth;Premium Pet Food\n",
+        "Beauty,beauty;grooming;salon,2200000000,0.08,High,25,Clean Beauty\n",
+        "Education,course;tutoring,3000000000,0.10,Medium,30,EdTech\n",
+    ])
+    assert not os.path.exists(tmp_path / "markets.db")
+    assert store.count() == 3
+
+    resolved = store.resolve_markets(["Mobile dog grooming", "Salon booking", "Knitting circle"], [])
+    assert resolved["Mobile dog grooming"]["name"] == "Pet Care"
+    assert resolved["Salon booking"]["name"] == "Beauty"
+    assert resolved["Knitting circle"] is None
+
+    targeted = store.resolve_markets(["Dog tutoring course"], ["unknown", "beauty", "education"])
+    assert targeted["Dog tutoring course"]["name"] == "Education"
+    assert store.get_markets(["PET CARE"])["PET CARE"]["trends"] == ["Pet Telehealth", "Premium Pet Food"]
+
+
+def test_store_rebuilds_when_csv_changes(tmp_path):
+    store = _store(tmp_path, ["Pet Care,pet,1200000000,0.10,Medium,20,\n"])
+    first = store.fingerprint
+    assert store.count() == 1
+
+    (tmp_path / "markets.csv").write_text(HEADER + "Pet Care,pet,1,0.1,Low,5,\nBeauty,beauty,2,0.1,Low,5,\n")
+    os.utime(tmp_path / "markets.csv", ns=(0, 10 ** 18))
+    reopened = MarketDataStore(csv_path=store.csv_path, db_path=store.db_path)
+    assert reopened.fingerprint != first
+    assert reopened.count() == 2
+
+
+def test_market_analysis_uses_dataset(tmp_path):
+    validator = ValueZoneValidator()
+    validator.market_data = _store(tmp_path, ["Pet Care,pet;dog,1200000000,0.16,Low,20,Pet Telehealth\n"])
+
+    analysis = validator.analyze_market_demand(["Dog walking app", "Knitting circle"], [])
+    dog = analysis["Dog walking app"]
+    assert dog["market"] == "Pet Care"
+    assert (dog["growth_rate"], dog["competition_analysis"]["level"], dog["opportunity_score"]) == (0.16, "Low", 9)
+    assert dog["competition_analysis"]["market_share_distribution"] == {"Leader": 20, "Others": 80}
+    assert analysis["Knitting circle"]["market"] is None
+    assert analysis["Knitting circle"]["market_size"] == 1000000000
@@ -0,0 +1,125 @@
+from src.models.assessment import MindMap, MindMapNode, db
+from src.services.plan_export import section_cache
+
+
+def create_mind_map(client):
+    response = client.post("/api/mind-mapping/create", json={"user_id": 1, "business_idea": "Meal kits"})
+    assert response.status_code == 200
+    return response.get_json()["data"]
+
+
+def test_node_edits_persist_and_update_completion(app, client):
+    mind_map = create_mind_map(client)
+    element_id = mind_map["nodes"]["category_1"]["children"][0]
+
+    response = client.post("/api/mind-mapping/update-node", json={
+        "mind_map_id": mind_map["id"],
+        "node_id": element_id,
+        "node_data": {"answer": "Busy parents who want healthy dinners", "position": {"x": 10, "y": 20}},
+    })
+    assert response.status_code == 200
+    result = response.get_json()["data"]
+    assert result["completion_status"]["core"] == 33
+    assert result["completion_status"]["overall"] == 6
+    assert result["node"]["position"] == {"x": 10, "y": 20}
+
+    # Clearing the answer takes the element back out of the completed count
+    client.post("/api/mind-mapping/update-node", json={
+        "mind_map_id": mind_map["id"], "node_id": element_id, "node_data": {"answer": ""},
+    })
+
+    with app.app_context():
+        record = db.session.get(MindMap, mind_map["id"])
+        node = db.session.get(MindMapNode, (mind_map["id"], element_id))
+        assert record.completion_status()["core"] == 0
+        assert record.revision == 2
+        assert node.revision == 2
+        assert (node.x, node.y) == (10, 20)
+
+
+def test_connections_scenarios_and_paged_nodes(client):
+    mind_map = create_mind_map(client)
+    node_ids = sorted(mind_map["nodes"], key=lambda node_id: int(node_id.rsplit("_", 1)[1]))
+
+    response = client.post("/api/mind-mapping/create-connection", json={
+        "mind_map_id": mind_map["id"], "source_node": node_ids[0], "target_node": node_ids[1],
+    })
+    assert response.status_code == 200
+    response = client.post("/api/mind-mapping/create-connection", json={
+        "mind_map_id": mind_map["id"], "source_node": node_ids[0], "target_node": "missing",
+    })
+    assert response.status_code == 404
+    client.post("/api/mind-mapping/create-scenario", json={
+        "mind_map_id": mind_map["id"], "scenario_name": "Base", "scenario_type": "conservative",
+    })
+
+    loaded = client.get(f"/api/mind-mapping/{mind_map['id']}?limit=10").get_json()["data"]
+    assert set(loaded["nodes"]) == set(node_ids[:10])
+    assert loaded["connection_count"] == 1
+    assert len(loaded["scenarios"]) == 1
+
+    paged = []
+    cursor = None
+    while True:
+        query = f"?limit=10&cursor={cursor}" if cursor is not None else "?limit=10"
+        page = client.get(f"/api/mind-mapping/{mind_map['id']}/nodes{query}").get_json()["data"]
+        paged.extend(node["id"] for node in page["nodes"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert paged == node_ids
+
+    assert client.get("/api/mind-mapping/unknown").status_code == 404
+
+
+def test_layout_is_incremental_after_the_first_pass(client):
+    mind_map = create_mind_map(client)
+
+    first = client.post("/api/mind-mapping/layout", json={"mind_map_id": mind_map["id"], "seed": 1})
+    first = first.get_json()["data"]
+    assert first["mode"] == "full"
+    assert set(first["positions"]) == set(mind_map["nodes"])
+
+    unchanged = client.post("/api/mind-mapping/layout", json={"mind_map_id": mind_map["id"]}).get_json()["data"]
+    assert unchanged["mode"] == "incremental"
+    assert unchanged["positions"] == {}
+
+    client.post("/api/mind-mapping/create-connection", json={
+        "mind_map_id": mind_map["id"], "source_node": "element_2", "target_node": "element_6",
+    })
+    moved = client.post("/api/mind-mapping/layout", json={"mind_map_id": mind_map["id"], "seed": 1})
+    assert set(moved.get_json()["data"]["positions"]) == {"element_2", "element_6"}
+
+    stored = client.get(f"/api/mind-mapping/{mind_map['id']}").get_json()["data"]["nodes"]
+    assert stored["category_1"]["position"] == first["positions"]["category_1"]
+
+
+def test_streamed_export_only_rerenders_changed_sections(client):
+    section_cache.clear()
+    mind_map = create_mind_map(client)
+    client.post("/api/mind-mapping/update-node", json={
+        "mind_map_id": mind_map["id"], "node_id": "element_2", "node_data": {"answer": "Fresh <local> meals"},
+    })
+
+    markdown = client.get(f"/api/mind-mapping/{mind_map['id']}/export?format=markdown")
+    assert markdown.is_streamed
+    body = markdown.get_data(as_text=True)
+    assert body.startswith("# Business Plan: Meal kits")
+    assert "- **Value Proposition:** Fresh <local> meals" in body
+    assert section_cache.stats()["misses"] == 9
+
+    client.get(f"/api/mind-mapping/{mind_map['id']}/export?format=markdown").get_data()
+    assert section_cache.stats()["hits"] == 9
+
+    # A market answer invalidates only the two sections built from market nodes
+    client.post("/api/mind-mapping/update-node", json={
+        "mind_map_id": mind_map["id"], "node_id": "element_14", "node_data": {"answer": "Urban families"},
+    })
+    client.get(f"/api/mind-mapping/{mind_map['id']}/export?format=markdown").get_data()
+    assert section_cache.stats() == {"entries": 11, "hits": 16, "misses": 11}
+
+    html = client.get(f"/api/mind-mapping/{mind_map['id']}/export?format=html").get_data(as_text=True)
+    assert "Fresh &lt;local&gt; meals" in html
+    lines = client.get(f"/api/mind-mapping/{mind_map['id']}/export?format=ndjson").get_data(as_text=True).splitlines()
+    assert len(lines) == 10
+    assert client.get(f"/api/mind-mapping/{mind_map['id']}/export?format=pdf").status_code == 400
@@ -0,0 +1,47 @@
+import time
+
+from src.routes.value_zone_validator import ValueZoneValidator
+from src.services.opportunity_matching import OpportunityMatcher
+
+
+def test_matcher_ranks_exact_pairs_first_and_returns_partial_matches():
+    matcher = OpportunityMatcher([
+        ("Health", "Technical", "Telehealth app"),
+        ("Health", "Communication", "Health coaching"),
+        ("Music", "Creative", "Songwriting studio"),
+    ])
+
+    exact, partial, unrelated = matcher.match(
+        [("Health", "Communication"), ("Health", "Sales"), ("Gardening", "Accounting")], top_k=2
+    )
+    assert exact[0] == {"name": "Health coaching", "score": exact[0]["score"], "match_type": "exact"}
+    assert exact[1]["match_type"] == "partial" and exact[1]["name"] == "Telehealth app"
+    assert {match["name"] for match in partial} == {"Telehealth app", "Health coaching"}
+    assert all(match["match_type"] == "partial" for match in partial)
+    assert unrelated == []
+
+
+def test_matcher_scales_to_large_catalogs():
+    entries = [(f"Passion {i % 40}", f"Skill {i % 37}", f"Opportunity {i}") for i in range(20000)]
+    matcher = OpportunityMatcher(entries)
+    pairs = [(f"Passion {p}", f"Skill {s}") for p in range(3) for s in range(3)]
+
+    start = time.perf_counter()
+    results = matcher.match(pairs, top_k=5)
+    assert time.perf_counter() - start < 0.5
+    assert all(len(matches) == 5 and matches[0]["match_type"] == "exact" for matches in results)
+
+
+def test_value_zones_include_match_details():
+    validator = ValueZoneValidator()
+    passions = {"primary_passions": ["Technology & Innovation", "Sports & Fitness"], "passion_intensity": 8}
+    skills = {"core_skills": ["Technical Skills"]}
+    market = validator.analyze_market_demand(["Mobile app creation"], ["Technology & Innovation"])
+
+    zones = validator.find_value_zone(passions, skills, market)
+    tech = next(zone for zone in zones if zone["passion"] == "Technology & Innovation")
+    app = next(item for item in tech["opportunities"] if item["opportunity"] == "Mobile app creation")
+    assert app["match_type"] == "exact"
+    assert app["market_data"] is market["Mobile app creation"]
+    assert all(item["market_data"]["opportunity_score"] for zone in zones for item in zone["opportunities"])
+    assert any(zone["passion"] == "Sports & Fitness" for zone in zones)
@@ -0,0 +1,46 @@
+from src.utils.result_cache import ResultCache, analysis_cache, canonical_key
+
+
+def test_canonical_key_ignores_key_order_but_not_version():
+    first = canonical_key("engine", "1", {"a": 1, "b": [1, 2]})
+    assert first == canonical_key("engine", "1", {"b": [1, 2], "a": 1})
+    assert first != canonical_key("engine", "2", {"a": 1, "b": [1, 2]})
+    assert first != canonical_key("other", "1", {"a": 1, "b": [1, 2]})
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return {"value": value}
+
+    for value in (1, 2, 1, 3, 1, 2):
+        cache.get_or_compute("engine", "1", value, lambda: compute(value))
+
+    assert calls == [1, 2, 3, 2]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"]) == (2, 4, 2, 2)
+
+    small = ResultCache(max_bytes=40)
+    small.get_or_compute("engine", "1", "a", lambda: "x" * 30)
+    small.get_or_compute("engine", "1", "b", lambda: "y" * 30)
+    assert small.stats()["entries"] == 1
+
+
+def test_identify_opportunities_is_memoized(client, monkeypatch):
+    analysis_cache.clear()
+    payload = {"industry": "Finance", "business_profile": {"size": "medium", "tech_readiness": 9}}
+    reordered = {"business_profile": {"tech_readiness": 9, "size": "medium"}, "industry": "Finance"}
+
+    first = client.post("/api/ai-adoption/identify-opportunities", json=payload).get_json()["data"]
+    second = client.post("/api/ai-adoption/identify-opportunities", json=reordered).get_json()["data"]
+    assert [item["category"] for item in first] == [item["category"] for item in second]
+    assert not {item["id"] for item in first} & {item["id"] for item in second}
+
+    assert client.get("/api/admin/cache-stats").status_code == 403
+    monkeypatch.setenv("ADMIN_API_TOKEN", "secret")
+    assert client.get("/api/admin/cache-stats", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    stats = client.get("/api/admin/cache-stats", headers={"X-Admin-Token": "secret"}).get_json()["data"]
+    assert (stats["analysis"]["hits"], stats["analysis"]["misses"]) == (1, 1)
@@ -0,0 +1,138 @@
+import random
+import time
+
+import pytest
+
+from src.routes.ai_adoption_roadmap import ai_adoption_roadmap
+from src.services.roadmap_planning import MAX_TIME_LIMIT_MS, pack_phases, schedule_initiatives
+
+
+def test_packing_uses_fewest_phases_and_front_loads_value():
+    # Greedy in value order opens a third phase: [30k], [25k, 20k], [25k]
+    costs = [30000, 20000, 25000, 25000]
+    values = [10, 8, 9, 1]
+
+    plan = pack_phases(costs, values, phase_budgets=[50000], max_per_phase=3)
+
+    assert plan["phases"] == [[0, 1], [2, 3]]
+    assert plan["optimal"] is True
+    assert plan["lower_bound"] == 2
+
+
+def test_over_budget_initiatives_stay_out_of_the_search():
+    # 80k fits no phase; the other four still pack into two
+    costs = [30000, 80000, 20000, 25000, 25000]
+    values = [10, 5, 8, 9, 1]
+
+    plan = pack_phases(costs, values, phase_budgets=[50000], max_per_phase=3)
+
+    assert plan["phases"] == [[0, 2], [3, 4], [1]]
+    assert plan["optimal"] is True
+    assert plan["lower_bound"] == 3
+
+    # The third 50 fits the first budget only, so this plan breaks a budget
+    plan = pack_phases([50, 50, 50], [1, 1, 1], phase_budgets=[100, 10], max_per_phase=3)
+
+    assert sorted(map(sorted, plan["phases"])) == [[0, 1], [2]]
+    assert plan["optimal"] is False
+
+
+def test_large_inputs_stay_within_the_time_limit():
+    rng = random.Random(7)
+    costs = [rng.randint(1, 50) * 1000 for _ in range(500)]
+    values = [rng.randint(1, 90) for _ in range(500)]
+
+    start = time.perf_counter()
+    plan = pack_phases(costs, values, time_limit_ms=50)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert plan["method"] == "greedy"
+    assert sorted(i for phase in plan["phases"] for i in phase) == list(range(500))
+    assert all(len(phase) <= 3 and sum(costs[i] for i in phase) <= 50000 for phase in plan["phases"])
+
+
+def test_client_time_limit_is_capped(client):
+    rng = random.Random(1)
+    costs = [rng.randint(10, 40) * 1000 + rng.randint(0, 999) for _ in range(60)]
+    values = [rng.randint(1, 90) for _ in range(60)]
+
+    start = time.perf_counter()
+    plan = pack_phases(costs, values, time_limit_ms=20000)
+    elapsed = time.perf_counter() - start
+
+    assert plan["method"] == "branch_and_bound" and plan["optimal"] is False
+    assert elapsed < MAX_TIME_LIMIT_MS / 1000 + 0.3
+
+    for limit in ("slow", None, float("inf")):
+        with pytest.raises(ValueError):
+            pack_phases(costs, values, time_limit_ms=limit)
+
+    opportunities = ai_adoption_roadmap.identify_ai_opportunities({"size": "small"}, "E-commerce")
+    response = client.post(
+        "/api/ai-adoption/create-roadmap",
+        json={"selected_opportunities": opportunities, "business_constraints": {"planning_time_limit_ms": "slow"}},
+    )
+    assert response.status_code == 400
+
+
+def test_roadmap_reports_packing_and_over_budget_phases():
+    opportunities = ai_adoption_roadmap.identify_ai_opportunities({"size": "small"}, "E-commerce")
+    opportunities.append(dict(opportunities[0], estimated_cost=80000))
+
+    roadmap = ai_adoption_roadmap.create_implementation_roadmap(opportunities, {"phase_budget": 50000})
+
+    assert roadmap["phase_packing"]["phase_count"] == len(roadmap["phases"])
+    assert roadmap["phases"][-1]["total_cost"] == 80000
+    assert sum(len(phase["opportunities"]) for phase in roadmap["phases"]) == len(opportunities)
+
+
+def test_schedule_orders_foundations_before_advanced_ai():
+    opportunities = [
+        {"id": "auto", "name": "Automation", "category": "automation", "complexity": "Low"},
+        {"id": "pred", "name": "Prediction", "category": "prediction", "complexity": "High"},
+        {"id": "gen", "name": "Generation", "category": "generation", "complexity": "Medium"},
+    ]
+
+    schedule = ai_adoption_roadmap._schedule_opportunities(opportunities, {})
+    assert schedule["makespan_months"] == 8
+    assert schedule["critical_path"] == ["auto", "pred"]
+    starts = {item["id"]: item["start_month"] for item in schedule["initiatives"]}
+    assert starts == {"auto": 0, "pred": 2, "gen": 0}
+
+    serial = ai_adoption_roadmap._schedule_opportunities(
+        opportunities, {"max_parallel": 1, "dependencies": [{"before": "gen", "after": "auto"}]}
+    )
+    assert serial["makespan_months"] == 12
+    assert serial["critical_path"] == ["gen", "auto", "pred"]
+
+
+def test_schedule_scales_linearly_and_rejects_cycles():
+    count = 5000
+    durations = [1 + i % 5 for i in range(count)]
+    chain = [(i, i + 1) for i in range(0, count - 1, 2)]
+
+    start = time.perf_counter()
+    result = schedule_initiatives(durations, chain, max_parallel=10)
+    assert time.perf_counter() - start < 1.0
+    assert all(result["start"][after] >= result["end"][before] for before, after in chain)
+
+    with pytest.raises(ValueError):
+        schedule_initiatives([1, 1], [(0, 1), (1, 0)])
+
+
+def test_opportunities_overlay_profile_on_shared_templates():
+    profile = {"size": "large", "tech_readiness": 8, "pain_points": ["manual_processes"]}
+    first = ai_adoption_roadmap.identify_ai_opportunities(profile, "Retail")
+    second = ai_adoption_roadmap.identify_ai_opportunities({"size": "small"}, "Retail")
+
+    assert len({item["id"] for item in first + second}) == len(first) + len(second)
+    assert [item["impact_score"] for item in first] == sorted((item["impact_score"] for item in first), reverse=True)
+    custom = [item for item in first if "custom_reason" in item]
+    assert [item["category"] for item in custom] == ["automation"]
+    assert custom[0]["estimated_cost"] == 100000 and custom[0]["feasibility_score"] == 9
+
+    first[0]["potential_benefits"] = []
+    again = ai_adoption_roadmap.identify_ai_opportunities({"size": "small"}, "Retail")
+    assert again[0]["potential_benefits"] == second[0]["potential_benefits"] != []
+    assert "custom_reason" not in again[0]
@@ -0,0 +1,106 @@
+import pytest
+
+from src.routes.mind_mapping import mind_mapping_tool
+from src.services.scenario_simulation import evaluate_projection_grid, simulate_scenario
+
+
+def test_constant_distributions_reproduce_deterministic_growth():
+    result = simulate_scenario(growth_rate=0.3, market_penetration=0.05, years=5, paths=100)
+
+    for label in ("p5", "p50", "p95", "mean"):
+        assert result["market_share"][label] == pytest.approx([0.05 * 1.3 ** t for t in range(5)])
+    assert result["revenue"]["p50"][0] == pytest.approx(5000)
+    assert result["customers"]["p50"][0] == pytest.approx(50)
+
+
+def test_stochastic_bands_are_ordered_and_reproducible():
+    kwargs = dict(
+        growth_rate={"distribution": "normal", "mean": 0.3, "std": 0.15},
+        churn_rate={"distribution": "uniform", "low": 0.0, "high": 0.1},
+        market_penetration={"distribution": "triangular", "low": 0.01, "mode": 0.05, "high": 0.1},
+        seed=42,
+    )
+    result = simulate_scenario(**kwargs)
+
+    assert result["paths"] == 10000
+    assert result["years"] == list(range(1, 11))
+    revenue = result["revenue"]
+    for year in range(10):
+        assert revenue["p5"][year] <= revenue["p25"][year] <= revenue["p50"][year]
+        assert revenue["p50"][year] <= revenue["p75"][year] <= revenue["p95"][year]
+    assert simulate_scenario(**kwargs) == result
+
+
+def test_invalid_simulation_options_are_rejected():
+    with pytest.raises(ValueError):
+        simulate_scenario(growth_rate=0.1, market_penetration=0.01, paths=0)
+    with pytest.raises(ValueError):
+        simulate_scenario(growth_rate={"distribution": "cauchy"}, market_penetration=0.01)
+
+
+def test_create_scenario_attaches_simulation_from_template():
+    scenario = mind_mapping_tool.create_scenario(
+        "map", "Upside", "optimistic", {"paths": 500, "years": 3, "seed": 1}
+    )
+
+    assert "year_5" in scenario["projections"]
+    assert scenario["simulation"]["years"] == [1, 2, 3]
+    assert len(scenario["simulation"]["revenue"]["p50"]) == 3
+
+
+def test_projection_grid_matches_per_scenario_projections():
+    grid = mind_mapping_tool.evaluate_scenario_grid(
+        {"scenario_types": ["conservative", "optimistic", "aggressive"]}
+    )
+
+    assert grid["shape"] == [3, 3]
+    revenue = grid["columns"]["revenue"]
+    for row, name in enumerate(grid["axes"]["scenario"]):
+        projections = mind_mapping_tool.create_scenario("map", name, name)["projections"]
+        expected = [projections[f"year_{year}"]["revenue"] for year in (1, 3, 5)]
+        assert revenue[row * 3:row * 3 + 3] == pytest.approx(expected)
+
+
+def test_cartesian_projection_grid_is_columnar():
+    grid = evaluate_projection_grid(
+        {"start": 0.1, "stop": 0.5, "num": 5}, [0.01, 0.05], years={"start": 1, "stop": 10, "step": 1}
+    )
+
+    assert grid["shape"] == [5, 2, 10]
+    assert grid["cells"] == 100
+    assert len(grid["columns"]["market_share"]) == 100
+    # C order: the last cell is the highest growth, penetration and year
+    assert grid["columns"]["market_share"][-1] == pytest.approx(0.05 * 1.5 ** 10)
+    with pytest.raises(ValueError):
+        evaluate_projection_grid({"start": 0, "stop": 1, "num": 1000}, {"start": 0, "stop": 1, "num": 1000})
+
+
+def test_oversized_grid_axes_are_rejected_before_allocation(monkeypatch):
+    import src.services.scenario_simulation as scenario_simulation
+
+    def fail(*args, **kwargs):
+        raise AssertionError("axis allocated")
+
+    monkeypatch.setattr(scenario_simulation.np, "linspace", fail)
+    monkeypatch.setattr(scenario_simulation.np, "arange", fail)
+    for axis in (
+        {"start": 0, "stop": 1, "num": 1e9},
+        {"start": 0, "stop": 1e9, "step": 1},
+        {"start": 0, "stop": 1, "step": 1e-12},
+        {"start": 0, "stop": float("inf"), "step": 1},
+    ):
+        with pytest.raises(ValueError):
+            evaluate_projection_grid(axis, 0.01)
+
+
+def test_non_finite_axes_and_overflow_are_rejected():
+    for growth_rates, penetrations in (
+        ([1e200, float("nan")], 0.01),
+        (float("inf"), 0.01),
+        (0.1, [0.01, float("-inf")]),
+    ):
+        with pytest.raises(ValueError, match="finite"):
+            evaluate_projection_grid(growth_rates, penetrations)
+
+    with pytest.raises(ValueError, match="overflows"):
+        evaluate_projection_grid([0.1, 1e200], 0.01, years=[1, 3])
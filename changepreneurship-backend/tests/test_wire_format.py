@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import msgpack
+import pytest
+from flask import Flask, jsonify, request
+
+from src.utils.json_provider import RawJSON
+from src.utils.wire_format import WireFormatProvider, WireFormatRequest
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.json = WireFormatProvider(app)
+    app.request_class = WireFormatRequest
+
+    @app.post("/echo")
+    def echo():
+        return jsonify({"received": request.get_json(), "at": datetime(2026, 1, 2), "raw": RawJSON('{"a": [1]}')})
+
+    return app
+
+
+@pytest.mark.parametrize("accept, mimetype", [
+    (None, "application/json"),
+    ("*/*", "application/json"),
+    ("application/msgpack", "application/msgpack"),
+    ("application/json;q=0.5, application/x-msgpack", "application/msgpack"),
+    ("application/msgpack;q=0.5, application/json", "application/json"),
+])
+def test_accept_header_picks_the_format(app, accept, mimetype):
+    headers = {"Accept": accept} if accept else {}
+    response = app.test_client().post("/echo", json={"q": 1}, headers=headers)
+    assert response.mimetype == mimetype
+    assert "Accept" in response.headers["Vary"]
+
+
+def test_msgpack_round_trip(app):
+    response = app.test_client().post(
+        "/echo",
+        data=msgpack.packb({"answers": {"q1": [1, 2]}, "done": True}),
+        headers={"Content-Type": "application/msgpack", "Accept": "application/msgpack"},
+    )
+    assert msgpack.unpackb(response.data) == {
+        "received": {"answers": {"q1": [1, 2]}, "done": True},
+        "at": "2026-01-02T00:00:00",
+        "raw": {"a": [1]},
+    }
+
+
+def test_malformed_msgpack_body_is_a_bad_request(app):
+    response = app.test_client().post("/echo", data=b"\xc1", headers={"Content-Type": "application/msgpack"})
+    assert response.status_code == 400